@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+Reading and writing Intel HEX, the format of the .hex files flashed onto
+devices such as the BBC micro:bit.
+
+A .hex file is parsed into a MemoryMap of the bytes it holds at each
+address, so any region can be read from it. Bytes are encoded as the
+records that put them at a given address.
+
+Copyright (c) 2015-2018 Nicholas H.Tollervey and others.
+
+See the LICENSE file for more information, or visit:
+
+https://opensource.org/licenses/MIT
+"""
+
+import binascii
+import bisect
+import re
+
+#: Record types.
+DATA = 0
+END_OF_FILE = 1
+EXTENDED_SEGMENT_ADDRESS = 2
+EXTENDED_LINEAR_ADDRESS = 4
+
+#: Bytes of data in each record written by encode.
+RECORD_SIZE = 16
+
+#: Matches the records that change the upper bits of the address, which
+#: divide a .hex file into sections of (at most) 64KiB.
+_EXTENDED_ADDRESS = re.compile(
+    r":0200000([24])([0-9A-Fa-f]{4})([0-9A-Fa-f]{2})"
+)
+
+
+class MemoryMap(object):
+    """
+    The bytes held at each address, kept as a sorted list of contiguous
+    (start address, bytes) segments.
+    """
+
+    def __init__(self):
+        self.segments = []
+
+    def write(self, address, data):
+        """
+        Put the data at the given address. It's assumed not to overlap any
+        bytes already in the map.
+        """
+        if not data:
+            return
+        if self.segments:
+            last, last_data = self.segments[-1]
+            if last + len(last_data) == address:
+                # The common case of data following on from the last write.
+                self.segments[-1] = (last, last_data + data)
+                return
+        index = bisect.bisect(self.segments, (address,))
+        self.segments.insert(index, (address, bytes(data)))
+
+    def read(self, address, length, fill=b"\xff"):
+        """
+        Return the length bytes from the given address, with any that
+        aren't in the map set to the fill byte (as in erased flash memory).
+        """
+        result = bytearray(fill * length)
+        end = address + length
+        index = max(bisect.bisect(self.segments, (address,)) - 1, 0)
+        for start, data in self.segments[index:]:
+            if start >= end:
+                break
+            lower = max(start, address)
+            upper = min(start + len(data), end)
+            if lower < upper:
+                result[lower - address : upper - address] = data[
+                    lower - start : upper - start
+                ]
+        return bytes(result)
+
+
+def parse(hex_text, start=0, end=None):
+    """
+    Parse the records in the hex_text into a MemoryMap.
+
+    If a region (from the start address, up to but not including the end
+    address) is given, the sections of the file that can't hold any of it
+    are skipped without being decoded.
+
+    Raises a ValueError if the checksum of a decoded record is wrong.
+    """
+    memory = MemoryMap()
+    # Split the file into sections at each extended address record.
+    sections = []
+    base = 0
+    position = 0
+    for match in _EXTENDED_ADDRESS.finditer(hex_text):
+        sections.append((base, position, match.start()))
+        _check(binascii.unhexlify(match.group(0)[1:]))
+        shift = 16 if match.group(1) == "4" else 4
+        base = int(match.group(2), 16) << shift
+        position = match.end()
+    sections.append((base, position, len(hex_text)))
+    for base, first, last in sections:
+        if base + 0x10000 <= start or (end is not None and base >= end):
+            continue
+        if _parse_section(memory, base, hex_text[first:last]):
+            break
+    return memory
+
+
+def _parse_section(memory, base, text):
+    """
+    Parse the records (which can only be data or end of file) in a section
+    of a .hex file into the memory map, with addresses relative to base.
+
+    The whole section is decoded from hex in one go, then each run of
+    contiguous data is written to the memory map in one piece.
+
+    Returns True if the end of file record was found.
+    """
+    blob = binascii.unhexlify("".join(text.split()).replace(":", ""))
+    position = 0
+    size = len(blob)
+    run_start = None
+    expected = None
+    run = []
+    finished = False
+    while position < size:
+        length = blob[position]
+        _check(blob[position : position + length + 5])
+        kind = blob[position + 3]
+        if kind == DATA:
+            address = base + (blob[position + 1] << 8 | blob[position + 2])
+            if address != expected:
+                memory.write(run_start, b"".join(run))
+                run_start = address
+                run = []
+            run.append(blob[position + 4 : position + 4 + length])
+            expected = address + length
+        elif kind == END_OF_FILE:
+            finished = True
+            break
+        position += length + 5
+    memory.write(run_start, b"".join(run))
+    return finished
+
+
+def _check(record_bytes):
+    """
+    Raise a ValueError if the bytes of a record (including its checksum)
+    don't sum to zero, as they should.
+    """
+    if sum(record_bytes) & 0xFF:
+        raise ValueError(
+            "Bad checksum in .hex record: {}".format(
+                binascii.hexlify(record_bytes).decode("ascii").upper()
+            )
+        )
+
+
+def encode(data, address):
+    """
+    Return the list of records that put the data at the given address,
+    starting with the extended linear address record for it.
+    """
+    records = []
+    hex_data = binascii.hexlify(data).decode("ascii").upper()
+    upper = None
+    for offset in range(0, len(data), RECORD_SIZE):
+        if (address + offset) >> 16 != upper:
+            upper = (address + offset) >> 16
+            records.append(
+                record(
+                    EXTENDED_LINEAR_ADDRESS,
+                    0,
+                    bytes(bytearray([upper >> 8, upper & 0xFF])),
+                )
+            )
+        chunk = data[offset : offset + RECORD_SIZE]
+        records.append(
+            record(
+                DATA,
+                (address + offset) & 0xFFFF,
+                chunk,
+                hex_data[offset * 2 : (offset + len(chunk)) * 2],
+            )
+        )
+    return records
+
+
+def record(kind, address, data, hex_data=None):
+    """
+    Return a single record of the given kind, holding the data at the
+    (16 bit) address. The data's hex can be given if it's already known.
+    """
+    if hex_data is None:
+        hex_data = binascii.hexlify(data).decode("ascii").upper()
+    checksum = -(
+        len(data) + (address >> 8) + (address & 0xFF) + kind + sum(data)
+    )
+    return ":{:02X}{:04X}{:02X}{}{:02X}".format(
+        len(data), address, kind, hex_data, checksum & 0xFF
+    )
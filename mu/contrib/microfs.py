@@ -13,6 +13,12 @@ You may:
 from __future__ import print_function
 import ast
 import argparse
+import binascii
+import hashlib
+import json
+import logging
+import struct
+import zlib
 import sys
 import os
 import time
@@ -23,8 +29,10 @@ from serial import Serial
 
 PY2 = sys.version_info < (3,)
 
+logger = logging.getLogger(__name__)
 
-__all__ = ["ls", "rm", "put", "get", "get_serial"]
+
+__all__ = ["ls", "ls_tree", "rm", "put", "get", "sync", "get_serial"]
 
 
 #: The help text to be shown when requested.
@@ -44,6 +52,22 @@ For example, 'ufs ls' will list the files on a connected BBC micro:bit.
 COMMAND_LINE_FLAG = False  # Indicates running from the command line.
 SERIAL_BAUD_RATE = 115200
 
+#: Number of bytes of file content sent to the device in each write call.
+PUT_CHUNK_SIZE = 256
+#: Upper bound (in bytes of source) for commands pipelined into a single
+#: raw-paste execution.
+RAW_PASTE_BATCH_SIZE = 2048
+#: Without raw-paste flow control, commands are written in slices of this
+#: many bytes with a short pause between them so the device can keep up.
+RAW_WRITE_CHUNK_SIZE = 32
+#: Number of bytes of a file read and sent back by the device in each block.
+GET_BLOCK_SIZE = 512
+#: Number of attempts to resume a download with a corrupted block.
+GET_RETRIES = 3
+
+#: Serial connections to devices kept in raw mode between calls to execute.
+RAW_SESSIONS = set()
+
 
 def find_microbit():
     """
@@ -108,6 +132,41 @@ def raw_off(serial):
     serial.write(b"\x02")  # Send CTRL-B to get out of raw mode.
 
 
+def start_session(serial):
+    """
+    Puts the device into raw mode and keeps it there between calls to
+    execute, so only the first operation pays the cost of the soft reboot.
+    """
+    raw_on(serial)
+    RAW_SESSIONS.add(serial)
+
+
+def end_session(serial):
+    """
+    Takes the device out of raw mode if it is being kept there by a session.
+    """
+    if serial in RAW_SESSIONS:
+        RAW_SESSIONS.discard(serial)
+        raw_off(serial)
+
+
+def session_alive(serial):
+    """
+    Cheaply checks the device is still responsive and in raw mode. In raw
+    mode CTRL-A just redisplays the raw REPL banner without a reboot.
+
+    Returns a boolean indication of the state of the session.
+    """
+    if serial not in RAW_SESSIONS:
+        return False
+    raw_repl_msg = b"raw REPL; CTRL-B to exit\r\n>"
+    try:
+        serial.write(b"\x01")
+        return serial.read_until(raw_repl_msg).endswith(raw_repl_msg)
+    except Exception:
+        return False
+
+
 def get_serial():
     """
     Detect if a micro:bit is connected and return a serial object to talk to
@@ -119,7 +178,84 @@ def get_serial():
     return Serial(port, SERIAL_BAUD_RATE, timeout=1, parity="N")
 
 
-def execute(commands, serial=None):
+def raw_paste_on(serial):
+    """
+    Ask a device in raw mode to switch to raw-paste mode.
+
+    Returns the size of the flow control window (in bytes) if the device
+    supports raw-paste mode, otherwise returns None and leaves the device in
+    normal raw mode.
+    """
+    serial.write(b"\x05A\x01")
+    data = serial.read(2)
+    if data == b"R\x01":
+        # Raw-paste supported, the window size increment follows.
+        return struct.unpack("<H", serial.read(2))[0]
+    if data != b"R\x00":
+        # Older firmware treats CTRL-A as a request to (re)enter raw mode.
+        raw_repl_msg = b"raw REPL; CTRL-B to exit\r\n>"
+        data = data + serial.read_until(raw_repl_msg)
+        if not data.endswith(raw_repl_msg):
+            raise IOError("Could not enter raw REPL.")
+    return None
+
+
+def raw_paste_write(serial, command_bytes, window_size):
+    """
+    Stream the command to a device in raw-paste mode, honouring the flow
+    control window advertised by the device, and evaluate it.
+    """
+    window_remain = window_size
+    i = 0
+    while i < len(command_bytes):
+        while window_remain == 0 or serial.inWaiting():
+            data = serial.read(1)
+            if data == b"\x01":
+                # The device has room for another window of data.
+                window_remain += window_size
+            elif data == b"\x04":
+                # The device ended the transfer early (e.g. out of memory).
+                serial.write(b"\x04")
+                return
+            else:
+                raise IOError(
+                    "Unexpected data during raw paste: {}".format(data)
+                )
+        chunk = command_bytes[i : i + window_remain]
+        serial.write(chunk)
+        window_remain -= len(chunk)
+        i += len(chunk)
+    # Signal end of data and wait for the device to acknowledge it.
+    serial.write(b"\x04")
+    data = serial.read_until(b"\x04")
+    if not data.endswith(b"\x04"):
+        raise IOError("Could not complete raw paste: {}".format(data))
+
+
+def batch_commands(commands, batch_size=RAW_PASTE_BATCH_SIZE):
+    """
+    Join consecutive commands into blocks of up to batch_size bytes of source
+    so they can be evaluated by the device in a single round trip.
+
+    Returns a list of (block, count) tuples, where count is the number of
+    original commands contained in the block.
+    """
+    batches = []
+    block = []
+    size = 0
+    for command in commands:
+        if block and size + len(command) + 1 > batch_size:
+            batches.append(("\n".join(block), len(block)))
+            block = []
+            size = 0
+        block.append(command)
+        size += len(command) + 1
+    if block:
+        batches.append(("\n".join(block), len(block)))
+    return batches
+
+
+def execute(commands, serial=None, callback=None):
     """
     Sends the command to the connected micro:bit via serial and returns the
     result. If no serial connection is provided, attempts to autodetect the
@@ -128,6 +264,16 @@ def execute(commands, serial=None):
     For this to work correctly, a particular sequence of commands needs to be
     sent to put the device into a good state to process the incoming command.
 
+    If the device supports raw-paste mode the commands are pipelined into
+    larger blocks and streamed using the device's flow control. Otherwise
+    each command is written in small, paced slices.
+
+    If a callback is given, it is called with the number of commands
+    completed so far and the total number of commands after each evaluation.
+
+    If the serial connection belongs to a session (see start_session) the
+    device is assumed to already be in raw mode and is left there afterwards.
+
     Returns the stdout and stderr output from the micro:bit.
     """
     close_serial = False
@@ -135,21 +281,43 @@ def execute(commands, serial=None):
         serial = get_serial()
         close_serial = True
         time.sleep(0.1)
+    in_session = serial in RAW_SESSIONS
     result = b""
-    raw_on(serial)
-    time.sleep(0.1)
-    # Write the actual command and send CTRL-D to evaluate.
-    for command in commands:
+    err = b""
+    if not in_session:
+        raw_on(serial)
+        time.sleep(0.1)
+    window_size = raw_paste_on(serial)
+    if window_size:
+        batches = batch_commands(commands)
+    else:
+        batches = [(command, 1) for command in commands]
+    done = 0
+    for command, count in batches:
         command_bytes = command.encode("utf-8")
-        for i in range(0, len(command_bytes), 32):
-            serial.write(command_bytes[i : min(i + 32, len(command_bytes))])
-            time.sleep(0.01)
-        serial.write(b"\x04")
-        response = serial.read_until(b"\x04>")  # Read until prompt.
-        out, err = response[2:-2].split(b"\x04", 1)  # Split stdout, stderr
+        if window_size:
+            raw_paste_write(serial, command_bytes, window_size)
+            response = serial.read_until(b"\x04>")  # Read until prompt.
+            out, err = response[:-2].split(b"\x04", 1)  # Split stdout, stderr
+        else:
+            # Write the actual command and send CTRL-D to evaluate.
+            for i in range(0, len(command_bytes), RAW_WRITE_CHUNK_SIZE):
+                serial.write(command_bytes[i : i + RAW_WRITE_CHUNK_SIZE])
+                time.sleep(0.01)
+            serial.write(b"\x04")
+            response = serial.read_until(b"\x04>")  # Read until prompt.
+            out, err = response[2:-2].split(b"\x04", 1)  # Split stdout, stderr
         result += out
         if err:
             return b"", err
+        done += count
+        if callback:
+            callback(done, len(commands))
+        if window_size and done < len(commands):
+            # Each evaluation returns the device to normal raw mode.
+            window_size = raw_paste_on(serial)
+    if in_session:
+        return result, err
     time.sleep(0.1)
     raw_off(serial)
     if close_serial:
@@ -158,6 +326,17 @@ def execute(commands, serial=None):
     return result, err
 
 
+def transfer_rate(nbytes, started):
+    """
+    Return the rate, in bytes per second, for nbytes transferred since the
+    referenced start time (as returned by time.time()).
+    """
+    elapsed = time.time() - started
+    if elapsed <= 0:
+        return 0.0
+    return nbytes / elapsed
+
+
 def clean_error(err):
     """
     Take stderr bytes returned from MicroPython and attempt to create a
@@ -188,6 +367,50 @@ def ls(serial=None):
     return ast.literal_eval(out.decode("utf-8"))
 
 
+def ls_tree(serial=None):
+    """
+    Recursively list the files and directories on the device in a single
+    execution.
+
+    If no serial object is supplied, microfs will attempt to detect the
+    connection itself.
+
+    Returns a list of (path, size, is_dir) tuples, where each path is
+    relative to the root of the device's file system and uses "/" as the
+    separator. Raises an IOError if there's a problem.
+    """
+    commands = [
+        "import os",
+        "\n".join(
+            [
+                "def s(p):",
+                " try:",
+                "  t = os.stat(p)",
+                "  return t[6], t[0] & 0x4000 != 0",
+                " except AttributeError:",
+                "  return os.size(p), False",
+            ]
+        ),
+        "\n".join(
+            [
+                "def w(d, r):",
+                " for n in os.listdir(d) if d else os.listdir():",
+                "  p = d + '/' + n if d else n",
+                "  z, i = s(p)",
+                "  r.append((p, z, i))",
+                "  if i:",
+                "   w(p, r)",
+                " return r",
+            ]
+        ),
+        "print(w('', []))",
+    ]
+    out, err = execute(commands, serial)
+    if err:
+        raise IOError(clean_error(err))
+    return ast.literal_eval(out.decode("utf-8"))
+
+
 def rm(filename, serial=None):
     """
     Removes a referenced file on the micro:bit.
@@ -204,7 +427,7 @@ def rm(filename, serial=None):
     return True
 
 
-def put(filename, target=None, serial=None):
+def put(filename, target=None, serial=None, callback=None):
     """
     Puts a referenced file on the LOCAL file system onto the
     file system on the BBC micro:bit.
@@ -212,6 +435,10 @@ def put(filename, target=None, serial=None):
     If no serial object is supplied, microfs will attempt to detect the
     connection itself.
 
+    If a callback is given, it is called with the number of bytes sent, the
+    size of the file and the transfer rate in bytes per second as the copy
+    progresses.
+
     Returns True for success or raises an IOError if there's a problem.
     """
     if not os.path.isfile(filename):
@@ -221,22 +448,120 @@ def put(filename, target=None, serial=None):
     filename = os.path.basename(filename)
     if target is None:
         target = filename
+    return put_content(content, target, serial, callback)
+
+
+def put_content(content, target, serial=None, callback=None):
+    """
+    Puts the given bytes into the target file on the file system on the BBC
+    micro:bit (see put).
+
+    Returns True for success or raises an IOError if there's a problem.
+    """
     commands = ["fd = open('{}', 'wb')".format(target), "f = fd.write"]
-    while content:
-        line = content[:64]
+    for i in range(0, len(content), PUT_CHUNK_SIZE):
+        line = content[i : i + PUT_CHUNK_SIZE]
         if PY2:
             commands.append("f(b" + repr(line) + ")")
         else:
             commands.append("f(" + repr(line) + ")")
-        content = content[64:]
     commands.append("fd.close()")
-    out, err = execute(commands, serial)
+    size = len(content)
+    started = time.time()
+
+    def on_progress(done, total):
+        # The first two commands open the file, so don't count as content.
+        sent = min(max(done - 2, 0) * PUT_CHUNK_SIZE, size)
+        callback(sent, size, transfer_rate(sent, started))
+
+    out, err = execute(commands, serial, on_progress if callback else None)
     if err:
         raise IOError(clean_error(err))
     return True
 
 
-def get(filename, target=None, serial=None):
+def download_commands(filename, offset=0):
+    """
+    Return the commands to run on the device to send the referenced file,
+    starting at the given offset, as a stream of framed text lines.
+
+    The first line is a "SIZE <bytes> <encoding>" header. Each following line
+    describes a block as "<length> <checksum> <payload>" where the payload is
+    base64 encoded (or hex, if the device has no binascii module) and the
+    checksum is the sum of the block's bytes modulo 65536. A final "END" line
+    marks the end of the file.
+    """
+    return [
+        "\n".join(
+            [
+                "try:",
+                " from ubinascii import b2a_base64",
+                "except ImportError:",
+                " try:",
+                "  from binascii import b2a_base64",
+                " except ImportError:",
+                "  b2a_base64 = None",
+                "def e(b):",
+                " if b2a_base64:",
+                "  return str(b2a_base64(b), 'ascii').strip()",
+                " return ''.join('%02x' % i for i in b)",
+            ]
+        ),
+        "import os",
+        "try:\n s = os.stat('{0}')[6]\nexcept AttributeError:\n"
+        " s = os.size('{0}')".format(filename),
+        "f = open('{}', 'rb')".format(filename),
+        "r = f.read",
+        # Not all devices can seek, so skip to the offset by reading.
+        "o = {}\nwhile o > 0:\n b = r(min(o, {}))\n if not b:\n  break\n"
+        " o -= len(b)".format(offset, GET_BLOCK_SIZE),
+        "print('SIZE', s, 'b64' if b2a_base64 else 'hex')",
+        "b = r({0})\nwhile b:\n print(len(b), sum(b) & 65535, e(b))\n"
+        " b = r({0})".format(GET_BLOCK_SIZE),
+        "print('END')",
+        "f.close()",
+    ]
+
+
+def decode_download(out):
+    """
+    Decode the framed output of the commands from download_commands.
+
+    Returns a tuple containing the size of the file reported by the device, a
+    list of the blocks of bytes that were received intact (stopping at the
+    first corrupt or missing block) and a flag to indicate if the end of the
+    file was reached with no missing blocks.
+    """
+    size = None
+    encoding = None
+    blocks = []
+    for line in out.splitlines():
+        fields = line.split()
+        if not fields:
+            continue
+        if fields[0] == b"SIZE":
+            size = int(fields[1])
+            encoding = fields[2]
+        elif fields[0] == b"END":
+            return size, blocks, size is not None
+        else:
+            try:
+                length, checksum = int(fields[0]), int(fields[1])
+                if encoding == b"b64":
+                    block = binascii.a2b_base64(fields[2])
+                else:
+                    block = binascii.unhexlify(fields[2])
+            except (ValueError, IndexError, binascii.Error):
+                break
+            if len(block) != length or sum(bytearray(block)) & 0xFFFF != (
+                checksum
+            ):
+                break
+            blocks.append(block)
+    return size, blocks, False
+
+
+def get(filename, target=None, serial=None, callback=None, resume=False):
     """
     Gets a referenced file on the device's file system and copies it to the
     target (or current working directory if unspecified).
@@ -244,39 +569,189 @@ def get(filename, target=None, serial=None):
     If no serial object is supplied, microfs will attempt to detect the
     connection itself.
 
+    The file is sent by the device in checksummed, encoded blocks so it is
+    safe for binary content. Should any block be corrupted, the download
+    is resumed from the last good block. If resume is True and the target
+    already exists, only the remainder of the file is fetched and appended
+    (unless the target is bigger than the file on the device, in which case
+    it is truncated and the whole file is fetched again).
+
+    If a callback is given, it is called with the number of bytes received,
+    the size of the file and the transfer rate in bytes per second as the
+    copy progresses.
+
     Returns True for success or raises an IOError if there's a problem.
     """
     if target is None:
         target = filename
+    offset = 0
+    mode = "wb"
+    if resume and os.path.isfile(target):
+        offset = os.path.getsize(target)
+        mode = "ab"
+    started = time.time()
+    received = 0
+    with open(target, mode) as local:
+        for attempt in range(GET_RETRIES):
+            commands = download_commands(filename, offset)
+            out, err = execute(commands, serial)
+            if err:
+                raise IOError(clean_error(err))
+            size, blocks, complete = decode_download(out)
+            if size is not None and offset > size:
+                # Not a partial copy of the file on the device: start again.
+                local.seek(0)
+                local.truncate()
+                offset = 0
+                continue
+            for block in blocks:
+                local.write(block)
+                offset += len(block)
+                received += len(block)
+            if callback and size is not None:
+                callback(offset, size, transfer_rate(received, started))
+            if complete and offset >= size:
+                return True
+    raise IOError("Could not get '{}' from the device.".format(filename))
+
+
+def hashes(filenames, serial=None):
+    """
+    Work out the content hashes of the referenced files on the device in a
+    single execution.
+
+    The device uses SHA-256 if it has a hashlib (or uhashlib) module,
+    otherwise it falls back to an Adler-32 checksum.
+
+    Returns a dictionary mapping each filename to an (algorithm, size,
+    digest) tuple, or to None if the file doesn't exist on the device.
+    """
     commands = [
         "\n".join(
             [
                 "try:",
-                " from microbit import uart as u",
+                " from uhashlib import sha256",
                 "except ImportError:",
                 " try:",
-                "  from machine import UART",
-                "  u = UART(0, {})".format(SERIAL_BAUD_RATE),
-                " except Exception:",
-                "  try:",
-                "   from sys import stdout as u",
-                "  except Exception:",
-                "   raise Exception('Could not find UART module in device.')",
+                "  from hashlib import sha256",
+                " except ImportError:",
+                "  sha256 = None",
             ]
         ),
-        "f = open('{}', 'rb')".format(filename),
-        "r = f.read",
-        "result = True",
-        "while result:\n result = r(32)\n if result:\n  u.write(result)\n",
-        "f.close()",
+        "\n".join(
+            [
+                "def h(n):",
+                " try:",
+                "  f = open(n, 'rb')",
+                " except OSError:",
+                "  return None",
+                " z, a, b = 0, 1, 0",
+                " d = sha256() if sha256 else None",
+                " c = f.read(256)",
+                " while c:",
+                "  z += len(c)",
+                "  if d:",
+                "   d.update(c)",
+                "  else:",
+                "   for i in c:",
+                "    a = (a + i) % 65521",
+                "    b = (b + a) % 65521",
+                "  c = f.read(256)",
+                " f.close()",
+                " if d:",
+                "  return ('sha256', z, ''.join('%02x' % i for i in d.digest()))",
+                " return ('adler32', z, '%04x%04x' % (b, a))",
+            ]
+        ),
+        "print({{n: h(n) for n in {}}})".format(repr(list(filenames))),
     ]
     out, err = execute(commands, serial)
     if err:
         raise IOError(clean_error(err))
-    # Recombine the bytes while removing "b'" from start and "'" from end.
-    with open(target, "wb") as f:
-        f.write(out)
-    return True
+    return ast.literal_eval(out.decode("utf-8"))
+
+
+def local_hash(path, algorithm):
+    """
+    Return the digest of the referenced local file using the named algorithm
+    (as reported by the device, see hashes).
+    """
+    with open(path, "rb") as local:
+        content = local.read()
+    return content_hash(content, algorithm)
+
+
+def content_hash(content, algorithm):
+    """
+    Return the digest of the given bytes using the named algorithm (as
+    reported by the device, see hashes).
+    """
+    if algorithm == "sha256":
+        return hashlib.sha256(content).hexdigest()
+    return "{:08x}".format(zlib.adler32(content) & 0xFFFFFFFF)
+
+
+def sync(directory, serial=None, dry_run=False, manifest=None):
+    """
+    Copy the files in the referenced local directory onto the device, but
+    only if they are missing from the device or their content differs.
+
+    The device hashes its copies of the files in one batch. The matching
+    local hashes are cached in the JSON file at the (optional) manifest path,
+    keyed on each file's path, size and modification time, so unchanged
+    local files are not re-read on subsequent syncs. If the manifest can't
+    be read, it is started afresh (so every local file is hashed).
+
+    If dry_run is True, nothing is copied.
+
+    Returns a list of (filename, status) tuples where status is one of
+    "new", "changed" or "unchanged".
+    """
+    filenames = sorted(
+        f
+        for f in os.listdir(directory)
+        if os.path.isfile(os.path.join(directory, f))
+    )
+    cache = {}
+    if manifest and os.path.isfile(manifest):
+        try:
+            with open(manifest) as f:
+                cache = json.load(f)
+            if not isinstance(cache, dict):
+                raise ValueError("Not a JSON object.")
+        except (ValueError, OSError) as ex:
+            logger.error(
+                "Ignoring unreadable sync manifest {}: {}".format(manifest, ex)
+            )
+            cache = {}
+    remote = hashes(filenames, serial)
+    report = []
+    for filename in filenames:
+        path = os.path.abspath(os.path.join(directory, filename))
+        stat = os.stat(path)
+        status = "new"
+        if remote.get(filename):
+            status = "changed"
+            algorithm, size, digest = remote[filename]
+            if size == stat.st_size:
+                key = [stat.st_size, stat.st_mtime, algorithm]
+                cached = cache.get(path)
+                if cached and cached[:3] == key:
+                    local_digest = cached[3]
+                else:
+                    local_digest = local_hash(path, algorithm)
+                    cache[path] = key + [local_digest]
+                if local_digest == digest:
+                    status = "unchanged"
+        report.append((filename, status))
+    if manifest:
+        with open(manifest, "w") as f:
+            json.dump(cache, f)
+    if not dry_run:
+        for filename, status in report:
+            if status != "unchanged":
+                put(os.path.join(directory, filename), filename, serial)
+    return report
 
 
 def version(serial=None):
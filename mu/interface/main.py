@@ -315,6 +315,9 @@ class Window(QMainWindow):
     data_received = pyqtSignal(bytes)
     open_file = pyqtSignal(str)
     load_theme = pyqtSignal(str)
+    # Emitted when the text of the current tab changes (or another tab
+    # becomes the current one).
+    text_changed = pyqtSignal()
     previous_folder = None
 
     def __init__(self, parent=None):
@@ -449,6 +452,8 @@ class Window(QMainWindow):
             self.tabs.setTabText(modified_tab_index, new_tab.label)
             self.update_title(new_tab.title)
 
+        new_tab.textChanged.connect(self.text_changed)
+
         @new_tab.open_file.connect
         def on_open_file(file):
             # Bubble the signal up
@@ -527,6 +532,7 @@ class Window(QMainWindow):
         self.fs_pane.local_fs.get.connect(file_manager.get)
         self.fs_pane.local_fs.put.connect(file_manager.put)
         self.fs_pane.local_fs.list_files.connect(file_manager.ls)
+        self.fs_pane.local_fs.sync.connect(file_manager.sync)
         file_manager.on_put_file.connect(self.fs_pane.microbit_fs.on_put)
         file_manager.on_delete_file.connect(self.fs_pane.microbit_fs.on_delete)
         file_manager.on_get_file.connect(self.fs_pane.local_fs.on_get)
@@ -534,6 +540,11 @@ class Window(QMainWindow):
         file_manager.on_put_fail.connect(self.fs_pane.on_put_fail)
         file_manager.on_delete_fail.connect(self.fs_pane.on_delete_fail)
         file_manager.on_get_fail.connect(self.fs_pane.on_get_fail)
+        file_manager.on_sync.connect(self.fs_pane.on_sync)
+        file_manager.on_sync_fail.connect(self.fs_pane.on_sync_fail)
+        file_manager.on_transfer_progress.connect(
+            self.fs_pane.on_transfer_progress
+        )
         self.connect_zoom(self.fs_pane)
         return self.fs_pane
 
@@ -1002,6 +1013,7 @@ class Window(QMainWindow):
         self.widget.setLayout(widget_layout)
         self.button_bar = ButtonBar(self.widget)
         self.tabs = FileTabs()
+        self.tabs.currentChanged.connect(self.text_changed)
         self.setCentralWidget(self.tabs)
         self.status_bar = StatusBar(parent=self)
         self.setStatusBar(self.status_bar)
@@ -1176,6 +1188,20 @@ class Window(QMainWindow):
         """
         self.status_bar.device_selector.setHidden(True)
 
+    def show_script_size(self, message):
+        """
+        Shows the message about the size of the current script in the
+        status bar
+        """
+        self.status_bar.size_label.setText(message)
+        self.status_bar.size_label.setHidden(False)
+
+    def hide_script_size(self):
+        """
+        Hides the size of the current script in the status bar
+        """
+        self.status_bar.size_label.setHidden(True)
+
 
 class StatusBar(QStatusBar):
     """
@@ -1194,6 +1220,11 @@ class StatusBar(QStatusBar):
         self.addPermanentWidget(self.mode_label)
         self.set_mode(mode)
 
+        # Size of the current script, for modes that limit it.
+        self.size_label = QLabel()
+        self.size_label.setHidden(True)
+        self.addPermanentWidget(self.size_label)
+
         # Device selector.
         self.device_selector = DeviceSelector()
         self.device_selector.setHidden(True)
@@ -23,9 +23,20 @@ import platform
 import logging
 import signal
 import string
+import time
 import bisect
 import os.path
+import posixpath
 import codecs
+import csv
+import json
+import math
+import mmap
+import struct
+import queue
+import threading
+from array import array
+from logging.handlers import RotatingFileHandler
 
 from PyQt5.QtCore import (
     Qt,
@@ -34,10 +45,11 @@ from PyQt5.QtCore import (
     pyqtSignal,
     QTimer,
     QUrl,
+    QPointF,
 )
-from collections import deque
 from PyQt5.QtWidgets import (
     QMessageBox,
+    QFileDialog,
     QTextEdit,
     QFrame,
     QListWidget,
@@ -46,6 +58,8 @@ from PyQt5.QtWidgets import (
     QMenu,
     QApplication,
     QTreeView,
+    QTreeWidget,
+    QTreeWidgetItem,
 )
 from PyQt5.QtGui import (
     QKeySequence,
@@ -54,9 +68,11 @@ from PyQt5.QtGui import (
     QPainter,
     QDesktopServices,
     QStandardItem,
+    QPolygonF,
 )
 from qtconsole.rich_jupyter_widget import RichJupyterWidget
 from ..i18n import language_code
+from .. import config, settings
 from mu.interface.themes import Font
 from mu.interface.themes import DEFAULT_FONT_SIZE
 
@@ -72,6 +88,12 @@ except ImportError:  # pragma: no cover
     QChartView = object
     CHARTS = False
 
+# We can plot without numpy, it just makes updating the chart quicker.
+try:  # pragma: no cover
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
 
 PANE_ZOOM_SIZES = {
     "xs": 8,
@@ -84,6 +106,75 @@ PANE_ZOOM_SIZES = {
 }
 
 
+class Scrollback:
+    """
+    Keeps the document of a text pane to a bounded number of lines (and,
+    optionally, characters) by trimming whole lines from the top.
+
+    The limits are taken from the "scrollback_lines" and "scrollback_chars"
+    settings (0 means no limit). If the "scrollback_log" setting is True, the
+    trimmed text is written to a rotating log file named after the pane.
+    """
+
+    def __init__(self, document, name):
+        self.document = document
+        self.max_lines = settings.settings.get("scrollback_lines", 10000)
+        self.max_chars = settings.settings.get("scrollback_chars", 0)
+        self.log = None
+        if settings.settings.get("scrollback_log", False):
+            log_dir = os.path.join(config.DATA_DIR, "scrollback")
+            if not os.path.exists(log_dir):
+                os.makedirs(log_dir)
+            self.log = logging.getLogger("mu.scrollback.{}".format(name))
+            self.log.propagate = False
+            self.log.setLevel(logging.INFO)
+            if not self.log.handlers:
+                handler = RotatingFileHandler(
+                    os.path.join(log_dir, "{}.log".format(name)),
+                    maxBytes=settings.settings.get(
+                        "scrollback_log_size", 1024 * 1024
+                    ),
+                    backupCount=5,
+                    encoding="utf-8",
+                    delay=True,
+                )
+                handler.terminator = ""
+                self.log.addHandler(handler)
+
+    def trim(self):
+        """
+        Remove lines from the top of the document if it has grown beyond the
+        limits. A tenth more than needed is removed, so trimming only happens
+        once in a while. The last line is never removed.
+
+        Returns the number of characters removed, so positions into the
+        document can be adjusted.
+        """
+        document = self.document
+        end = 0
+        if self.max_lines and document.blockCount() > self.max_lines:
+            count = document.blockCount() - self.max_lines
+            count = min(
+                count + self.max_lines // 10, document.blockCount() - 1
+            )
+            end = document.findBlockByNumber(count).position()
+        if self.max_chars and document.characterCount() > self.max_chars:
+            target = document.characterCount() - self.max_chars
+            block = document.findBlock(target + self.max_chars // 10)
+            if block.next().isValid():
+                block = block.next()
+            end = max(end, block.position())
+        if end <= 0:
+            return 0
+        cursor = QTextCursor(document)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        if self.log:
+            # Qt represents line breaks in selected text as U+2029.
+            self.log.info(cursor.selectedText().replace("\u2029", "\n"))
+        cursor.removeSelectedText()
+        return end
+
+
 class JupyterREPLPane(RichJupyterWidget):
     """
     REPL = Read, Evaluate, Print, Loop.
@@ -159,6 +250,8 @@ class MicroPythonREPLPane(QTextEdit):
     The device MUST be flashed with MicroPython for this to work.
     """
 
+    frame_interval = 16  #: Milliseconds between renders of incoming data.
+
     def __init__(self, connection, theme="day", parent=None):
         super().__init__(parent)
         self.connection = connection
@@ -179,6 +272,19 @@ class MicroPythonREPLPane(QTextEdit):
         self.vt100_regex = re.compile(
             r"\x1B\[(?P<count>[\d]*)(;?[\d]*)*(?P<action>[A-Za-z])"
         )
+        # Runs of characters that can be applied to the document in a single
+        # edit, up to the next backspace or escape (see render_tty_data).
+        self.run_regex = re.compile(r"[^\x08\x1B]+")
+        self.line_run_regex = re.compile(r"[^\x08\x1B\r\n]+")
+        # Data received from the device but not yet shown. It is rendered at
+        # most once per frame_interval milliseconds so a device printing at
+        # full speed doesn't swamp the UI with edits and repaints.
+        self.pending_tty_data = ""
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.setInterval(self.frame_interval)
+        self.render_timer.timeout.connect(self.on_render_timer)
+        self.scrollback = Scrollback(self.document(), "repl")
 
     def paste(self):
         """
@@ -351,16 +457,41 @@ class MicroPythonREPLPane(QTextEdit):
 
     def process_tty_data(self, data):
         """
-        Given some incoming bytes of data, work out how to handle / display
-        them in the REPL widget.
+        Given some incoming bytes of data, queue them to be displayed in the
+        REPL widget.
+
+        Data is rendered straight away unless some was rendered within the
+        last frame_interval, in which case it is rendered (along with
+        anything else received meanwhile) when the render timer fires.
+        """
+        self.pending_tty_data += self.decoder.decode(data)
+        if not self.render_timer.isActive():
+            self.render_tty_data()
+            self.render_timer.start()
+
+    def on_render_timer(self):
+        """
+        Render any data received since the last frame.
+        """
+        if self.pending_tty_data:
+            self.render_tty_data()
+            self.render_timer.start()
+
+    def render_tty_data(self):
+        """
+        Work out how to handle / display the pending data in the REPL widget.
         If received input is incomplete, stores remainder in
         self.unprocessed_input.
 
+        Runs of plain text are applied to the document as a single edit, as
+        are VT100 control sequences.
+
         Updates the self.device_cursor_position to match that of the device
         for every input received.
         """
         i = 0
-        data = self.decoder.decode(data)
+        data = self.pending_tty_data
+        self.pending_tty_data = ""
         if len(self.unprocessed_input) > 0:
             # Prepend bytes from last time, that wasn't processed
             data = self.unprocessed_input + data
@@ -374,7 +505,17 @@ class MicroPythonREPLPane(QTextEdit):
         tc = self.textCursor()
 
         while i < len(data):
-            if data[i] == "\b":
+            if data[i] == "\n" or (data[i] not in "\b\x1b" and tc.atEnd()):
+                # Newlines move the cursor to the end of the document, so
+                # the run up to the next backspace or escape is appended.
+                # Carriage returns are ignored, we handle newlines instead.
+                match = self.run_regex.match(data, i)
+                tc.movePosition(QTextCursor.End)
+                tc.insertText(match.group().replace("\r", ""))
+                self.device_cursor_position = tc.position()
+                i = match.end()
+                continue
+            elif data[i] == "\b":
                 tc.movePosition(QTextCursor.Left)
                 self.device_cursor_position = tc.position()
             elif data[i] == "\r":
@@ -385,11 +526,11 @@ class MicroPythonREPLPane(QTextEdit):
                 # Escape
                 if len(data) > i + 1 and data[i + 1] == "[":
                     # VT100 cursor detected: <Esc>[
-                    match = self.vt100_regex.search(data[i:])
+                    match = self.vt100_regex.match(data, i)
                     if match:
                         # move to (almost) after control seq
                         # (will ++ at end of loop)
-                        i += match.end() - 1
+                        i = match.end() - 1
                         count_string = match.group("count")
                         count = 1 if count_string == "" else int(count_string)
                         action = match.group("action")
@@ -429,19 +570,28 @@ class MicroPythonREPLPane(QTextEdit):
                     # bytes are received to determine what to do
                     self.unprocessed_input = data[i:]
                     break
-            elif data[i] == "\n":
-                tc.movePosition(QTextCursor.End)
-                self.device_cursor_position = tc.position() + 1
-                self.setTextCursor(tc)
-                self.insertPlainText(data[i])
             else:
-                # Char received, with VT100 that should be interpreted
-                # as overwrite the char in front of the cursor
-                tc.deleteChar()
-                self.device_cursor_position = tc.position() + 1
-                self.insertPlainText(data[i])
-            self.setTextCursor(tc)
+                # A run of chars received, with VT100 that should be
+                # interpreted as overwriting the chars in front of the cursor
+                # (up to the end of the line)
+                match = self.line_run_regex.match(data, i)
+                text = match.group()
+                block_end = tc.block().position() + tc.block().length() - 1
+                overwrite = min(len(text), block_end - tc.position())
+                tc.setPosition(
+                    tc.position() + overwrite, QTextCursor.KeepAnchor
+                )
+                tc.insertText(text)
+                self.device_cursor_position = tc.position()
+                i = match.end()
+                continue
             i += 1
+        removed = self.scrollback.trim()
+        if removed:
+            self.device_cursor_position = max(
+                0, self.device_cursor_position - removed
+            )
+        self.setTextCursor(tc)
         # Scroll textarea if necessary to see cursor
         self.ensureCursorVisible()
 
@@ -466,15 +616,12 @@ class MicroPythonREPLPane(QTextEdit):
         self.set_font_size(PANE_ZOOM_SIZES[size])
 
 
-class MuFileList(QListWidget):
+class FileListMixin:
     """
-    Contains shared methods for the two types of file listing used in Mu.
+    Contains shared methods for the file listings used in Mu (a list of the
+    local files, and a tree of those on the device).
     """
 
-    disable = pyqtSignal()
-    list_files = pyqtSignal()
-    set_message = pyqtSignal(str)
-
     def show_confirm_overwrite_dialog(self):
         """
         Display a dialog to check if an existing file should be overwritten.
@@ -489,38 +636,105 @@ class MuFileList(QListWidget):
         return msg.exec_() == QMessageBox.Ok
 
 
-class MicroPythonDeviceFileList(MuFileList):
+class MuFileList(FileListMixin, QListWidget):
+    """
+    A list of files, with the signals used to report on managing them.
+    """
+
+    disable = pyqtSignal()
+    list_files = pyqtSignal()
+    set_message = pyqtSignal(str)
+
+
+class MicroPythonDeviceFileList(FileListMixin, QTreeWidget):
     """
-    Represents a list of files on a MicroPython device.
+    Represents a tree of the files and directories on a MicroPython device.
+
+    The whole tree is listed by the device in one go, but child items are
+    only created when the directory containing them is expanded.
     """
 
-    put = pyqtSignal(str)
+    disable = pyqtSignal()
+    list_files = pyqtSignal()
+    set_message = pyqtSignal(str)
+    put = pyqtSignal(str, str)
     delete = pyqtSignal(str)
 
     def __init__(self, home):
         super().__init__()
         self.home = home
-        self.setDragDropMode(QListWidget.DragDrop)
+        self.entries = {}  # Device path -> (size, is_dir).
+        self.children = {}  # Device directory -> list of child paths.
+        self.setColumnCount(2)
+        self.setHeaderLabels([_("Name"), _("Size")])
+        self.setDragDropMode(QTreeWidget.DragDrop)
+        self.itemExpanded.connect(self.on_expand)
+
+    def set_files(self, entries):
+        """
+        Replace the tree with the given (path, size, is_dir) entries listed
+        from the device.
+        """
+        self.clear()
+        self.entries = {}
+        self.children = {}
+        for path, size, is_dir in entries:
+            self.entries[path] = (size, is_dir)
+            parent = posixpath.dirname(path)
+            self.children.setdefault(parent, []).append(path)
+        self.add_children(self.invisibleRootItem(), "")
+
+    def add_children(self, parent_item, directory):
+        """
+        Add items for the immediate contents of the referenced directory on
+        the device to the parent item. Directories come first.
+        """
+        paths = self.children.get(directory, [])
+        for path in sorted(paths, key=lambda p: (not self.entries[p][1], p)):
+            size, is_dir = self.entries[path]
+            item = QTreeWidgetItem(
+                parent_item,
+                [posixpath.basename(path), "" if is_dir else str(size)],
+            )
+            item.setData(0, Qt.UserRole, path)
+            if is_dir:
+                item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+
+    def on_expand(self, item):
+        """
+        Fired when a directory item is expanded, to lazily populate it.
+        """
+        if item.childCount() == 0:
+            self.add_children(item, item.data(0, Qt.UserRole))
+
+    def target_directory(self, item):
+        """
+        Return the directory on the device into which a file dropped onto
+        the referenced item should be copied.
+        """
+        if item is None:
+            return ""
+        path = item.data(0, Qt.UserRole)
+        if self.entries.get(path, (0, False))[1]:
+            return path
+        return posixpath.dirname(path)
 
     def dropEvent(self, event):
         source = event.source()
         if isinstance(source, LocalFileList):
-            file_exists = self.findItems(
-                source.currentItem().text(), Qt.MatchExactly
-            )
+            filename = source.currentItem().text()
+            directory = self.target_directory(self.itemAt(event.pos()))
+            target = posixpath.join(directory, filename)
             if (
-                not file_exists
-                or file_exists
-                and self.show_confirm_overwrite_dialog()
+                target not in self.entries
+                or self.show_confirm_overwrite_dialog()
             ):
                 self.disable.emit()
-                local_filename = os.path.join(
-                    self.home, source.currentItem().text()
-                )
+                local_filename = os.path.join(self.home, filename)
                 msg = _("Copying '{}' to micro:bit.").format(local_filename)
                 logger.info(msg)
                 self.set_message.emit(msg)
-                self.put.emit(local_filename)
+                self.put.emit(local_filename, target)
 
     def on_put(self, microbit_file):
         """
@@ -531,12 +745,18 @@ class MicroPythonDeviceFileList(MuFileList):
         self.list_files.emit()
 
     def contextMenuEvent(self, event):
+        item = self.currentItem()
+        if item is None:
+            return
+        microbit_filename = item.data(0, Qt.UserRole)
+        if self.entries.get(microbit_filename, (0, False))[1]:
+            # Directories cannot be deleted.
+            return
         menu = QMenu(self)
         delete_action = menu.addAction(_("Delete (cannot be undone)"))
         action = menu.exec_(self.mapToGlobal(event.pos()))
         if action == delete_action:
             self.disable.emit()
-            microbit_filename = self.currentItem().text()
             logger.info("Deleting {}".format(microbit_filename))
             msg = _("Deleting '{}' from micro:bit.").format(microbit_filename)
             logger.info(msg)
@@ -562,6 +782,7 @@ class LocalFileList(MuFileList):
     get = pyqtSignal(str, str)
     put = pyqtSignal(str, str)
     open_file = pyqtSignal(str)
+    sync = pyqtSignal(str, bool)
 
     def __init__(self, home):
         super().__init__()
@@ -571,17 +792,19 @@ class LocalFileList(MuFileList):
     def dropEvent(self, event):
         source = event.source()
         if isinstance(source, MicroPythonDeviceFileList):
-            file_exists = self.findItems(
-                source.currentItem().text(), Qt.MatchExactly
-            )
+            microbit_filename = source.currentItem().data(0, Qt.UserRole)
+            if source.entries.get(microbit_filename, (0, False))[1]:
+                # Only files can be copied from the device.
+                return
+            filename = posixpath.basename(microbit_filename)
+            file_exists = self.findItems(filename, Qt.MatchExactly)
             if (
                 not file_exists
                 or file_exists
                 and self.show_confirm_overwrite_dialog()
             ):
                 self.disable.emit()
-                microbit_filename = source.currentItem().text()
-                local_filename = os.path.join(self.home, microbit_filename)
+                local_filename = os.path.join(self.home, filename)
                 msg = _(
                     "Getting '{}' from micro:bit. " "Copying to '{}'."
                 ).format(microbit_filename, local_filename)
@@ -605,6 +828,7 @@ class LocalFileList(MuFileList):
         # Get the file extension
         ext = os.path.splitext(local_filename)[1].lower()
         open_internal_action = None
+        write_to_main_action = None
         # Mu micro:bit mode only handles .py & .hex
         if ext == ".py" or ext == ".hex":
             open_internal_action = menu.addAction(_("Open in Mu"))
@@ -614,8 +838,21 @@ class LocalFileList(MuFileList):
             )
         # Open outside Mu (things get meta if Mu is the default application)
         open_action = menu.addAction(_("Open"))
+        menu.addSeparator()
+        # Only copy over the files that are new or changed.
+        sync_action = menu.addAction(_("Sync folder to device"))
+        preview_sync_action = menu.addAction(_("Preview sync to device"))
         action = menu.exec_(self.mapToGlobal(event.pos()))
-        if action == open_action:
+        if action == sync_action or action == preview_sync_action:
+            dry_run = action == preview_sync_action
+            self.disable.emit()
+            msg = _("Comparing the files in '{}' with the device.").format(
+                self.home
+            )
+            logger.info(msg)
+            self.set_message.emit(msg)
+            self.sync.emit(self.home, dry_run)
+        elif action == open_action:
             # Get the file's path
             path = os.path.abspath(os.path.join(self.home, local_filename))
             logger.info("Opening {}".format(path))
@@ -637,7 +874,7 @@ class LocalFileList(MuFileList):
 
 class FileSystemPane(QFrame):
     """
-    Contains two QListWidgets representing the micro:bit and the user's code
+    Contains widgets representing the micro:bit and the user's code
     directory. Users transfer files by dragging and dropping. Highlighted files
     can be selected for deletion.
     """
@@ -711,16 +948,14 @@ class FileSystemPane(QFrame):
 
     def on_ls(self, microbit_files):
         """
-        Displays a list of the files on the micro:bit.
+        Displays a tree of the (path, size, is_dir) entries on the micro:bit.
 
         Since listing files is always the final event in any interaction
         between Mu and the micro:bit, this enables the controls again for
         further interactions to take place.
         """
-        self.microbit_fs.clear()
+        self.microbit_fs.set_files(microbit_files)
         self.local_fs.clear()
-        for f in microbit_files:
-            self.microbit_fs.addItem(f)
         local_files = [
             f
             for f in os.listdir(self.home)
@@ -731,6 +966,54 @@ class FileSystemPane(QFrame):
             self.local_fs.addItem(f)
         self.enable()
 
+    def on_transfer_progress(self, filename, done, total, rate):
+        """
+        Fired as a file is copied to or from the device, to display how far
+        through the copy Mu is and how quickly the data is moving.
+        """
+        percent = done * 100 // total if total else 100
+        self.show_message(
+            _("Copying '{}': {}% ({:.1f} KB/s).").format(
+                os.path.basename(filename), percent, rate / 1024
+            )
+        )
+
+    def on_sync(self, report, dry_run):
+        """
+        Fired when a folder has been compared with (and, unless dry_run is
+        True, synced to) the device. The report contains (filename, status)
+        entries where the status is one of "new", "changed" or "unchanged".
+        """
+        changed = [f for f, status in report if status != "unchanged"]
+        if dry_run:
+            if changed:
+                msg = _("Syncing would copy {} of {} files: {}.").format(
+                    len(changed), len(report), ", ".join(changed)
+                )
+            else:
+                msg = _("The device is already up to date.")
+            self.show_message(msg)
+            self.enable()
+        else:
+            msg = _("Synced {} of {} files to the device.").format(
+                len(changed), len(report)
+            )
+            self.show_message(msg)
+            self.list_files.emit()
+
+    def on_sync_fail(self, directory):
+        """
+        Fired when the referenced directory cannot be synced to the device.
+        """
+        self.show_warning(
+            _(
+                "There was a problem syncing '{}' to "
+                "the device. Please check Mu's logs for "
+                "more information."
+            ).format(directory)
+        )
+        self.enable()
+
     def on_ls_fail(self):
         """
         Fired when listing files fails.
@@ -809,6 +1092,11 @@ class PythonProcessPane(QTextEdit):
     """
 
     on_append_text = pyqtSignal(bytes)
+    frame_interval = 16  #: Milliseconds between reads of a busy stdout.
+    #: Bytes per second of output above which it is only sampled.
+    flood_rate = 256 * 1024
+    #: Lines shown from the end of the output at each sample.
+    flood_lines = 20
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -824,8 +1112,29 @@ class PythonProcessPane(QTextEdit):
         self.input_history = []  # history of inputs entered in this session.
         self.start_of_current_line = 0  # start position of the input line.
         self.history_position = 0  # current position when navigation history.
-        self.stdout_buffer = b""  # contains non-decoded bytes from stdout.
+        # Decodes stdout, keeping any split multi-byte character until the
+        # rest of it arrives.
+        self.decoder = codecs.getincrementaldecoder("utf8")("replace")
         self.reading_stdout = False  # flag showing if already reading stdout.
+        # While the process keeps writing to stdout, whatever it has written
+        # is read at most once per frame_interval milliseconds.
+        self.read_timer = QTimer(self)
+        self.read_timer.setSingleShot(True)
+        self.read_timer.setInterval(self.frame_interval)
+        self.read_timer.timeout.connect(self.read_from_stdout)
+        self.scrollback = Scrollback(self.document(), "runner")
+        # Bytes read since the start of the current flood window, used to
+        # detect a flood of output.
+        self.flood_window_start = 0
+        self.flood_window_bytes = 0
+        # While flooded, all the output is written to flood_log, and only a
+        # sample of it (the end of the latest output, after a count of the
+        # lines skipped) is shown each second.
+        self.flood_log = None
+        self.flood_path = None
+        self.flood_tail = ""
+        self.skipped_lines = 0
+        self.last_sample = 0
 
     def start_process(
         self,
@@ -937,6 +1246,8 @@ class PythonProcessPane(QTextEdit):
         Handle when the child process finishes.
         """
         self.running = False
+        if self.flood_log:
+            self.end_flood()
         cursor = self.textCursor()
         cursor.movePosition(cursor.End)
         cursor.insertText("\n\n---------- FINISHED ----------\n")
@@ -1018,17 +1329,12 @@ class PythonProcessPane(QTextEdit):
         way.
         """
         data = self.process.readAll().data()
+        if self.flood_log:
+            self.end_flood()
         if data:
-            while True:
-                try:
-                    self.append(data)
-                    self.on_append_text.emit(data)
-                    self.set_start_of_current_line()
-                    break
-                except UnicodeDecodeError:
-                    # Discard problematic start byte and try again.
-                    # (This may be caused by a split in multi-byte characters).
-                    data = data[1:]
+            self.append_text(self.decoder.decode(data))
+            self.on_append_text.emit(data)
+            self.set_start_of_current_line()
 
     def parse_input(self, key, text, modifiers):
         """
@@ -1177,22 +1483,108 @@ class PythonProcessPane(QTextEdit):
 
     def read_from_stdout(self):
         """
-        Process incoming data from the process's stdout.
+        Process all the data available from the process's stdout, appending
+        it to the text area in one go, then check for more once the
+        read_timer fires.
+
+        If the process writes more than flood_rate bytes a second, the
+        output is sampled until it calms down (see sample_output).
         """
-        data = self.process.read(256)
+        data = self.process.readAll().data()
         if data:
-            data = self.stdout_buffer + data
-            try:
-                self.append(data)
-                self.on_append_text.emit(data)
+            self.on_append_text.emit(data)
+            now = time.monotonic()
+            elapsed = now - self.flood_window_start
+            if elapsed >= 1:
+                if self.flood_log and (
+                    self.flood_window_bytes / elapsed <= self.flood_rate
+                ):
+                    self.end_flood()
+                self.flood_window_start = now
+                self.flood_window_bytes = 0
+            self.flood_window_bytes += len(data)
+            if (
+                self.flood_window_bytes > self.flood_rate
+                and not self.flood_log
+            ):
+                self.start_flood(now)
+            if self.flood_log:
+                self.sample_output(data, now)
+            else:
+                self.append_text(self.decoder.decode(data))
                 self.set_start_of_current_line()
-                self.stdout_buffer = b""
-            except UnicodeDecodeError:
-                self.stdout_buffer = data
-            QTimer.singleShot(2, self.read_from_stdout)
+            self.read_timer.start()
         else:
+            if self.flood_log and self.flood_tail:
+                self.show_sample()
             self.reading_stdout = False
 
+    def start_flood(self, now):
+        """
+        Start writing the process's output to a log file in Mu's data
+        directory, rather than showing it all.
+        """
+        log_dir = os.path.join(config.DATA_DIR, "process_output")
+        if not os.path.exists(log_dir):
+            os.makedirs(log_dir)
+        filename = "{}.log".format(time.strftime("%Y%m%d-%H%M%S"))
+        self.flood_path = os.path.join(log_dir, filename)
+        logger.info("Output flood, logging to: {}".format(self.flood_path))
+        self.flood_log = open(self.flood_path, "wb")
+        self.flood_tail = ""
+        self.skipped_lines = 0
+        self.last_sample = now
+
+    def sample_output(self, data, now):
+        """
+        Log the data, count the lines it holds and keep the end of it, to be
+        shown at most once a second.
+
+        The log is moved aside (to a name ending ".1") once it holds
+        "process_flood_log_size" bytes, so it doesn't fill the disk.
+        """
+        self.flood_log.write(data)
+        max_bytes = settings.settings.get(
+            "process_flood_log_size", 64 * 1024 * 1024
+        )
+        if self.flood_log.tell() >= max_bytes:
+            self.flood_log.close()
+            os.replace(self.flood_path, self.flood_path + ".1")
+            self.flood_log = open(self.flood_path, "wb")
+        text = self.decoder.decode(data)
+        self.skipped_lines += text.count("\n")
+        self.flood_tail = (self.flood_tail + text)[-self.flood_lines * 200 :]
+        if now - self.last_sample >= 1:
+            self.show_sample()
+            self.last_sample = now
+
+    def show_sample(self):
+        """
+        Show how many lines of output were skipped, followed by the end of
+        the latest output.
+        """
+        lines = self.flood_tail.splitlines(keepends=True)[-self.flood_lines :]
+        tail = "".join(lines)
+        skipped = max(0, self.skipped_lines - tail.count("\n"))
+        marker = _("[{} lines skipped, all output is in {}]\n").format(
+            skipped, self.flood_path
+        )
+        if self.document().lastBlock().text():
+            marker = "\n" + marker
+        self.append_text(marker + tail)
+        self.set_start_of_current_line()
+        self.flood_tail = ""
+        self.skipped_lines = 0
+
+    def end_flood(self):
+        """
+        Show what's left of the sampled output and stop logging it.
+        """
+        if self.flood_tail:
+            self.show_sample()
+        self.flood_log.close()
+        self.flood_log = None
+
     def write_to_stdin(self, data):
         """
         Writes data from the Qt application to the child process's stdin.
@@ -1201,12 +1593,23 @@ class PythonProcessPane(QTextEdit):
             self.process.write(data)
 
     def append(self, msg):
+        """
+        Append the given bytes, as text, to the text area.
+        """
+        self.append_text(msg.decode("utf-8"))
+
+    def append_text(self, text):
         """
         Append text to the text area.
         """
         cursor = self.textCursor()
         cursor.movePosition(QTextCursor.End)
-        cursor.insertText(msg.decode("utf-8"))
+        cursor.insertText(text)
+        removed = self.scrollback.trim()
+        if removed:
+            self.start_of_current_line = max(
+                0, self.start_of_current_line - removed
+            )
         cursor.movePosition(QTextCursor.End)
         self.setTextCursor(cursor)
 
@@ -1313,6 +1716,411 @@ class DebugInspector(QTreeView):
         pass
 
 
+class RingBuffer:
+    """
+    A fixed size buffer of the most recent values of one series of plotter
+    data (initially all zero), compactly stored as 64-bit floats.
+
+    Storage for the values starts small and doubles as they arrive (up to
+    the size of the buffer), so a short session doesn't pay for a long
+    history up front.
+    """
+
+    initial_capacity = 1024  #: Values stored before the storage first grows.
+
+    def __init__(self, size):
+        self.size = size
+        self.values = self.zeros(min(size, self.initial_capacity))
+        self.count = 0  # Number of values appended so far.
+
+    def __len__(self):
+        return self.size
+
+    @staticmethod
+    def zeros(n):
+        """
+        Return storage for n values, all zero.
+        """
+        if numpy:
+            return numpy.zeros(n)
+        return array("d", [0]) * n
+
+    def append(self, value):
+        """
+        Add the value to the buffer, replacing the oldest value.
+        """
+        capacity = len(self.values)
+        if self.count == capacity < self.size:
+            # The storage is full but hasn't wrapped around yet, so the
+            # values are still in order and can be copied as they are.
+            values = self.zeros(min(self.size, capacity * 2))
+            values[:capacity] = self.values
+            self.values = values
+            capacity = len(values)
+        self.values[self.count % capacity] = value
+        self.count += 1
+
+    def latest(self, n, skip=0):
+        """
+        Return n values, oldest first, ending skip values before the most
+        recent value.
+        """
+        capacity = len(self.values)
+        if capacity < self.size:
+            # Still growing, so the values are in order from the start, with
+            # zeros in place of any from before the first value.
+            end = max(0, self.count - skip)
+            if n <= end:
+                return self.values[end - n : end]
+            padding = self.zeros(n - end)
+            if numpy:
+                return numpy.concatenate((padding, self.values[:end]))
+            return padding + self.values[:end]
+        end = (self.count - skip) % self.size
+        if n <= end:
+            return self.values[end - n : end]
+        start = self.size - (n - end)
+        if numpy:
+            return numpy.concatenate((self.values[start:], self.values[:end]))
+        return self.values[start:] + self.values[:end]
+
+
+def decimate(values, buckets):
+    """
+    Reduce the values to the smallest and largest value of each of (about)
+    buckets consecutive runs of them, so however many values there are only
+    a couple of points per bucket need drawing and no peaks are lost.
+
+    Return the positions and values of the points to draw, in order.
+    """
+    n = len(values)
+    if n <= 2 * buckets:
+        return range(n), values
+    size = -(-n // buckets)  # Values per run, rounded up.
+    if numpy:
+        values = numpy.asarray(values)
+        whole = n - n % size
+        runs = values[:whole].reshape(-1, size)
+        offsets = numpy.arange(0, whole, size)
+        extremes = numpy.stack(
+            (runs.argmin(axis=1) + offsets, runs.argmax(axis=1) + offsets),
+            axis=1,
+        )
+        if whole < n:
+            tail = values[whole:]
+            extremes = numpy.vstack(
+                (extremes, [whole + tail.argmin(), whole + tail.argmax()])
+            )
+        positions = numpy.sort(extremes, axis=1).ravel()
+        return positions, values[positions]
+    positions = []
+    for start in range(0, n, size):
+        run = values[start : start + size]
+        low = run.index(min(run))
+        high = run.index(max(run))
+        positions.extend((start + min(low, high), start + max(low, high)))
+    return positions, [values[i] for i in positions]
+
+
+def make_points(xs, ys):
+    """
+    Return points made from the referenced x and y values in a form that can
+    replace the points in a QLineSeries at once.
+
+    If numpy is available the points are written straight into the memory
+    of a QPolygonF, otherwise a list of QPointF is made.
+    """
+    if numpy:
+        n = len(ys)
+        points = QPolygonF(n)
+        if n:
+            buffer = points.data()
+            buffer.setsize(n * 2 * numpy.dtype(numpy.float64).itemsize)
+            xy = numpy.frombuffer(buffer, numpy.float64).reshape(n, 2)
+            xy[:, 0] = xs
+            xy[:, 1] = ys
+        return points
+    return [QPointF(x, y) for x, y in zip(xs, ys)]
+
+
+def times_at(times, positions, origin):
+    """
+    Return the times at the given positions, relative to the origin.
+    """
+    if numpy:
+        return numpy.asarray(times)[positions] - origin
+    return [times[i] - origin for i in positions]
+
+
+def describe_timing(times, latencies=None):
+    """
+    Return a description of the rate at which datapoints arrived at the
+    given times (in seconds), and of the jitter in the intervals between
+    them.
+
+    If there are latencies (the difference between the time each datapoint
+    arrived and the device's time for it, or NaN if unknown) also describe
+    the average latency above the smallest one, since the device's clock
+    can't be compared directly.
+    """
+    times = list(times)
+    intervals = [b - a for a, b in zip(times, times[1:])]
+    if not intervals or times[-1] <= times[0]:
+        return ""
+    rate = len(intervals) / (times[-1] - times[0])
+    mean = sum(intervals) / len(intervals)
+    variance = sum(i * i for i in intervals) / len(intervals) - mean * mean
+    jitter = math.sqrt(max(0, variance)) * 1000
+    description = _("{:.1f} samples/s, jitter {:.1f}ms").format(rate, jitter)
+    if latencies is not None:
+        known = [latency for latency in latencies if latency == latency]
+        if known:
+            latency = (sum(known) / len(known) - min(known)) * 1000
+            description += _(", latency +{:.1f}ms").format(latency)
+    return description
+
+
+class RecordingWriter:
+    """
+    Writes a plotter recording: a directory holding the time each tuple of
+    data arrived and each of its values as columns of 64-bit floats, one
+    file per column, so a recording of any length can be memory mapped.
+
+    Values missing from a tuple (or from before a channel first appeared)
+    are recorded as zero, as they are drawn by the plotter.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path)
+        with open(os.path.join(path, "recording.json"), "w") as meta:
+            json.dump({"version": 1, "byteorder": sys.byteorder}, meta)
+        self.time_file = open(os.path.join(path, "time.bin"), "wb")
+        self.channel_files = []
+        self.rows = 0
+
+    def write(self, timestamp, values):
+        """
+        Add a row holding the timestamp and values to the recording.
+        """
+        while len(self.channel_files) < len(values):
+            filename = "{}.bin".format(len(self.channel_files))
+            channel_file = open(os.path.join(self.path, filename), "wb")
+            channel_file.write(bytes(8 * self.rows))
+            self.channel_files.append(channel_file)
+        self.time_file.write(struct.pack("d", timestamp))
+        for i, channel_file in enumerate(self.channel_files):
+            value = values[i] if i < len(values) else 0
+            channel_file.write(struct.pack("d", value))
+        self.rows += 1
+
+    def flush(self):
+        for column_file in [self.time_file] + self.channel_files:
+            column_file.flush()
+
+    def close(self):
+        for column_file in [self.time_file] + self.channel_files:
+            column_file.close()
+
+
+def map_column(path):
+    """
+    Return the 64-bit floats in the referenced file, memory mapped rather
+    than read, as a numpy array if possible or else a memoryview.
+    """
+    count = os.path.getsize(path) // 8
+    if numpy:
+        if not count:
+            return numpy.zeros(0)
+        return numpy.memmap(path, numpy.float64, "r", shape=(count,))
+    if not count:
+        return memoryview(array("d"))
+    with open(path, "rb") as column_file:
+        mapped = mmap.mmap(column_file.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped)[: count * 8].cast("d")
+
+
+class RecordedChannel:
+    """
+    The values of one channel of a plotter recording, with the same
+    interface as a RingBuffer so they can be drawn in the same way.
+    """
+
+    def __init__(self, column, length):
+        self.column = column
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def latest(self, n, skip=0):
+        """
+        Return n values, oldest first, ending skip values before the last
+        recorded value.
+        """
+        end = self.length - skip
+        values = self.column[end - n : end]
+        if numpy:
+            return values
+        result = array("d")
+        result.frombytes(values.cast("B"))
+        return result
+
+
+class Recording:
+    """
+    A plotter recording (see RecordingWriter) opened for reading. Only the
+    parts of the recording that are looked at are read from disk.
+    """
+
+    def __init__(self, path):
+        with open(os.path.join(path, "recording.json")) as meta:
+            byteorder = json.load(meta).get("byteorder")
+        if byteorder != sys.byteorder:
+            raise ValueError(
+                _("The recording was made on an incompatible computer.")
+            )
+        self.path = path
+        self.times = map_column(os.path.join(path, "time.bin"))
+        columns = []
+        while True:
+            filename = os.path.join(path, "{}.bin".format(len(columns)))
+            if not os.path.exists(filename):
+                break
+            columns.append(map_column(filename))
+        # A recording cut short may have a partly written last row.
+        self.length = min(len(column) for column in [self.times] + columns)
+        self.channels = [
+            RecordedChannel(column, self.length) for column in columns
+        ]
+        self.timeline = RecordedChannel(self.times, self.length)
+
+    def __len__(self):
+        return self.length
+
+    def index_at(self, timestamp):
+        """
+        Return the number of rows recorded up to the given timestamp.
+        """
+        return bisect.bisect_right(self.times, timestamp, 0, self.length)
+
+
+class PlotterCapture:
+    """
+    Streams the tuples of data received by the plotter to CSV files in the
+    referenced directory as they arrive, so a long session neither grows
+    Mu's memory use nor loses its data should Mu crash.
+
+    Rows are queued for a writer thread, which flushes them to disk at
+    least every flush_interval seconds. It starts a new part file, named
+    with a timestamp, once the current one holds plotter_capture_size
+    bytes or (if set) has been open for plotter_capture_interval seconds.
+
+    If plotter_record is turned on, the rows are also written, with the
+    time they arrived, to a recording named after the first part (with a
+    .plot extension) that can be reopened in the plotter.
+    """
+
+    flush_interval = 0.5
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.max_bytes = settings.settings.get(
+            "plotter_capture_size", 64 * 1024 * 1024
+        )
+        self.interval = settings.settings.get("plotter_capture_interval", 0)
+        self.record = settings.settings.get("plotter_record", False)
+        self.parts = []  # Paths of the files written so far, in order.
+        self.recording = None  # Path of the recording, once started.
+        self.queue = queue.SimpleQueue()
+        self.thread = None
+
+    def write(self, values, timestamp):
+        """
+        Queue a tuple of values to be written as a row of CSV (and to the
+        recording, along with the timestamp of its arrival).
+        """
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+        self.queue.put((timestamp, values))
+
+    def new_part(self):
+        """
+        Return a new part file, open for writing.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        name = time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(self.directory, "{}.csv".format(name))
+        count = 1
+        while os.path.exists(path) or os.path.exists(path[:-4] + ".plot"):
+            count += 1
+            filename = "{}-{}.csv".format(name, count)
+            path = os.path.join(self.directory, filename)
+        self.parts.append(path)
+        logger.info("Capturing plotter data to: {}".format(path))
+        return open(path, "w", newline="")
+
+    def run(self):
+        """
+        Write the queued rows until told to finish (by a None in the queue).
+        """
+        csv_file = None
+        recorder = None
+        written = 0
+        opened = flushed = time.monotonic()
+        while True:
+            try:
+                row = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                row = ()
+            if row is None:
+                break
+            now = time.monotonic()
+            if row:
+                timestamp, values = row
+                if csv_file and (
+                    written >= self.max_bytes
+                    or (self.interval and now - opened >= self.interval)
+                ):
+                    csv_file.close()
+                    csv_file = None
+                if csv_file is None:
+                    csv_file = self.new_part()
+                    csv_writer = csv.writer(csv_file)
+                    written = 0
+                    opened = now
+                    if self.record and recorder is None:
+                        root = os.path.splitext(self.parts[-1])[0]
+                        self.recording = root + ".plot"
+                        recorder = RecordingWriter(self.recording)
+                written += csv_writer.writerow(values)
+                if recorder:
+                    recorder.write(timestamp, values)
+            if csv_file and now - flushed >= self.flush_interval:
+                csv_file.flush()
+                if recorder:
+                    recorder.flush()
+                flushed = now
+        if csv_file:
+            csv_file.close()
+        if recorder:
+            recorder.close()
+
+    def finish(self):
+        """
+        Wait for all the queued rows to be written and return the paths of
+        the files they were written to, followed by the recording (if any).
+        """
+        if self.thread:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+        if self.recording:
+            return self.parts + [self.recording]
+        return self.parts
+
+
 class PlotterPane(QChartView):
     """
     This plotter widget makes viewing sensor data easy!
@@ -1323,24 +2131,66 @@ class PlotterPane(QChartView):
     """
 
     data_flood = pyqtSignal()
+    #: Bytes per second above which the plotter is considered flooded.
+    flood_rate = 256 * 1024
+    #: Longest line (in bytes) that may hold a tuple to plot.
+    max_line_length = 1024
+    #: Most recent datapoints in view to describe the timing of.
+    timing_datapoints = 1000
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        # Holds the raw input to be checked for actionable data to display.
-        self.input_buffer = []
-        # Holds the raw actionable data detected while plotting.
-        self.raw_data = []
+        # Holds the raw input of an incomplete line, to be checked for
+        # actionable data to display once the rest of the line arrives.
+        self.input_buffer = b""
+        # Matches candidate tuples on a line of their own, and tuples of
+        # integers only (the common case, which is parsed in one go).
+        self.tuple_regex = re.compile(rb"^\((.*)\)\r?$", re.MULTILINE)
+        self.int_tuple_regex = re.compile(rb"\s*[-+]?\d+\s*(,\s*[-+]?\d+\s*)*")
+        # Bytes received since the start of the current one second window,
+        # used to detect a data flood.
+        self.flood_window_start = 0
+        self.flood_window_bytes = 0
+        # When the previous chunk of data arrived, so the datapoints in the
+        # next chunk can be spread over the time since then.
+        self.chunk_time = None
+        # Streams the actionable data detected while plotting to disk (once
+        # capturing has been started).
+        self.capture = None
         self.setObjectName("plotterpane")
-        # Number of datapoints to show (caps at self.max_x)
+        # Number of datapoints held (caps at self.history)
         self.num_datapoints = 0
-        self.lookback = 500
-        self.max_x = 100  # Maximum value along x axis
+        # Datapoints kept for each slot of incoming data (by default an
+        # hour's worth at 100 per second), for the chart to zoom out over.
+        self.history = max(
+            100, settings.settings.get("plotter_history", 360000)
+        )
+        self.max_x = 100  # Maximum value along x axis when not zoomed
+        self.visible = self.max_x  # Datapoints across the x axis
+        # Datapoints between the right hand edge of the chart and the most
+        # recent datapoint (zero to follow incoming data).
+        self.offset = 0
+        # The recording shown instead of incoming data (if any), and when
+        # its replay started (as the monotonic time and the timestamp of
+        # the first recorded datapoint).
+        self.recording = None
+        self.replay_start = None
         self.max_y = 1000  # Maximum value +/- along y axis
         self.min_y = -1000
         self.flooded = False  # Flag to indicate if data flooding is happening.
 
-        # Holds deques for each slot of incoming data (assumes 1 to start with)
-        self.data = [deque([0] * self.lookback)]
+        # Holds ring buffers for each slot of incoming data (assumes 1 to
+        # start with)
+        self.data = [RingBuffer(self.history)]
+        # When each datapoint arrived (in seconds, from time.monotonic), and
+        # the time shown as zero on the x axis.
+        self.timeline = RingBuffer(self.history)
+        self.time_origin = None
+        # If set, the first value of each tuple is the device's own time for
+        # it in milliseconds (e.g. from time.ticks_ms()), which is used to
+        # work out latencies rather than being plotted.
+        self.device_time = settings.settings.get("plotter_device_time", False)
+        self.latencies = RingBuffer(self.history)
         # Holds line series for each slot of incoming data (assumes 1 to start
         # with).
         self.series = [QLineSeries()]
@@ -1357,102 +2207,326 @@ class PlotterPane(QChartView):
         self.axis_y = QValueAxis()
         self.axis_x.setRange(0, self.max_x)
         self.axis_y.setRange(self.min_y, self.max_y)
-        self.axis_x.setLabelFormat("time")
+        self.axis_x.setLabelFormat("%.1f")
+        self.axis_x.setTitleText(_("Time (seconds)"))
         self.axis_y.setLabelFormat("%d")
         self.chart.setAxisX(self.axis_x, self.series[0])
         self.chart.setAxisY(self.axis_y, self.series[0])
         self.setChart(self.chart)
         self.setRenderHint(QPainter.Antialiasing)
+        # Incoming data only goes into the buffers, and the chart is redrawn
+        # from them at most "plotter_fps" times a second.
+        fps = max(1, settings.settings.get("plotter_fps", 30))
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(1000 // fps)
+        self.refresh_timer.timeout.connect(self.refresh)
 
     def process_tty_data(self, data):
         """
         Takes raw bytes and, if a valid tuple is detected, adds the data to
         the plotter.
 
-        The the length of the bytes data > 1024 then a data_flood signal is
-        emitted to ensure Mu can take action to remain responsive.
+        Only complete lines are scanned; any trailing partial line is kept
+        in self.input_buffer until the rest of it arrives.
+
+        A chunk of data may hold many datapoints that the device produced
+        over the time since the previous chunk arrived, so their timestamps
+        are spread evenly over that time (ending now).
+
+        If the data arrives at more than flood_rate bytes per second then a
+        data_flood signal is emitted to ensure Mu can take action to remain
+        responsive.
         """
         # Data flooding guards.
         if self.flooded:
             return
-        if len(data) > 1024:
+        now = time.monotonic()
+        if now - self.flood_window_start >= 1:
+            self.flood_window_start = now
+            self.flood_window_bytes = 0
+        self.flood_window_bytes += len(data)
+        if self.flood_window_bytes > self.flood_rate:
             self.flooded = True
+            if self.capture:
+                # Finish writing the data captured so far, but keep hold of
+                # the capture so its files are still returned by
+                # stop_capture to be moved into place.
+                self.capture.finish()
             self.data_flood.emit()
             return
-        data = data.replace(b"\r\n", b"\n")
-        self.input_buffer.append(data)
-        # Check if the data contains a Python tuple, containing numbers, on a
+        data = self.input_buffer + data
+        end = data.rfind(b"\n") + 1
+        self.input_buffer = data[end:]
+        if len(self.input_buffer) > self.max_line_length:
+            # Too long to be a tuple, so don't keep waiting for its end.
+            self.input_buffer = b""
+        # Check if the data contains Python tuples, containing numbers, on a
         # single line (i.e. ends with \n).
-        input_bytes = b"".join(self.input_buffer)
-        lines = input_bytes.split(b"\n")
-        for line in lines:
-            if line.startswith(b"(") and line.endswith(b")"):
-                # Candidate tuple. Extract the raw bytes into a numeric tuple.
-                raw_values = [val.strip() for val in line[1:-1].split(b",")]
-                numeric_values = []
-                for raw in raw_values:
-                    try:
-                        numeric_values.append(int(raw))
-                        # It worked, so move onto the next value.
-                        continue
-                    except ValueError:
-                        # Try again as a float.
-                        pass
-                    try:
-                        numeric_values.append(float(raw))
-                    except ValueError:
-                        # Not an int or float, so ignore this value.
-                        continue
-                if numeric_values:
-                    # There were numeric values in the tuple, so use them!
-                    self.add_data(tuple(numeric_values))
-        # Reset the input buffer.
-        self.input_buffer = []
-        if lines[-1]:
-            # Append any bytes that are not yet at the end of a line, for
-            # processing next time we read data from self.connection.
-            self.input_buffer.append(lines[-1])
-
-    def add_data(self, values):
+        datapoints = []
+        for match in self.tuple_regex.finditer(data, 0, end):
+            values = self.parse_tuple(match.group(1))
+            if values:
+                # There were numeric values in the tuple, so use them!
+                datapoints.append(values)
+        start = now if self.chunk_time is None else self.chunk_time
+        self.chunk_time = now
+        if datapoints:
+            step = (now - start) / len(datapoints)
+            for i, values in enumerate(datapoints, 1):
+                self.add_data(values, start + step * i)
+
+    def start_capture(self, directory):
+        """
+        Start capturing incoming data to CSV files in the given directory.
+        """
+        self.capture = PlotterCapture(directory)
+
+    def stop_capture(self):
+        """
+        Stop capturing incoming data and return the paths of the files it
+        was written to.
+        """
+        if self.capture:
+            parts = self.capture.finish()
+            self.capture = None
+            return parts
+        return []
+
+    def parse_tuple(self, raw_tuple):
+        """
+        Given the raw bytes between the brackets of a candidate tuple, return
+        a tuple of the numeric values found therein.
+        """
+        raw_values = raw_tuple.split(b",")
+        if self.int_tuple_regex.fullmatch(raw_tuple):
+            return tuple(map(int, raw_values))
+        numeric_values = []
+        for raw in raw_values:
+            try:
+                numeric_values.append(int(raw))
+                # It worked, so move onto the next value.
+                continue
+            except ValueError:
+                # Try again as a float.
+                pass
+            try:
+                numeric_values.append(float(raw))
+            except ValueError:
+                # Not an int or float, so ignore this value.
+                continue
+        return tuple(numeric_values)
+
+    def add_data(self, values, timestamp=None):
         """
         Given a tuple of values, ensures there are the required number of line
-        series, add the data to the line series, update the range of the chart
-        so the chart displays nicely.
-        """
-        # Store incoming data to dump as CSV at the end of the session.
-        self.raw_data.append(values)
+        series and adds the data to the buffers behind them, stamped with the
+        time it arrived (now, unless given). The chart is refreshed with the
+        latest data when the refresh timer fires.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        # Store incoming data to save as CSV at the end of the session.
+        if self.capture:
+            self.capture.write(values, timestamp)
+        latency = math.nan
+        if self.device_time and len(values) > 1:
+            latency = timestamp - values[0] / 1000
+            values = values[1:]
+        if self.time_origin is None:
+            self.time_origin = timestamp
+        self.timeline.append(timestamp)
+        self.latencies.append(latency)
         # Check the number of incoming values.
-        if len(values) != len(self.series):
-            # Adjust the number of line series.
-            value_len = len(values)
-            series_len = len(self.series)
-            if value_len > series_len:
-                # Add new line series.
-                for i in range(value_len - series_len):
-                    new_series = QLineSeries()
-                    self.chart.addSeries(new_series)
-                    self.chart.setAxisX(self.axis_x, new_series)
-                    self.chart.setAxisY(self.axis_y, new_series)
-                    self.series.append(new_series)
-                    self.data.append(deque([0] * self.lookback))
-            else:
-                # Remove old line series.
-                for old_series in self.series[value_len:]:
-                    self.chart.removeSeries(old_series)
-                self.series = self.series[:value_len]
-                self.data = self.data[:value_len]
-
-        # Add the incoming values to the data to be displayed, and compute
-        # max range.
-        max_ranges = []
-        min_ranges = []
+        value_len = len(values)
+        if value_len != len(self.data):
+            for i in range(len(self.data), value_len):
+                self.data.append(RingBuffer(self.history))
+            self.data = self.data[:value_len]
+        if self.recording:
+            # Keep the incoming data for when it's shown again.
+            for i, value in enumerate(values):
+                self.data[i].append(value)
+            self.num_datapoints = min(self.num_datapoints + 1, self.history)
+            return
+        if value_len != len(self.series):
+            self.set_series_count(value_len)
+
+        # Add the incoming values to the data to be displayed.
         for i, value in enumerate(values):
-            self.data[i].appendleft(value)
-            max_ranges.append(max(self.data[i]))
-            min_ranges.append(min(self.data[i]))
-            if len(self.data[i]) > self.lookback:
-                self.data[i].pop()
-            self.num_datapoints = min(self.num_datapoints + 1, self.max_x)
+            self.data[i].append(value)
+        self.num_datapoints = min(self.num_datapoints + 1, self.history)
+        if self.offset:
+            # Keep showing the same datapoints while looking back.
+            self.offset = min(self.offset + 1, self.num_datapoints - 1)
+        self.schedule_refresh()
+
+    def set_series_count(self, count):
+        """
+        Add or remove line series so there are count of them.
+        """
+        series_len = len(self.series)
+        if count > series_len:
+            # Add new line series.
+            for i in range(count - series_len):
+                new_series = QLineSeries()
+                self.chart.addSeries(new_series)
+                self.chart.setAxisX(self.axis_x, new_series)
+                self.chart.setAxisY(self.axis_y, new_series)
+                self.series.append(new_series)
+        else:
+            # Remove old line series.
+            for old_series in self.series[count:]:
+                self.chart.removeSeries(old_series)
+            self.series = self.series[:count]
+
+    def datapoints(self):
+        """
+        Return the number of datapoints that can be shown.
+        """
+        if self.recording:
+            return len(self.recording)
+        return self.num_datapoints
+
+    def contextMenuEvent(self, event):
+        menu = QMenu(self)
+        open_action = menu.addAction(_("Open recording..."))
+        replay_action = None
+        live_action = None
+        if self.recording:
+            replay_action = menu.addAction(_("Replay recording"))
+            live_action = menu.addAction(_("Show live data"))
+        action = menu.exec_(self.mapToGlobal(event.pos()))
+        if action == open_action:
+            directory = self.capture.directory if self.capture else ""
+            # A recording is a directory, picked by way of its manifest.
+            path, _filter = QFileDialog.getOpenFileName(
+                self,
+                _("Open plotter recording"),
+                directory,
+                _("Plotter recording (recording.json)"),
+            )
+            if path:
+                self.open_recording(os.path.dirname(path))
+        elif action == replay_action:
+            self.replay()
+        elif action == live_action:
+            self.show_live_data()
+
+    def open_recording(self, path):
+        """
+        Show the plotter recording at the given path instead of incoming
+        data.
+        """
+        try:
+            recording = Recording(path)
+        except (OSError, ValueError) as ex:
+            logger.error("Unable to open recording {}: {}".format(path, ex))
+            msg = QMessageBox(self)
+            msg.setIcon(QMessageBox.Warning)
+            msg.setText(_("Could not open the plotter recording."))
+            msg.setInformativeText(str(ex))
+            msg.exec_()
+            return
+        logger.info("Showing recording: {}".format(path))
+        self.recording = recording
+        self.replay_start = None
+        self.offset = 0
+        self.set_series_count(len(recording.channels))
+        self.schedule_refresh()
+
+    def replay(self):
+        """
+        Play the recording back from its start, as fast as it was recorded.
+        """
+        if self.recording and len(self.recording):
+            first = self.recording.times[0]
+            self.replay_start = (time.monotonic(), first)
+            self.offset = len(self.recording) - 1
+            self.schedule_refresh()
+
+    def show_live_data(self):
+        """
+        Stop showing a recording, and go back to showing incoming data.
+        """
+        self.recording = None
+        self.replay_start = None
+        self.offset = 0
+        self.set_series_count(len(self.data))
+        self.schedule_refresh()
+
+    def schedule_refresh(self):
+        """
+        Ensure the chart is refreshed when the refresh timer next fires.
+        """
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start()
+
+    def zoom(self, factor):
+        """
+        Scale the number of datapoints across the x axis by the given factor
+        (within sensible limits).
+        """
+        most = max(self.history, self.datapoints())
+        self.visible = int(min(max(10, self.visible * factor), most))
+        self.schedule_refresh()
+
+    def pan(self, datapoints):
+        """
+        Move the chart back (positive) or forward (negative) through the
+        history by the given number of datapoints.
+        """
+        most = max(0, self.datapoints() - 1)
+        self.offset = min(max(0, self.offset + datapoints), most)
+        self.schedule_refresh()
+
+    def wheelEvent(self, event):
+        """
+        Scrolling zooms the chart in and out, while SHIFT-scrolling moves the
+        chart back and forth through the history.
+        """
+        steps = event.angleDelta().y() / 120
+        if event.modifiers() & Qt.ShiftModifier:
+            self.pan(int(steps * self.visible / 10))
+        else:
+            self.zoom(0.8**steps)
+        event.accept()
+
+    def refresh(self):
+        """
+        Update the range of the chart so the chart displays nicely, and show
+        the data in view in the line series, decimated to a couple of points
+        per pixel across the chart.
+        """
+        channels = self.data
+        timeline = self.timeline
+        origin = self.time_origin
+        latencies = self.latencies
+        if self.recording:
+            channels = self.recording.channels
+            timeline = self.recording.timeline
+            origin = self.recording.times[0] if len(self.recording) else 0
+            latencies = None
+            if self.replay_start:
+                self.replay_step()
+        count = min(self.visible, self.datapoints() - self.offset)
+        buckets = max(1, int(self.chart.plotArea().width()))
+        times = timeline.latest(count, self.offset)
+        recent = -self.timing_datapoints
+        if latencies is not None:
+            latencies = latencies.latest(count, self.offset)[recent:]
+        self.chart.setTitle(describe_timing(times[recent:], latencies))
+        points = []
+        # The y axis always includes zero.
+        max_ranges = [0]
+        min_ranges = [0]
+        for data in channels:
+            positions, ys = decimate(data.latest(count, self.offset), buckets)
+            xs = times_at(times, positions, origin)
+            points.append((xs, ys))
+            if len(ys):
+                max_ranges.append(max(ys))
+                min_ranges.append(min(ys))
 
         # Re-scale y-axis.
         max_y_range = max(max_ranges)
@@ -1473,6 +2547,9 @@ class PlotterPane(QChartView):
         elif min_y_range > self.min_y / 2:
             self.min_y = self.min_y / 2
 
+        if count:
+            start = times[0] - origin
+            self.axis_x.setRange(start, max(times[-1] - origin, start + 1))
         self.axis_y.setRange(self.min_y, self.max_y)
 
         # Ensure floats are used to label y axis if the range is small.
@@ -1482,14 +2559,21 @@ class PlotterPane(QChartView):
             self.axis_y.setLabelFormat("%d")
 
         # Update the line series with the data.
-        for i, line_series in enumerate(self.series):
-            line_series.clear()
-            xy_vals = []
-            for j in range(self.num_datapoints):
-                val = self.data[i][self.num_datapoints - 1 - j]
-                xy_vals.append((j, val))
-            for point in xy_vals:
-                line_series.append(*point)
+        for line_series, (xs, ys) in zip(self.series, points):
+            line_series.replace(make_points(xs, ys))
+
+    def replay_step(self):
+        """
+        Move the chart on to show the recording up to the time it's been
+        replaying for, and keep refreshing until the end is reached.
+        """
+        started, first = self.replay_start
+        shown = self.recording.index_at(first + time.monotonic() - started)
+        self.offset = len(self.recording) - max(1, shown)
+        if self.offset:
+            self.schedule_refresh()
+        else:
+            self.replay_start = None
 
     def set_theme(self, theme):
         """
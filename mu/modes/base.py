@@ -19,14 +19,17 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import sys
 import os
 import os.path
-import csv
+import shutil
 import time
 import logging
 import pkgutil
+import struct
+from collections import deque
 from serial import Serial
 from PyQt5.QtSerialPort import QSerialPort, QSerialPortInfo
-from PyQt5.QtCore import QObject, pyqtSignal, QIODevice, QTimer
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QIODevice, QTimer
 from mu.logic import Device
+from mu.interface.panes import PlotterPane
 from mu.contrib import microfs
 from .. import config, settings
 
@@ -34,6 +37,15 @@ ENTER_RAW_MODE = b"\x01"  # CTRL-A
 EXIT_RAW_MODE = b"\x02"  # CTRL-B
 KEYBOARD_INTERRUPT = b"\x03"  # CTRL-C
 SOFT_REBOOT = b"\x04"  # CTRL-C
+RAW_PASTE_MODE = b"\x05A\x01"  # CTRL-E, A, CTRL-A
+RAW_REPL_BANNER = b"raw REPL; CTRL-B to exit\r\n>"
+#: Control characters the device must act on before it can take more input.
+CONTROL_COMMANDS = (
+    ENTER_RAW_MODE,
+    EXIT_RAW_MODE,
+    KEYBOARD_INTERRUPT,
+    SOFT_REBOOT,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -78,6 +90,30 @@ class REPLConnection(QObject):
         self._baudrate = baudrate
         self.serial.setPortName(port)
         self.serial.setBaudRate(baudrate)
+        # Commands waiting to be written as (command, callback, count, total)
+        # entries, where the callback is told how far through its batch of
+        # commands the connection has got.
+        self.write_queue = deque()
+        # The pacing policy: at most write_burst bytes are handed to the port
+        # at a time, with write_delay milliseconds between bursts.
+        self.write_burst = settings.settings.get("serial_write_burst", 256)
+        self.write_delay = settings.settings.get("serial_write_delay", 2)
+        self._drain_scheduled = False
+        # State of a script being run with send_script, while the device's
+        # raw REPL framing is filtered out of the data received.
+        self._script = None
+        self._script_state = None
+        self._script_buffer = b""
+        self._script_generation = 0
+        self._script_callback = None
+        # How much of the script has been sent, and the number of CTRL-Ds
+        # that have ended its output and any error so far.
+        self._script_sent = 0
+        self._script_eof = 0
+        # The device's raw-paste flow control window, and how many bytes it
+        # has allowed to be sent that haven't been yet.
+        self._script_window = 0
+        self._script_allowance = 0
 
     @property
     def port(self):
@@ -117,6 +153,7 @@ class REPLConnection(QObject):
             pyser.close()
             self.serial.open(QIODevice.ReadWrite)
         self.serial.readyRead.connect(self._on_serial_read)
+        self.serial.bytesWritten.connect(self._on_bytes_written)
 
         logger.info("Connected to REPL on port: {}".format(self.port))
 
@@ -125,6 +162,7 @@ class REPLConnection(QObject):
         Close and clean up the currently open serial link.
         """
         logger.info("Closing connection to REPL on port: {}".format(self.port))
+        self.write_queue.clear()
         if self.serial:
             self.serial.close()
             self.serial = None
@@ -134,7 +172,10 @@ class REPLConnection(QObject):
         Called when data is ready to be send from the device
         """
         data = bytes(self.serial.readAll())
-        self.data_received.emit(data)
+        if self._script_state:
+            self._on_script_data(data)
+        else:
+            self.data_received.emit(data)
 
     def write(self, data):
         self.serial.write(data)
@@ -143,18 +184,234 @@ class REPLConnection(QObject):
         self.write(EXIT_RAW_MODE)  # CTRL-B
         self.write(KEYBOARD_INTERRUPT)  # CTRL-C
 
-    def execute(self, commands):
+    def execute(self, commands, callback=None):
+        """
+        Queue a series of commands to be written to the device over a period
+        of time, so the event loop isn't blocked.
+
+        If given, the callback is called with the number of commands written
+        so far and the total number of commands as the queue drains.
+        """
+        total = len(commands)
+        for count, command in enumerate(commands, 1):
+            self.write_queue.append((command, callback, count, total))
+        if not self._drain_scheduled:
+            self._drain()
+
+    def _schedule_drain(self, delay):
+        self._drain_scheduled = True
+        QTimer.singleShot(delay, self._drain)
+
+    def _on_bytes_written(self, count):
+        """
+        Called when the port has written data to the device, so any commands
+        held back by backpressure can be sent.
         """
-        Execute a series of commands over a period of time (scheduling
-        remaining commands to be run in the next iteration of the event loop).
+        if self.write_queue and not self._drain_scheduled:
+            self._schedule_drain(0)
+
+    def _drain(self):
+        """
+        Write a burst of queued commands to the device. If the port still has
+        a burst's worth of data waiting to go out, wait for it to be written
+        (see _on_bytes_written) rather than piling more data on top.
+
+        A control character (such as the CTRL-D that soft reboots the device)
+        always ends a burst, so the device has a pause to act on it before
+        anything else arrives.
         """
-        if commands:
-            command = commands[0]
-            logger.info("Sending command {}".format(command))
+        self._drain_scheduled = False
+        if not self.serial:
+            return
+        if self.serial.bytesToWrite() >= self.write_burst:
+            return
+        written = 0
+        # Only report the latest progress of each batch once per burst.
+        progress = {}
+        while self.write_queue and written < self.write_burst:
+            command, callback, count, total = self.write_queue.popleft()
+            logger.debug("Sending command {}".format(command))
             self.write(command)
-            remainder = commands[1:]
-            remaining_task = lambda commands=remainder: self.execute(commands)
-            QTimer.singleShot(2, remaining_task)
+            written += len(command)
+            if callback:
+                progress[callback] = (count, total)
+            if command in CONTROL_COMMANDS:
+                break
+        for callback, (count, total) in progress.items():
+            callback(count, total)
+        if self.write_queue:
+            self._schedule_drain(self.write_delay)
+
+    def send_script(self, script, callback=None):
+        """
+        Run the script on the device as a single block via the raw REPL,
+        using the flow controlled raw-paste mode if the device supports it.
+
+        Unlike send_commands, the device doesn't echo the script, and only
+        the script's output (and any error) is emitted as data received.
+
+        The optional callback is told how much of the script has been sent so
+        far and the total, as it's sent.
+        """
+        self._script = script.encode("utf-8")
+        self._script_sent = 0
+        self._script_callback = callback
+        self._script_buffer = b""
+        self._script_eof = 0
+        self._set_script_state("raw")
+        self.execute([KEYBOARD_INTERRUPT, KEYBOARD_INTERRUPT, ENTER_RAW_MODE])
+
+    def _set_script_state(self, state):
+        """
+        Move the script run on to the referenced state. Unless the script is
+        running, give up if the device doesn't respond in time.
+        """
+        self._script_state = state
+        self._script_generation += 1
+        if state not in (None, "output"):
+            timeout = int(settings.settings.get("serial_timeout", 2) * 1000)
+            generation = self._script_generation
+            QTimer.singleShot(
+                timeout, lambda: self._script_timeout(generation)
+            )
+
+    def _script_timeout(self, generation):
+        """
+        Stop filtering the data received if the script run is still waiting
+        in the same state it was in when the timeout was set.
+
+        The device is told to end any paste in progress and to leave raw
+        mode, so the REPL is usable again.
+        """
+        if generation == self._script_generation:
+            state = self._script_state
+            logger.warning(
+                "No response to running script in state: {}".format(state)
+            )
+            if state in ("pasting", "pasted"):
+                self.write(SOFT_REBOOT)
+            self.write(EXIT_RAW_MODE)
+            buffer = self._script_buffer
+            self._script_state = None
+            self._script_buffer = b""
+            if buffer:
+                self.data_received.emit(buffer)
+
+    def _on_script_written(self, count, total):
+        """
+        Called as the chunks of a script sent in normal raw mode are written
+        to the device. Each write is progress, so the timeout is restarted
+        rather than expiring partway through sending a large script.
+        """
+        if self._script_state == "ok":
+            self._set_script_state("ok")
+        if self._script_callback:
+            self._script_callback(count, total)
+
+    def _on_script_data(self, data):
+        """
+        Work through the raw REPL protocol with the device as data arrives.
+        """
+        buffer = self._script_buffer + data
+        self._script_buffer = b""
+        state = self._script_state
+        if state == "raw":
+            if RAW_REPL_BANNER in buffer:
+                # Soft reboot so the script runs with a clean slate.
+                self._set_script_state("reset")
+                self.write(SOFT_REBOOT)
+            else:
+                self._script_buffer = buffer
+        elif state == "reset":
+            reboot = buffer.find(b"soft reboot")
+            if reboot >= 0 and RAW_REPL_BANNER in buffer[reboot:]:
+                self._set_script_state("paste")
+                self.write(RAW_PASTE_MODE)
+            else:
+                self._script_buffer = buffer
+        elif state == "paste":
+            if len(buffer) < 2 or buffer[:2] == b"R\x01" and len(buffer) < 4:
+                self._script_buffer = buffer
+            elif buffer[:2] == b"R\x01":
+                # The device supports raw-paste: send the script a window at
+                # a time, and more as the device asks for it.
+                self._script_window = struct.unpack("<H", buffer[2:4])[0]
+                self._script_allowance = self._script_window
+                self._set_script_state("pasting")
+                self._on_script_data(buffer[4:])
+            elif buffer[:2] == b"R\x00" or RAW_REPL_BANNER in buffer:
+                # No raw-paste, so send the script in normal raw mode.
+                self._set_script_state("ok")
+                self._script_sent = len(self._script)
+                chunks = [
+                    self._script[i : i + self.write_burst]
+                    for i in range(0, len(self._script), self.write_burst)
+                ]
+                self.execute(chunks + [SOFT_REBOOT], self._on_script_written)
+            else:
+                self._script_buffer = buffer
+        elif state == "pasting":
+            if SOFT_REBOOT in buffer:
+                # The device aborted the paste (e.g. a syntax error).
+                self._set_script_state("output")
+                self._on_script_data(buffer[buffer.index(SOFT_REBOOT) + 1 :])
+                return
+            self._script_allowance += buffer.count(b"\x01") * (
+                self._script_window
+            )
+            end = min(
+                len(self._script), self._script_sent + self._script_allowance
+            )
+            start = self._script_sent
+            self._script_allowance -= end - start
+            self._script_sent = end
+            if self._script_sent == len(self._script):
+                self._set_script_state("pasted")
+            else:
+                self._set_script_state("pasting")
+            if end > start:
+                self.write(self._script[start:end])
+                if self._script_callback:
+                    self._script_callback(end, len(self._script))
+            if self._script_state == "pasted":
+                self.write(SOFT_REBOOT)
+        elif state == "pasted":
+            # The device acknowledges the end of the script with CTRL-D.
+            if SOFT_REBOOT in buffer:
+                self._set_script_state("output")
+                self._on_script_data(buffer[buffer.index(SOFT_REBOOT) + 1 :])
+            else:
+                self._script_buffer = buffer
+        elif state == "ok":
+            if b"OK" in buffer:
+                self._set_script_state("output")
+                self._on_script_data(buffer[buffer.index(b"OK") + 2 :])
+            else:
+                self._script_buffer = buffer
+        elif state == "output":
+            # The output and any error message each end with CTRL-D, followed
+            # by the raw REPL's prompt.
+            output = b""
+            while buffer and self._script_eof < 2:
+                index = buffer.find(SOFT_REBOOT)
+                if index < 0:
+                    output += buffer
+                    buffer = b""
+                    break
+                output += buffer[:index]
+                buffer = buffer[index + 1 :]
+                self._script_eof += 1
+            if output:
+                self.data_received.emit(output)
+            if self._script_eof == 2 and buffer:
+                # Consume the prompt (which may arrive after the second
+                # CTRL-D), then return to the friendly REPL.
+                if buffer.startswith(b">"):
+                    buffer = buffer[1:]
+                self._set_script_state(None)
+                self.write(EXIT_RAW_MODE)
+                if buffer:
+                    self.data_received.emit(buffer)
 
     def send_commands(self, commands):
         """
@@ -280,30 +537,63 @@ class BaseMode(QObject):
         """
         return NotImplemented
 
-    def write_plotter_data_to_csv(self, csv_filepath):
-        """Write any plotter data out to a CSV file when the
-        plotter is closed
+    def data_capture_dir(self):
         """
-        with open(csv_filepath, "w", newline="") as csvfile:
-            csv_writer = csv.writer(csvfile)
-            csv_writer.writerows(self.view.plotter_pane.raw_data)
+        Return (and create if needed) the directory called 'data_capture' in
+        the workspace directory, where plotter data is saved.
+        """
+        data_dir = os.path.join(get_default_workspace(), "data_capture")
+        if not os.path.exists(data_dir):
+            logger.debug("Creating directory: {}".format(data_dir))
+            os.makedirs(data_dir)
+        return data_dir
 
-    def remove_plotter(self):
+    def start_plotter_capture(self):
+        """
+        Stream the data received by the newly added plotter to CSV files in
+        the data capture directory, as it arrives.
         """
-        If there's an active plotter, hide it.
+        self.view.plotter_pane.start_capture(self.data_capture_dir())
 
+    def write_plotter_data_to_csv(self, csv_filepath):
+        """Finish capturing the plotter data when the plotter is closed,
+        and move the CSV file(s) it was written to into place, along with
+        the recording of it (if any).
+
+        If the capture ran to more than one file, the files after the first
+        are numbered in order (e.g. data.csv, data-2.csv, data-3.csv). If no
+        data was captured, an empty CSV file is written.
+        """
+        parts = self.view.plotter_pane.stop_capture()
+        root = os.path.splitext(csv_filepath)[0]
+        count = 0
+        for part in parts:
+            ext = os.path.splitext(part)[1]
+            if ext == ".csv":
+                count += 1
+                if count > 1:
+                    ext = "-{}{}".format(count, ext)
+            shutil.move(part, root + ext)
+        if not count:
+            open(csv_filepath, "w", newline="").close()
+
+    def save_plotter_data(self):
+        """
         Save any data captured while the plotter was active into a directory
         called 'data_capture' in the workspace directory. The file contains
         CSV data and is named with a timestamp for easy identification.
         """
-        # Save the raw data as CSV
-        data_dir = os.path.join(get_default_workspace(), "data_capture")
-        if not os.path.exists(data_dir):
-            logger.debug("Creating directory: {}".format(data_dir))
-            os.makedirs(data_dir)
+        data_dir = self.data_capture_dir()
         filename = "{}.csv".format(time.strftime("%Y%m%d-%H%M%S"))
         filepath = os.path.join(data_dir, filename)
         self.write_plotter_data_to_csv(filepath)
+
+    def remove_plotter(self):
+        """
+        If there's an active plotter, hide it, saving the data it captured
+        (see save_plotter_data).
+        """
+        self.save_plotter_data()
         self.view.remove_plotter()
         self.plotter = False
         logger.info("Removing plotter")
@@ -318,6 +608,8 @@ class BaseMode(QObject):
         data).
         """
         logger.error("Plotting data flood detected.")
+        # Keep the data captured before the flood.
+        self.save_plotter_data()
         self.view.remove_plotter()
         self.plotter = False
         msg = _("Data Flood Detected!")
@@ -325,12 +617,12 @@ class BaseMode(QObject):
             "The plotter is flooded with data which will make Mu "
             "unresponsive and freeze. As a safeguard, the plotter has "
             "been stopped.\n\n"
-            "Flooding is when chunks of data of more than 1024 bytes are "
-            "repeatedly sent to the plotter.\n\n"
+            "Flooding is when more than {} KB of data a second is "
+            "sent to the plotter.\n\n"
             "To fix this, make sure your code prints small tuples of "
             "data between calls to 'sleep' for a very short period of "
             "time."
-        )
+        ).format(PlotterPane.flood_rate // 1024)
         self.view.show_message(msg, info)
 
     def open_file(self, path):
@@ -514,6 +806,32 @@ class MicroPythonMode(BaseMode):
             )
             self.view.show_message(message, information)
 
+    def run_script(self, script):
+        """
+        Run the script on the connected device, showing only its output in
+        the REPL (which is opened if needed).
+
+        The script is sent as a single block via the device's raw REPL,
+        rather than typed into the REPL line by line.
+        """
+        if not self.repl:
+            self.toggle_repl(None)
+        if self.repl and self.connection:
+            self.connection.send_script(script, callback=self.on_run_progress)
+
+    def on_run_progress(self, done, total):
+        """
+        Called as the script is sent to the device, to show how far through
+        the transfer Mu is.
+        """
+        if done < total:
+            percent = done * 100 // total
+            self.editor.show_status_message(
+                _("Sending script to device: {}%").format(percent)
+            )
+        else:
+            self.editor.show_status_message(_("Script sent to device."))
+
     def toggle_plotter(self, event):
         """
         Toggles the plotter on and off.
@@ -540,6 +858,7 @@ class MicroPythonMode(BaseMode):
                 self.view.add_micropython_plotter(
                     self.name, self.connection, self.on_data_flood
                 )
+                self.start_plotter_capture()
                 logger.info("Started plotter")
                 self.plotter = True
             except IOError as ex:
@@ -621,7 +940,8 @@ class FileManager(QObject):
     operations.
     """
 
-    # Emitted when the tuple of files on the device is known.
+    # Emitted when the tuple of (path, size, is_dir) entries describing the
+    # files and directories on the device is known.
     on_list_files = pyqtSignal(tuple)
     # Emitted when the file with referenced filename is got from the device.
     on_get_file = pyqtSignal(str)
@@ -638,6 +958,14 @@ class FileManager(QObject):
     on_put_fail = pyqtSignal(str)
     # Emitted when the referenced file fails to be deleted from the device.
     on_delete_fail = pyqtSignal(str)
+    # Emitted as a file is copied to or from the device with the filename,
+    # bytes transferred, total bytes and transfer rate in bytes per second.
+    on_transfer_progress = pyqtSignal(str, int, int, float)
+    # Emitted when a directory is synced to the device with the tuple of
+    # (filename, status) entries and a flag indicating a dry run.
+    on_sync = pyqtSignal(tuple, bool)
+    # Emitted when the referenced directory fails to be synced to the device.
+    on_sync_fail = pyqtSignal(str)
 
     def __init__(self, port):
         """
@@ -645,6 +973,7 @@ class FileManager(QObject):
         """
         super().__init__()
         self.port = port
+        self.serial = None
 
     def on_start(self):
         """
@@ -664,18 +993,74 @@ class FileManager(QObject):
             logger.exception(ex)
             self.on_list_fail.emit()
 
+    @pyqtSlot()
+    def on_stop(self):
+        """
+        Run before the thread containing this object's instance is quit so
+        the device is taken out of raw mode, back to its normal REPL, and the
+        serial connection is closed.
+        """
+        if self.serial is None:
+            return
+        try:
+            microfs.end_session(self.serial)
+        except Exception as ex:
+            logger.exception(ex)
+        finally:
+            self.serial.close()
+            self.serial = None
+
+    def ensure_session(self):
+        """
+        Make sure the device is in a raw REPL session ready for a file system
+        operation.
+
+        The session is kept open between operations, so only the first
+        operation (or one following a lost connection) pays the cost of
+        entering raw mode and soft rebooting the device.
+        """
+        if microfs.session_alive(self.serial):
+            return
+        logger.info("Starting raw REPL session on port: {}".format(self.port))
+        try:
+            microfs.start_session(self.serial)
+        except Exception as ex:
+            # The connection itself may have been lost, so reopen it once.
+            logger.warning(ex)
+            self.serial.close()
+            self.serial.open()
+            microfs.start_session(self.serial)
+
     def ls(self):
         """
-        List the files on the micro:bit. Emit the resulting tuple of filenames
-        or emit a failure signal.
+        List the files and directories on the micro:bit. Emit the resulting
+        tuple of (path, size, is_dir) entries or emit a failure signal.
         """
         try:
-            result = tuple(microfs.ls(self.serial))
+            self.ensure_session()
+            result = tuple(microfs.ls_tree(self.serial))
             self.on_list_files.emit(result)
         except Exception as ex:
             logger.exception(ex)
             self.on_list_fail.emit()
 
+    def transfer_progress(self, filename):
+        """
+        Return a callback for microfs to report the progress of copying the
+        referenced file, which is re-emitted as the on_transfer_progress
+        signal.
+        """
+
+        def callback(done, total, rate):
+            logger.debug(
+                "{}: {}/{} bytes ({:.0f} bytes/s)".format(
+                    filename, done, total, rate
+                )
+            )
+            self.on_transfer_progress.emit(filename, done, total, rate)
+
+        return callback
+
     def get(self, device_filename, local_filename):
         """
         Get the referenced device filename and save it to the local
@@ -683,7 +1068,13 @@ class FileManager(QObject):
         failure signal.
         """
         try:
-            microfs.get(device_filename, local_filename, serial=self.serial)
+            self.ensure_session()
+            microfs.get(
+                device_filename,
+                local_filename,
+                serial=self.serial,
+                callback=self.transfer_progress(device_filename),
+            )
             self.on_get_file.emit(device_filename)
         except Exception as ex:
             logger.error(ex)
@@ -696,7 +1087,13 @@ class FileManager(QObject):
         a failure signal.
         """
         try:
-            microfs.put(local_filename, target=target, serial=self.serial)
+            self.ensure_session()
+            microfs.put(
+                local_filename,
+                target=target,
+                serial=self.serial,
+                callback=self.transfer_progress(local_filename),
+            )
             self.on_put_file.emit(os.path.basename(local_filename))
         except Exception as ex:
             logger.error(ex)
@@ -708,8 +1105,29 @@ class FileManager(QObject):
         of the file when complete, or emit a failure signal.
         """
         try:
+            self.ensure_session()
             microfs.rm(device_filename, serial=self.serial)
             self.on_delete_file.emit(device_filename)
         except Exception as ex:
             logger.error(ex)
             self.on_delete_fail.emit(device_filename)
+
+    def sync(self, directory, dry_run=False):
+        """
+        Copy the files in the referenced local directory onto the device if
+        they're new or changed. If dry_run is True, only work out what would
+        be copied. Emit the resulting report or a failure signal.
+        """
+        try:
+            self.ensure_session()
+            manifest = os.path.join(config.DATA_DIR, "sync_manifest.json")
+            report = microfs.sync(
+                directory,
+                serial=self.serial,
+                dry_run=dry_run,
+                manifest=manifest,
+            )
+            self.on_sync.emit(tuple(report), dry_run)
+        except Exception as ex:
+            logger.error(ex)
+            self.on_sync_fail.emit(directory)
@@ -20,7 +20,7 @@ import logging
 from mu.modes.base import MicroPythonMode, FileManager
 from mu.modes.api import ESP_APIS, SHARED_APIS
 from mu.interface.panes import CHARTS
-from PyQt5.QtCore import QThread
+from PyQt5.QtCore import QThread, QMetaObject, Qt
 import os
 
 
@@ -37,6 +37,8 @@ class ESPMode(MicroPythonMode):
     description = _("Write MicroPython on ESP8266/ESP32 boards.")
     icon = "esp"
     fs = None
+    file_manager = None
+    file_manager_thread = None
 
     # The below list defines the supported devices, however, many
     # devices are using the exact same FTDI USB-interface, with vendor
@@ -182,11 +184,7 @@ class ESPMode(MicroPythonMode):
             )
             self.view.show_message(message, information)
             return
-        python_script = tab.text().split("\n")
-        if not self.repl:
-            self.toggle_repl(None)
-        if self.repl and self.connection:
-            self.connection.send_commands(python_script)
+        self.run_script(tab.text())
 
     def toggle_files(self, event):
         """
@@ -260,6 +258,13 @@ class ESPMode(MicroPythonMode):
         Remove the file system navigator from the UI.
         """
         self.view.remove_filesystem()
+        if self.file_manager_thread:
+            # Hand the device back to its normal REPL before stopping.
+            QMetaObject.invokeMethod(
+                self.file_manager, "on_stop", Qt.BlockingQueuedConnection
+            )
+            self.file_manager_thread.quit()
+            self.file_manager_thread.wait()
         self.file_manager = None
         self.file_manager_thread = None
         self.fs = None
@@ -19,9 +19,11 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 import os
 import sys
+import time
 import os.path
 import logging
 import semver
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tokenize import TokenError
 from mu.logic import sniff_newline_convention
 from mu.contrib import uflash, microfs
@@ -29,7 +31,8 @@ from mu.modes.api import MICROBIT_APIS, SHARED_APIS
 from mu.modes.base import MicroPythonMode, FileManager
 from mu.interface.panes import CHARTS
 from .. import config
-from PyQt5.QtCore import QThread, pyqtSignal, QTimer
+from PyQt5.QtCore import QThread, pyqtSignal, QTimer, QMetaObject, Qt
+from PyQt5.QtSerialPort import QSerialPortInfo
 
 # We can run without nudatus
 can_minify = True
@@ -80,6 +83,130 @@ class DeviceFlasher(QThread):
             self.on_flash_fail.emit(str(ex))
 
 
+def minify_script(python_script):
+    """
+    Returns the bytes of the given Python script minified, or the TokenError
+    raised if it can't be.
+    """
+    try:
+        return nudatus.mangle(python_script.decode("utf-8")).encode("utf-8")
+    except TokenError as e:
+        return e
+
+
+class Minifier(QThread):
+    """
+    Used to minify a script without blocking the UI.
+    """
+
+    # Emitted with the digest of the script and the result of minifying it.
+    on_minified = pyqtSignal(str, object)
+
+    def __init__(self, python_script):
+        QThread.__init__(self)
+        self.python_script = python_script
+        self.key = uflash.digest(python_script)
+        self.result = None
+
+    def run(self):
+        """
+        Minify the script.
+        """
+        self.result = minify_script(self.python_script)
+        self.on_minified.emit(self.key, self.result)
+
+
+class MultiDeviceFlasher(QThread):
+    """
+    Used to flash the same hex onto many micro:bits at once in a non-blocking
+    manner.
+    """
+
+    # Emitted with the path to a micro:bit once its hex has been written.
+    on_device_written = pyqtSignal(str)
+    # Emitted with the path to a micro:bit, and why, if writing to it failed.
+    on_device_fail = pyqtSignal(str, str)
+    max_workers = 8  #: The most micro:bits written to at the same time.
+
+    def __init__(self, paths_to_microbits, python_script, path_to_runtime):
+        """
+        The paths_to_microbits should be a list containing filesystem paths to
+        attached micro:bits to flash. The python_script should be the bytes
+        of the script to embed in the hex. The path_to_runtime should be the
+        path of the hex file for the MicroPython runtime to use (or None, for
+        the runtime bundled with Mu).
+        """
+        QThread.__init__(self)
+        self.paths_to_microbits = paths_to_microbits
+        self.python_script = python_script
+        self.path_to_runtime = path_to_runtime
+
+    def run(self):
+        """
+        Generate the hex once, then write it to the micro:bits from a pool of
+        at most max_workers threads.
+        """
+        try:
+            if self.path_to_runtime:
+                with open(self.path_to_runtime) as runtime_file:
+                    runtime = runtime_file.read()
+            else:
+                runtime = uflash.get_runtime()
+            micropython_hex = uflash.generate_hex(runtime, self.python_script)
+        except Exception as ex:
+            logger.error(ex)
+            for path in self.paths_to_microbits:
+                self.on_device_fail.emit(path, str(ex))
+            return
+        workers = min(self.max_workers, len(self.paths_to_microbits))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(
+                    uflash.save_hex,
+                    micropython_hex,
+                    os.path.join(path, "micropython.hex"),
+                ): path
+                for path in self.paths_to_microbits
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    future.result()
+                except Exception as ex:
+                    # As with DeviceFlasher, catch everything so the other
+                    # micro:bits are still flashed.
+                    logger.error(ex)
+                    self.on_device_fail.emit(path, str(ex))
+                else:
+                    self.on_device_written.emit(path)
+
+
+class FleetProbe(QThread):
+    """
+    Used to find which micro:bits are mounted without blocking the UI, since
+    listing the drives and reading each one's details can be slow.
+    """
+
+    # Emitted with the set of the IDs of the mounted micro:bits (or their
+    # paths, for those whose ID can't be read).
+    on_probed = pyqtSignal(object)
+
+    def run(self):
+        """
+        Find the mounted micro:bits.
+        """
+        try:
+            mounted = {
+                uflash.board_id(path) or path
+                for path in uflash.find_microbits()
+            }
+        except Exception as ex:
+            # Try again on the next check.
+            logger.error(ex)
+            return
+        self.on_probed.emit(mounted)
+
+
 class MicrobitMode(MicroPythonMode):
     """
     Represents the functionality required by the micro:bit mode.
@@ -90,8 +217,21 @@ class MicrobitMode(MicroPythonMode):
     description = _("Write MicroPython for the BBC micro:bit.")
     icon = "microbit"
     fs = None  #: Reference to filesystem navigator.
+    file_manager = None
+    file_manager_thread = None
     flash_thread = None
     flash_timer = None
+    flash_watch = None  #: What's known of the micro:bit being flashed.
+    flash_poll_interval = 100  #: Milliseconds between checks while flashing.
+    flash_fallback = 10  #: Seconds to wait if a restart can't be observed.
+    flash_timeout = 60  #: Most seconds to wait for a micro:bit to restart.
+    fleet = None  #: The state of each micro:bit being flashed, by its ID.
+    fleet_boards = None  #: The ID of the micro:bit at each path flashed.
+    fleet_deadlines = None  #: When each written micro:bit should restart by.
+    fleet_errors = None  #: Why each micro:bit that failed couldn't flash.
+    fleet_timeout = 60  #: Seconds for a written micro:bit to restart.
+    fleet_poll_interval = 1000  #: Milliseconds between checks of the fleet.
+    fleet_probe = None  #: The thread finding the mounted micro:bits.
     file_extensions = ["hex"]
 
     # Device name should only be supplied for modes
@@ -104,6 +244,21 @@ class MicrobitMode(MicroPythonMode):
 
     python_script = ""
 
+    minify_delay = (
+        500  #: Milliseconds after an edit to minify in the background.
+    )
+    minify_cache_size = 8  #: The most minified scripts to keep.
+    minify_thread = None
+    minify_timer = None
+
+    def __init__(self, editor, view):
+        super().__init__(editor, view)
+        # The MicroPython version on each board, keyed by serial number.
+        self.board_versions = {}
+        # The results of minifying scripts (see minify_script), keyed by the
+        # digest of the script.
+        self.minified = {}
+
     def actions(self):
         """
         Return an ordered list of actions provided by this module. An action
@@ -117,6 +272,15 @@ class MicrobitMode(MicroPythonMode):
                 "handler": self.flash,
                 "shortcut": "F3",
             },
+            {
+                "name": "flash_all",
+                "display_name": _("Flash All"),
+                "description": _(
+                    "Flash your code onto every connected micro:bit."
+                ),
+                "handler": self.flash_all,
+                "shortcut": "Shift+F3",
+            },
             {
                 "name": "files",
                 "display_name": _("Files"),
@@ -184,9 +348,8 @@ class MicrobitMode(MicroPythonMode):
             message = _('Unable to flash "{}"').format(tab.label)
             if minify and can_minify:
                 orginal = len(python_script)
-                script = python_script.decode("utf-8")
                 try:
-                    mangled = nudatus.mangle(script).encode("utf-8")
+                    mangled = self.minify(python_script)
                 except TokenError as e:
                     msg, (line, col) = e.args
                     logger.debug("Minify failed")
@@ -264,27 +427,15 @@ class MicrobitMode(MicroPythonMode):
             logger.info("Checking target device.")
             # Get the version of MicroPython on the device.
             try:
-                version_info = microfs.version()
-                logger.info(version_info)
-                board_info = version_info["version"].split()
-                if board_info[0] == "micro:bit" and board_info[1].startswith(
-                    "v"
-                ):
-                    # New style versions, so the correct information will be
-                    # in the "release" field.
-                    try:
-                        # Check the release is a correct semantic version.
-                        semver.parse(version_info["release"])
-                        board_version = version_info["release"]
-                    except ValueError:
-                        # If it's an invalid semver, set to unknown version to
-                        # force flash.
-                        board_version = "0.0.1"
-                else:
-                    # 0.0.1 indicates an old unknown version. This is just a
-                    # valid arbitrary flag for semver comparison a couple of
-                    # lines below.
-                    board_version = "0.0.1"
+                # The version of a board is cached (keyed by its serial
+                # number) until it's next flashed with a new runtime.
+                board_version = None
+                if port:
+                    board_version = self.board_versions.get(serial_number)
+                if board_version is None:
+                    board_version = self.get_board_version()
+                    if port:
+                        self.board_versions[serial_number] = board_version
                 logger.info("Board MicroPython: {}".format(board_version))
                 logger.info(
                     "Mu MicroPython: {}".format(uflash.MICROPYTHON_VERSION)
@@ -318,9 +469,11 @@ class MicrobitMode(MicroPythonMode):
                 force_flash = True
             # If we need to flash the device with a clean hex, do so now.
             if force_flash:
+                if port:
+                    self.board_versions.pop(serial_number, None)
                 logger.info("Flashing new MicroPython runtime onto device")
                 self.editor.show_status_message(message, 10)
-                self.set_buttons(flash=False)
+                self.set_buttons(flash=False, flash_all=False)
                 if user_defined_microbit_path or not port:
                     # The user has provided a path to a location on the
                     # filesystem. In this case save the combined hex/script
@@ -375,13 +528,9 @@ class MicrobitMode(MicroPythonMode):
                         # defined location on the local filesystem.
                         self.flash_thread.finished.connect(self.flash_finished)
                     else:
-                        # Other platforms don't block, so schedule the finish
-                        # call for 10 seconds (approximately how long flashing
-                        # the connected device takes).
-                        self.flash_timer = QTimer()
-                        self.flash_timer.timeout.connect(self.flash_finished)
-                        self.flash_timer.setSingleShot(True)
-                        self.flash_timer.start(10000)
+                        # Other platforms don't block, so watch for the
+                        # device to restart once it has flashed the hex.
+                        self.watch_flash(path_to_microbit, port)
                 self.flash_thread.on_flash_fail.connect(self.flash_failed)
                 self.flash_thread.start()
             else:
@@ -394,6 +543,7 @@ class MicrobitMode(MicroPythonMode):
                     logger.warning("Could not copy file to device.")
                     logger.error(ioex)
                     logger.info("Falling back to old-style flashing.")
+                    self.board_versions.pop(serial_number, None)
                     self.flash_thread = DeviceFlasher(
                         [path_to_microbit], self.python_script, rt_hex_path
                     )
@@ -402,10 +552,7 @@ class MicrobitMode(MicroPythonMode):
                         # Windows blocks on write.
                         self.flash_thread.finished.connect(self.flash_finished)
                     else:
-                        self.flash_timer = QTimer()
-                        self.flash_timer.timeout.connect(self.flash_finished)
-                        self.flash_timer.setSingleShot(True)
-                        self.flash_timer.start(10000)
+                        self.watch_flash(path_to_microbit, port)
                     self.flash_thread.on_flash_fail.connect(self.flash_failed)
                     self.flash_thread.start()
                 except Exception as ex:
@@ -427,40 +574,302 @@ class MicrobitMode(MicroPythonMode):
             )
             self.view.show_message(message, information)
 
+    def get_board_version(self):
+        """
+        Returns the version of MicroPython on the connected micro:bit.
+        """
+        version_info = microfs.version()
+        logger.info(version_info)
+        board_info = version_info["version"].split()
+        if board_info[0] == "micro:bit" and board_info[1].startswith("v"):
+            # New style versions, so the correct information will be
+            # in the "release" field.
+            try:
+                # Check the release is a correct semantic version.
+                semver.parse(version_info["release"])
+                return version_info["release"]
+            except ValueError:
+                # If it's an invalid semver, set to unknown version to
+                # force flash.
+                return "0.0.1"
+        # 0.0.1 indicates an old unknown version. This is just a valid
+        # arbitrary flag for semver comparison.
+        return "0.0.1"
+
+    def watch_flash(self, path_to_microbit, port):
+        """
+        Call flash_finished once the micro:bit restarts after a hex is written
+        to it. Its drive disappears while it flashes the hex, then reappears
+        (along with its serial port) once it's running again.
+
+        If neither can be seen to go away, wait flash_fallback seconds (about
+        as long as flashing takes) instead.
+        """
+        self.flash_watch = {
+            "path": path_to_microbit,
+            "port": port,
+            "restarting": False,
+            "start": time.monotonic(),
+        }
+        self.flash_timer = QTimer()
+        self.flash_timer.timeout.connect(self.check_flash)
+        self.flash_timer.start(self.flash_poll_interval)
+
+    def check_flash(self):
+        """
+        Check whether the micro:bit being flashed has restarted.
+        """
+        if self.flash_thread and self.flash_thread.isRunning():
+            # Still writing the hex, so only start counting once it's done.
+            self.flash_watch["start"] = time.monotonic()
+            return
+        port = self.flash_watch["port"]
+        mounted = os.path.exists(self.flash_watch["path"])
+        connected = port is None or port in [
+            self.port_path(p.portName())
+            for p in QSerialPortInfo.availablePorts()
+        ]
+        elapsed = time.monotonic() - self.flash_watch["start"]
+        if not (mounted and connected):
+            self.flash_watch["restarting"] = True
+        elif self.flash_watch["restarting"] or elapsed > self.flash_fallback:
+            logger.info("Flash finished after {:.1f}s".format(elapsed))
+            self.flash_finished()
+            return
+        if elapsed > self.flash_timeout:
+            logger.warning("The micro:bit didn't restart after flashing.")
+            self.flash_finished()
+
     def flash_finished(self):
         """
         Called when the thread used to flash the micro:bit has finished.
         """
-        self.set_buttons(flash=True)
+        self.set_buttons(flash=True, flash_all=True)
         self.editor.show_status_message(_("Finished flashing."))
+        if self.flash_timer:
+            self.flash_timer.stop()
         self.flash_thread = None
         self.flash_timer = None
+        self.flash_watch = None
         if self.python_script:
             try:
                 self.copy_main()
             except Exception as ex:
                 self.flash_failed(ex)
 
+    def flash_all(self):
+        """
+        Flashes the script in the currently active tab, embedded in the
+        MicroPython runtime, onto every attached micro:bit at once.
+
+        A micro:bit's drive disappears while it flashes the hex written to it
+        and reappears once it restarts, so that's when it counts as flashed.
+        """
+        tab = self.view.current_tab
+        if tab is None:
+            # There is no active text editor. Exit.
+            return
+        python_script = tab.text().encode("utf-8")
+        if (
+            len(python_script) >= uflash._MAX_SIZE
+            and uflash.get_minifier()
+            and self.editor.minify
+        ):
+            try:
+                python_script = self.minify(python_script)
+            except TokenError as e:
+                msg, (line, col) = e.args
+                logger.exception(e)
+                message = _("Problem with script")
+                information = _("{} [{}:{}]").format(msg, line, col)
+                self.view.show_message(message, information, "Warning")
+                return
+        if len(python_script) >= uflash._MAX_SIZE:
+            message = _('Unable to flash "{}"').format(tab.label)
+            information = _("Your script is too long!")
+            self.view.show_message(message, information, "Warning")
+            return
+        paths_to_microbits = uflash.find_microbits()
+        boards = [
+            device
+            for device in self.editor.connected_devices
+            if device.short_mode_name == self.short_name
+        ]
+        logger.info(
+            "Flashing {} micro:bits (of {} connected): {}".format(
+                len(paths_to_microbits), len(boards), paths_to_microbits
+            )
+        )
+        if not paths_to_microbits:
+            message = _("Could not find an attached BBC micro:bit.")
+            information = _(
+                "Please ensure you leave enough time for the BBC"
+                " micro:bit to be attached and configured"
+                " correctly by your computer. This may take"
+                " several seconds."
+            )
+            self.view.show_message(message, information)
+            return
+        rt_hex_path = self.editor.microbit_runtime.strip()
+        if not (rt_hex_path and os.path.exists(rt_hex_path)):
+            rt_hex_path = None
+        # Mount points can be reassigned as the micro:bits restart, so each
+        # is tracked by its ID (or by its path, if the ID can't be read).
+        self.fleet_boards = {
+            path: uflash.board_id(path) or path for path in paths_to_microbits
+        }
+        self.fleet = {board: "writing" for board in self.fleet_boards.values()}
+        self.fleet_deadlines = {}
+        self.fleet_errors = {}
+        self.set_buttons(flash=False, flash_all=False)
+        self.flash_thread = MultiDeviceFlasher(
+            paths_to_microbits, python_script, rt_hex_path
+        )
+        self.flash_thread.on_device_written.connect(self.device_written)
+        self.flash_thread.on_device_fail.connect(self.device_flash_failed)
+        self.flash_timer = QTimer()
+        self.flash_timer.timeout.connect(self.check_fleet)
+        self.flash_timer.start(self.fleet_poll_interval)
+        self.flash_thread.start()
+        self.show_fleet_progress()
+
+    def device_written(self, path):
+        """
+        Called when the hex has been written to the micro:bit at the given
+        path, which should now disappear and reappear as it flashes.
+        """
+        if not self.fleet:
+            return
+        board = self.fleet_boards[path]
+        if self.fleet[board] == "writing":
+            self.fleet[board] = "written"
+            self.fleet_deadlines[board] = time.monotonic() + self.fleet_timeout
+
+    def device_flash_failed(self, path, error):
+        """
+        Called when flashing the micro:bit at the given path fails.
+        """
+        if not self.fleet:
+            return
+        board = self.fleet_boards[path]
+        if self.fleet[board] == "failed":
+            return
+        self.fleet[board] = "failed"
+        self.fleet_errors[board] = error
+        self.show_fleet_progress()
+
+    def check_fleet(self):
+        """
+        Fail any micro:bits that haven't restarted within fleet_timeout
+        seconds of their hex being written, and look for the drives of the
+        others (in a FleetProbe, so a slow drive doesn't block the UI).
+        """
+        waiting = ("written", "restarting")
+        if not any(state in waiting for state in self.fleet.values()):
+            return
+        now = time.monotonic()
+        changed = False
+        for board, state in self.fleet.items():
+            if state in waiting and now > self.fleet_deadlines[board]:
+                self.fleet[board] = "failed"
+                self.fleet_errors[board] = _("The micro:bit didn't restart.")
+                changed = True
+        if changed:
+            self.show_fleet_progress()
+        if self.fleet and self.fleet_probe is None:
+            self.fleet_probe = FleetProbe()
+            self.fleet_probe.on_probed.connect(self.fleet_probed)
+            self.fleet_probe.finished.connect(self.fleet_probe_finished)
+            self.fleet_probe.start()
+
+    def fleet_probed(self, mounted):
+        """
+        Follow the drives of the micro:bits being flashed as they disappear
+        and reappear, given the IDs of those that are mounted.
+        """
+        if not self.fleet:
+            return
+        changed = False
+        for board, state in self.fleet.items():
+            if state == "written" and board not in mounted:
+                self.fleet[board] = "restarting"
+                changed = True
+            elif state == "restarting" and board in mounted:
+                self.fleet[board] = "done"
+                changed = True
+        if changed:
+            self.show_fleet_progress()
+
+    def fleet_probe_finished(self):
+        """
+        Called when the FleetProbe has stopped, so another can be started.
+        """
+        self.fleet_probe = None
+
+    def show_fleet_progress(self):
+        """
+        Show how many micro:bits have been flashed, and report those that
+        failed once they've all finished.
+        """
+        states = list(self.fleet.values())
+        done = states.count("done")
+        failed = states.count("failed")
+        self.editor.show_status_message(
+            _("Flashed {} of {} micro:bits ({} failed).").format(
+                done, len(states), failed
+            )
+        )
+        if done + failed < len(states):
+            return
+        self.flash_timer.stop()
+        self.flash_timer = None
+        self.flash_thread = None
+        paths = {board: path for path, board in self.fleet_boards.items()}
+        self.fleet = None
+        self.fleet_boards = None
+        self.fleet_deadlines = None
+        self.set_buttons(flash=True, flash_all=True)
+        if failed:
+            message = _("{} of {} micro:bits could not be flashed.").format(
+                failed, len(states)
+            )
+            information = "\n".join(
+                "{}: {}".format(path, error)
+                for path, error in sorted(
+                    (paths[board], error)
+                    for board, error in self.fleet_errors.items()
+                )
+            )
+            self.view.show_message(message, information, "Warning")
+
     def copy_main(self):
         """
         If the attribute self.python_script contains any code, copy it onto the
         connected micro:bit as main.py, then restart the board (CTRL-D).
+
+        The main.py already on the device is hashed first, so it's only
+        copied if it's different.
         """
         if self.python_script.strip():
             script = self.python_script
-            logger.info("Copying main.py onto device")
-            commands = ["fd = open('main.py', 'wb')", "f = fd.write"]
-            while script:
-                line = script[:64]
-                commands.append("f(" + repr(line) + ")")
-                script = script[64:]
-            commands.append("fd.close()")
-            logger.info(commands)
+            if not isinstance(script, bytes):
+                script = script.encode("utf-8")
             serial = microfs.get_serial()
-            out, err = microfs.execute(commands, serial)
-            logger.info((out, err))
-            if err:
-                raise IOError(microfs.clean_error(err))
+            # Keep the device in raw mode for both the hash and the copy.
+            microfs.start_session(serial)
+            try:
+                remote = microfs.hashes(["main.py"], serial).get("main.py")
+                if (
+                    remote
+                    and remote[1] == len(script)
+                    and microfs.content_hash(script, remote[0]) == remote[2]
+                ):
+                    logger.info("main.py on device is unchanged")
+                else:
+                    logger.info("Copying main.py onto device")
+                    microfs.put_content(script, "main.py", serial)
+            finally:
+                microfs.end_session(serial)
             # Reset the device.
             serial.write(b"import microbit\r\n")
             serial.write(b"microbit.reset()\r\n")
@@ -483,7 +892,7 @@ class MicrobitMode(MicroPythonMode):
         if self.flash_timer:
             self.flash_timer.stop()
             self.flash_timer = None
-        self.set_buttons(flash=True)
+        self.set_buttons(flash=True, flash_all=True)
         self.flash_thread = None
 
     def toggle_repl(self, event):
@@ -493,9 +902,9 @@ class MicrobitMode(MicroPythonMode):
         if self.fs is None:
             super().toggle_repl(event)
             if self.repl:
-                self.set_buttons(flash=False, files=False)
+                self.set_buttons(flash=False, flash_all=False, files=False)
             elif not (self.repl or self.plotter):
-                self.set_buttons(flash=True, files=True)
+                self.set_buttons(flash=True, flash_all=True, files=True)
         else:
             message = _("REPL and file system cannot work at the same time.")
             information = _(
@@ -513,9 +922,9 @@ class MicrobitMode(MicroPythonMode):
         if self.fs is None:
             super().toggle_plotter(event)
             if self.plotter:
-                self.set_buttons(flash=False, files=False)
+                self.set_buttons(flash=False, flash_all=False, files=False)
             elif not (self.repl or self.plotter):
-                self.set_buttons(flash=True, files=True)
+                self.set_buttons(flash=True, flash_all=True, files=True)
         else:
             message = _(
                 "The plotter and file system cannot work at the same " "time."
@@ -549,11 +958,15 @@ class MicrobitMode(MicroPythonMode):
                 self.add_fs()
                 if self.fs:
                     logger.info("Toggle filesystem on.")
-                    self.set_buttons(flash=False, repl=False, plotter=False)
+                    self.set_buttons(
+                        flash=False, flash_all=False, repl=False, plotter=False
+                    )
             else:
                 self.remove_fs()
                 logger.info("Toggle filesystem off.")
-                self.set_buttons(flash=True, repl=True, plotter=True)
+                self.set_buttons(
+                    flash=True, flash_all=True, repl=True, plotter=True
+                )
 
     def add_fs(self):
         """
@@ -590,6 +1003,13 @@ class MicrobitMode(MicroPythonMode):
         Remove the file system navigator from the UI.
         """
         self.view.remove_filesystem()
+        if self.file_manager_thread:
+            # Hand the device back to its normal REPL before stopping.
+            QMetaObject.invokeMethod(
+                self.file_manager, "on_stop", Qt.BlockingQueuedConnection
+            )
+            self.file_manager_thread.quit()
+            self.file_manager_thread.wait()
         self.file_manager = None
         self.file_manager_thread = None
         self.fs = None
@@ -620,14 +1040,123 @@ class MicrobitMode(MicroPythonMode):
         else:
             return None, None
 
+    def activate(self):
+        """
+        Invoked whenever the mode is activated.
+        """
+        super().activate()
+        # Scripts too big to flash are minified in the background once the
+        # user pauses typing, so it doesn't hold up flashing. The timer only
+        # exists while the mode is active.
+        self.minify_timer = QTimer()
+        self.minify_timer.setSingleShot(True)
+        self.minify_timer.setInterval(self.minify_delay)
+        self.minify_timer.timeout.connect(self.check_script_size)
+        self.view.text_changed.connect(self.minify_timer.start)
+        self.check_script_size()
+
     def deactivate(self):
         """
         Invoked whenever the mode is deactivated.
         """
         super().deactivate()
+        # The mode may be deactivated without ever being activated (e.g.
+        # when it's restored from the session before changing mode).
+        if self.minify_timer is not None:
+            self.view.text_changed.disconnect(self.minify_timer.start)
+            self.minify_timer.stop()
+            self.minify_timer = None
+        self.view.hide_script_size()
         if self.fs:
             self.remove_fs()
 
+    def minify(self, python_script):
+        """
+        Returns the minified bytes of the python_script, which are usually
+        already cached by minifying it in the background.
+
+        Raises a TokenError if the script can't be minified.
+        """
+        key = uflash.digest(python_script)
+        thread = self.minify_thread
+        if key not in self.minified and thread and thread.key == key:
+            # It's already being minified in the background, so wait for it.
+            thread.wait()
+            if thread.result is not None:
+                self.script_minified(key, thread.result)
+        if key not in self.minified:
+            self.script_minified(key, minify_script(python_script))
+        result = self.minified[key]
+        if isinstance(result, TokenError):
+            raise result
+        return result
+
+    def script_minified(self, key, result):
+        """
+        Cache the result of minifying the script with the given digest,
+        dropping the oldest result if there are too many.
+        """
+        self.minified[key] = result
+        if len(self.minified) > self.minify_cache_size:
+            del self.minified[next(iter(self.minified))]
+
+    def check_script_size(self):
+        """
+        Show how many bytes are left for the script in the current tab,
+        minifying it in the background if it's too big to flash otherwise.
+        """
+        tab = self.view.current_tab
+        if tab is None:
+            self.view.hide_script_size()
+            return
+        python_script = tab.text().encode("utf-8")
+        size = len(python_script)
+        minified = False
+        if (
+            size >= uflash._MAX_SIZE
+            and uflash.get_minifier()
+            and self.editor.minify
+        ):
+            result = self.minified.get(uflash.digest(python_script))
+            if result is None:
+                if self.minify_thread is None:
+                    self.minify_thread = Minifier(python_script)
+                    self.minify_thread.on_minified.connect(self.on_minified)
+                    self.minify_thread.finished.connect(
+                        self.on_minify_finished
+                    )
+                    self.minify_thread.start()
+                else:
+                    # Try again once the script being minified is done.
+                    self.minify_timer.start()
+            elif isinstance(result, bytes):
+                size = len(result)
+                minified = True
+        remaining = uflash._MAX_SIZE - size
+        if minified:
+            message = _("{} bytes free once minified").format(remaining)
+        elif remaining > 0:
+            message = _("{} bytes free").format(remaining)
+        else:
+            message = _("{} bytes too big").format(-remaining)
+        self.view.show_script_size(message)
+
+    def on_minified(self, key, result):
+        """
+        Called when a script has been minified in the background.
+        """
+        self.script_minified(key, result)
+        if self.minify_timer is not None:
+            # Only update the size shown while the mode is active.
+            self.check_script_size()
+
+    def on_minify_finished(self):
+        """
+        Called when the background minifier thread has stopped, so it's safe
+        to let go of it.
+        """
+        self.minify_thread = None
+
     def device_changed(self, new_device):
         """
         Invoked when the user changes device.
@@ -309,6 +309,7 @@ class PythonMode(BaseMode):
         Add a plotter pane.
         """
         self.view.add_python3_plotter(self)
+        self.start_plotter_capture()
         logger.info("Started plotter")
         self.plotter = True
         self.set_buttons(debug=False)
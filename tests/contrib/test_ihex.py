@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the ihex module used to read and write Intel HEX files.
+"""
+import pytest
+
+from mu.contrib import ihex
+
+
+def to_hex(records):
+    """
+    Return the text of a .hex file containing the records, ended with an end
+    of file record.
+    """
+    return "\n".join(records + [ihex.record(ihex.END_OF_FILE, 0, b"")]) + "\n"
+
+
+def test_record():
+    """
+    A record has the expected layout and checksum.
+    """
+    assert ihex.record(ihex.END_OF_FILE, 0, b"") == ":00000001FF"
+    assert (
+        ihex.record(ihex.EXTENDED_LINEAR_ADDRESS, 0, b"\x00\x03")
+        == ":020000040003F7"
+    )
+
+
+def test_encode_parse_round_trip():
+    """
+    Data encoded at an address is parsed back to the same bytes at the same
+    address, even when it crosses a 64KiB boundary.
+    """
+    data = bytes(range(256)) * 3
+    address = 0x3FF80
+    text = to_hex(ihex.encode(data, address))
+    memory = ihex.parse(text)
+    assert memory.read(address, len(data)) == data
+    assert memory.segments == [(address, data)]
+
+
+def test_encode_records():
+    """
+    The records start with an extended linear address, and each holds at
+    most RECORD_SIZE bytes.
+    """
+    records = ihex.encode(b"\x01" * 20, 0x3E000)
+    assert records[0] == ":020000040003F7"
+    assert records[1].startswith(":10E00000")
+    assert records[2].startswith(":04E01000")
+    assert len(records) == 3
+
+
+def test_parse_extended_segment_address():
+    """
+    Extended segment address records shift the address by 4 bits.
+    """
+    text = to_hex(
+        [
+            ihex.record(ihex.EXTENDED_SEGMENT_ADDRESS, 0, b"\x10\x00"),
+            ihex.record(ihex.DATA, 0x0010, b"abc"),
+        ]
+    )
+    assert ihex.parse(text).read(0x10010, 3) == b"abc"
+
+
+def test_parse_stops_at_end_of_file():
+    """
+    Records after the end of file record are ignored.
+    """
+    text = to_hex(ihex.encode(b"abc", 0)) + ihex.record(
+        ihex.DATA, 0x10, b"xyz"
+    )
+    assert ihex.parse(text).segments == [(0, b"abc")]
+
+
+def test_parse_region():
+    """
+    When a region is given, sections of the file outside it are skipped.
+    """
+    text = to_hex(ihex.encode(b"low", 0) + ihex.encode(b"high", 0x20000))
+    memory = ihex.parse(text, start=0x20000, end=0x20004)
+    assert memory.segments == [(0x20000, b"high")]
+
+
+def test_parse_bad_checksum():
+    """
+    A data record with the wrong checksum is reported as a ValueError
+    rather than silently decoded into the wrong bytes.
+    """
+    records = ihex.encode(b"abcd", 0)
+    records[1] = records[1][:-2] + "00"
+    with pytest.raises(ValueError):
+        ihex.parse(to_hex(records))
+
+
+def test_parse_bad_checksum_extended_address():
+    """
+    An extended address record with the wrong checksum is a ValueError.
+    """
+    records = ihex.encode(b"abcd", 0x30000)
+    records[0] = records[0][:-2] + "00"
+    with pytest.raises(ValueError):
+        ihex.parse(to_hex(records))
+
+
+def test_parse_corrupt_data():
+    """
+    A data byte changed in transit is caught by the record's checksum.
+    """
+    records = ihex.encode(b"abcd", 0)
+    records[1] = records[1][:9] + "62" + records[1][11:]
+    with pytest.raises(ValueError):
+        ihex.parse(to_hex(records))
+
+
+def test_MemoryMap_write_read():
+    """
+    Bytes written to the map can be read back, with gaps between them
+    filled.
+    """
+    memory = ihex.MemoryMap()
+    memory.write(0x10, b"abc")
+    memory.write(0x13, b"def")
+    memory.write(0x00, b"xy")
+    memory.write(0x20, b"")
+    assert memory.segments == [(0x00, b"xy"), (0x10, b"abcdef")]
+    assert memory.read(0x00, 2) == b"xy"
+    assert memory.read(0x0E, 6) == b"\xff\xffabcd"
+    assert memory.read(0x14, 4, fill=b"\x00") == b"ef\x00\x00"
+    assert memory.read(0x40, 2) == b"\xff\xff"
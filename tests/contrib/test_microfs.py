@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the microfs module used to manage files on a device's file system.
+"""
+import binascii
+import json
+import os
+from unittest import mock
+
+import pytest
+
+from mu.contrib import microfs
+
+
+def framed(content, block_size=4, encoding="b64"):
+    """
+    Return the output the device gives for the download_commands of the
+    referenced content.
+    """
+    lines = ["SIZE {} {}".format(len(content), encoding).encode("ascii")]
+    for i in range(0, len(content), block_size):
+        block = content[i : i + block_size]
+        if encoding == "b64":
+            payload = binascii.b2a_base64(block).strip()
+        else:
+            payload = binascii.hexlify(block)
+        lines.append(
+            "{} {} ".format(len(block), sum(block) & 0xFFFF).encode("ascii")
+            + payload
+        )
+    lines.append(b"END")
+    return b"\r\n".join(lines) + b"\r\n"
+
+
+def test_decode_download():
+    """
+    The size and blocks of a complete download are decoded.
+    """
+    content = b"\x00\x01binary\xff"
+    size, blocks, complete = microfs.decode_download(framed(content))
+    assert size == len(content)
+    assert b"".join(blocks) == content
+    assert complete
+
+
+def test_decode_download_hex():
+    """
+    Devices without binascii send the blocks as hex.
+    """
+    content = b"hello world"
+    size, blocks, complete = microfs.decode_download(
+        framed(content, encoding="hex")
+    )
+    assert b"".join(blocks) == content
+    assert complete
+
+
+def test_decode_download_corrupt_block():
+    """
+    Decoding stops at the first block that fails its checksum, and the
+    download is reported as incomplete.
+    """
+    out = framed(b"abcdefghijkl").replace(b"4 410 ZWZnaA==", b"4 411 ZWZnaA==")
+    size, blocks, complete = microfs.decode_download(out)
+    assert size == 12
+    assert blocks == [b"abcd"]
+    assert not complete
+
+
+def test_decode_download_truncated():
+    """
+    If the output stops before the END line, the download is incomplete.
+    """
+    out = framed(b"abcdefgh").replace(b"END\r\n", b"")
+    size, blocks, complete = microfs.decode_download(out)
+    assert b"".join(blocks) == b"abcdefgh"
+    assert not complete
+
+
+def test_decode_download_no_size():
+    """
+    Output without a SIZE header is never a complete download.
+    """
+    assert microfs.decode_download(b"END\r\n") == (None, [], False)
+
+
+def test_get(tmp_path):
+    """
+    The file is written to the target from the decoded blocks.
+    """
+    target = tmp_path / "data.bin"
+    content = b"\x00\xffsome data"
+    with mock.patch(
+        "mu.contrib.microfs.execute", return_value=(framed(content), b"")
+    ):
+        assert microfs.get("data.bin", str(target), serial=mock.MagicMock())
+    assert target.read_bytes() == content
+
+
+def test_get_retries_corrupt_block(tmp_path):
+    """
+    If a block is corrupted, the download is resumed from the last good one.
+    """
+    target = tmp_path / "data.bin"
+    content = b"abcdefghijkl"
+    corrupt = framed(content).replace(b"4 410", b"4 411")
+    rest = framed(content[4:]).replace(b"SIZE 8", b"SIZE 12")
+    mock_execute = mock.MagicMock(side_effect=[(corrupt, b""), (rest, b"")])
+    with mock.patch("mu.contrib.microfs.execute", mock_execute):
+        assert microfs.get("data.bin", str(target), serial=mock.MagicMock())
+    assert target.read_bytes() == content
+    assert "o = 4\n" in mock_execute.call_args_list[1][0][0][5]
+
+
+def test_get_resume(tmp_path):
+    """
+    When resuming, only the remainder of the file is fetched and appended.
+    """
+    target = tmp_path / "data.bin"
+    target.write_bytes(b"abcd")
+    rest = framed(b"efgh").replace(b"SIZE 4", b"SIZE 8")
+    mock_execute = mock.MagicMock(return_value=(rest, b""))
+    with mock.patch("mu.contrib.microfs.execute", mock_execute):
+        assert microfs.get(
+            "data.bin", str(target), serial=mock.MagicMock(), resume=True
+        )
+    assert target.read_bytes() == b"abcdefgh"
+    assert "o = 4\n" in mock_execute.call_args[0][0][5]
+
+
+def test_get_resume_larger_target(tmp_path):
+    """
+    If the target is bigger than the file on the device, it can't be a
+    partial copy, so it's truncated and the whole file is fetched again.
+    """
+    target = tmp_path / "data.bin"
+    target.write_bytes(b"a much longer stale file")
+    content = b"new data"
+    # Skipping past the end of the file on the device sends no blocks.
+    skipped = b"SIZE 8 b64\r\nEND\r\n"
+    mock_execute = mock.MagicMock(
+        side_effect=[(skipped, b""), (framed(content), b"")]
+    )
+    with mock.patch("mu.contrib.microfs.execute", mock_execute):
+        assert microfs.get(
+            "data.bin", str(target), serial=mock.MagicMock(), resume=True
+        )
+    assert target.read_bytes() == content
+    assert "o = 0\n" in mock_execute.call_args[0][0][5]
+
+
+def test_get_fails():
+    """
+    An IOError is raised if the file can't be got intact.
+    """
+    with mock.patch(
+        "mu.contrib.microfs.execute", return_value=(b"SIZE 4 b64\r\n", b"")
+    ), mock.patch("builtins.open", mock.mock_open()):
+        with pytest.raises(IOError):
+            microfs.get("data.bin", "data.bin", serial=mock.MagicMock())
+
+
+class FakeSerial:
+    """
+    A serial connection to a device that sends each of the responses in turn
+    as data is written to it.
+    """
+
+    def __init__(self, responses=(), incoming=b""):
+        self.responses = list(responses)
+        self.incoming = bytearray(incoming)
+        self.written = []
+
+    def write(self, data):
+        self.written.append(bytes(data))
+        if self.responses:
+            self.incoming += self.responses.pop(0)
+
+    def inWaiting(self):
+        return len(self.incoming)
+
+    def read(self, size=1):
+        data = bytes(self.incoming[:size])
+        del self.incoming[:size]
+        return data
+
+    def read_until(self, terminator):
+        index = self.incoming.find(terminator)
+        size = len(self.incoming) if index < 0 else index + len(terminator)
+        return self.read(size)
+
+
+def test_raw_paste_on():
+    """
+    If the device supports raw-paste mode, the size of its flow control
+    window is returned.
+    """
+    serial = FakeSerial(incoming=b"R\x01\x80\x00")
+    assert microfs.raw_paste_on(serial) == 128
+    assert serial.written == [b"\x05A\x01"]
+
+
+def test_raw_paste_on_unsupported():
+    """
+    If the device says it doesn't support raw-paste mode, None is returned.
+    """
+    serial = FakeSerial(incoming=b"R\x00")
+    assert microfs.raw_paste_on(serial) is None
+
+
+def test_raw_paste_on_old_firmware():
+    """
+    Firmware that predates raw-paste mode just shows the raw REPL banner
+    again, leaving the device in normal raw mode.
+    """
+    serial = FakeSerial(incoming=b"raw REPL; CTRL-B to exit\r\n>")
+    assert microfs.raw_paste_on(serial) is None
+    assert serial.inWaiting() == 0
+
+
+def test_raw_paste_on_fails():
+    """
+    Anything else means the device isn't in raw mode at all.
+    """
+    serial = FakeSerial(incoming=b"Traceback")
+    with pytest.raises(IOError):
+        microfs.raw_paste_on(serial)
+
+
+def test_raw_paste_write():
+    """
+    The command is written a window at a time, waiting for the device to
+    grant another window before each, then the end of data is acknowledged.
+    """
+    serial = FakeSerial(responses=[b"\x01", b"\x01", b"", b"\x04"])
+    microfs.raw_paste_write(serial, b"abcdefghij", 4)
+    assert serial.written == [b"abcd", b"efgh", b"ij", b"\x04"]
+    assert serial.inWaiting() == 0
+
+
+def test_raw_paste_write_ended_by_device():
+    """
+    If the device ends the transfer early, it's acknowledged and no more of
+    the command is sent.
+    """
+    serial = FakeSerial(responses=[b"\x04"])
+    microfs.raw_paste_write(serial, b"abcdefghij", 4)
+    assert serial.written == [b"abcd", b"\x04"]
+
+
+def test_raw_paste_write_unexpected_data():
+    """
+    Unexpected data from the device while pasting is an IOError.
+    """
+    serial = FakeSerial(responses=[b"?"])
+    with pytest.raises(IOError):
+        microfs.raw_paste_write(serial, b"abcdefghij", 4)
+
+
+def test_raw_paste_write_not_acknowledged():
+    """
+    If the device doesn't acknowledge the end of data, it's an IOError.
+    """
+    serial = FakeSerial()
+    with pytest.raises(IOError):
+        microfs.raw_paste_write(serial, b"abc", 4)
+
+
+def test_batch_commands():
+    """
+    Consecutive commands are joined into blocks of at most batch_size bytes.
+    """
+    commands = ["a = 1", "b = 2", "c = 3"]
+    assert microfs.batch_commands(commands, 12) == [
+        ("a = 1\nb = 2", 2),
+        ("c = 3", 1),
+    ]
+    assert microfs.batch_commands(["x" * 20], 12) == [("x" * 20, 1)]
+    assert microfs.batch_commands([]) == []
+
+
+def test_execute_raw_paste():
+    """
+    With raw-paste mode, the commands are batched and streamed in a single
+    evaluation.
+    """
+    serial = FakeSerial(
+        responses=[b"R\x01\x00\x01", b"", b"\x04" + b"1\r\n\x04\x04>"]
+    )
+    callback = mock.MagicMock()
+    with mock.patch.object(microfs, "RAW_SESSIONS", {serial}):
+        result = microfs.execute(["a = 1", "print(a)"], serial, callback)
+    assert result == (b"1\r\n", b"")
+    assert serial.written == [b"\x05A\x01", b"a = 1\nprint(a)", b"\x04"]
+    callback.assert_called_once_with(2, 2)
+
+
+def test_execute_raw_fallback():
+    """
+    Without raw-paste mode, each command is written in paced slices and
+    evaluated in turn.
+    """
+    serial = FakeSerial(
+        responses=[b"R\x00", b"", b"", b"OK1\r\n\x04\x04>"],
+    )
+    command = "print({})".format("1" * 30)
+    with mock.patch.object(microfs, "RAW_SESSIONS", {serial}), mock.patch(
+        "mu.contrib.microfs.time.sleep"
+    ):
+        result = microfs.execute([command], serial)
+    assert result == (b"1\r\n", b"")
+    assert serial.written == [
+        b"\x05A\x01",
+        command.encode("ascii")[:32],
+        command.encode("ascii")[32:],
+        b"\x04",
+    ]
+
+
+def test_execute_error():
+    """
+    An error from the device is returned as soon as it happens.
+    """
+    serial = FakeSerial(
+        responses=[b"R\x00", b"OK\x04Traceback\x04>"],
+    )
+    with mock.patch.object(microfs, "RAW_SESSIONS", {serial}), mock.patch(
+        "mu.contrib.microfs.time.sleep"
+    ):
+        result = microfs.execute(["1/0", "print(1)"], serial)
+    assert result == (b"", b"Traceback")
+
+
+def test_sync_corrupt_manifest(tmp_path):
+    """
+    A corrupt manifest is ignored, so every file is compared afresh, and a
+    good manifest is written in its place.
+    """
+    directory = tmp_path / "project"
+    directory.mkdir()
+    (directory / "main.py").write_bytes(b"print('hello')")
+    manifest = tmp_path / "sync_manifest.json"
+    manifest.write_text("{not json")
+    digest = microfs.local_hash(str(directory / "main.py"), "sha256")
+    remote = {"main.py": ("sha256", 14, digest)}
+    with mock.patch("mu.contrib.microfs.hashes", return_value=remote):
+        report = microfs.sync(
+            str(directory), serial=mock.MagicMock(), manifest=str(manifest)
+        )
+    assert report == [("main.py", "unchanged")]
+    path = os.path.abspath(str(directory / "main.py"))
+    assert json.loads(manifest.read_text())[path][3] == digest
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the uflash module used to flash Python scripts onto a BBC
+micro:bit.
+"""
+from unittest import mock
+
+import pytest
+
+from mu.contrib import ihex, uflash
+
+
+RUNTIME = "\n".join(
+    ihex.encode(b"\x00" * 128, 0) + [ihex.record(ihex.END_OF_FILE, 0, b"")]
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    Start each test with nothing cached.
+    """
+    uflash._runtime_cache.clear()
+    uflash._hex_cache.clear()
+    yield
+    uflash._runtime_cache.clear()
+    uflash._hex_cache.clear()
+
+
+def test_generate_hex():
+    """
+    The script is embedded in the runtime and can be extracted again.
+    """
+    result = uflash.generate_hex(RUNTIME, b"print('hello')")
+    assert uflash.extract_script(result) == "print('hello')"
+
+
+def test_generate_hex_no_script():
+    """
+    With no script, the runtime is returned unchanged.
+    """
+    assert uflash.generate_hex(RUNTIME) == RUNTIME
+
+
+def test_generate_hex_cache_hit():
+    """
+    Generating the hex for the same runtime and script again reuses the last
+    hex, and the runtime is only hashed once per call.
+    """
+    with mock.patch(
+        "mu.contrib.uflash.hexlify", wraps=uflash.hexlify
+    ) as mock_hexlify, mock.patch(
+        "mu.contrib.uflash.digest", wraps=uflash.digest
+    ) as mock_digest:
+        first = uflash.generate_hex(RUNTIME, b"print('hello')")
+        runtime_hashes = [
+            call
+            for call in mock_digest.call_args_list
+            if call[0] == (RUNTIME,)
+        ]
+        assert len(runtime_hashes) == 1
+        second = uflash.generate_hex(RUNTIME, b"print('hello')")
+    assert first is second
+    assert mock_hexlify.call_count == 1
+    assert len(uflash._hex_cache) == 1
+
+
+def test_generate_hex_cache_miss():
+    """
+    A different script, runtime or minify flag generates a new hex, and only
+    the most recent one is kept. The runtime's lines are reused.
+    """
+    with mock.patch(
+        "mu.contrib.uflash.hexlify", wraps=uflash.hexlify
+    ) as mock_hexlify:
+        first = uflash.generate_hex(RUNTIME, b"print('hello')")
+        lines = uflash._runtime_cache[uflash.digest(RUNTIME)]
+        second = uflash.generate_hex(RUNTIME, b"print('bye')")
+        assert uflash._runtime_cache[uflash.digest(RUNTIME)] is lines
+        other_runtime = RUNTIME.replace(":00000001FF", ":00000001FF\n")
+        third = uflash.generate_hex(other_runtime, b"print('bye')")
+    assert mock_hexlify.call_count == 3
+    assert uflash.extract_script(first) == "print('hello')"
+    assert uflash.extract_script(second) == "print('bye')"
+    assert uflash.extract_script(third) == "print('bye')"
+    assert len(uflash._hex_cache) == 1
+    assert len(uflash._runtime_cache) == 1
+
+
+def test_runtime_lines_key():
+    """
+    If the digest of the runtime is given, it isn't hashed again.
+    """
+    with mock.patch("mu.contrib.uflash.digest") as mock_digest:
+        lines = uflash.runtime_lines(RUNTIME, "key")
+    assert mock_digest.call_count == 0
+    assert lines == RUNTIME.split()
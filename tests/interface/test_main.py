@@ -773,6 +773,9 @@ def test_Window_add_filesystem():
     mock_fs.local_fs.list_files.connect.assert_called_once_with(
         mock_file_manager.ls
     )
+    mock_fs.local_fs.sync.connect.assert_called_once_with(
+        mock_file_manager.sync
+    )
     mock_file_manager.on_put_file.connect.assert_called_once_with(
         mock_fs.microbit_fs.on_put
     )
@@ -794,6 +797,13 @@ def test_Window_add_filesystem():
     mock_file_manager.on_get_fail.connect.assert_called_once_with(
         mock_fs.on_get_fail
     )
+    mock_file_manager.on_sync.connect.assert_called_once_with(mock_fs.on_sync)
+    mock_file_manager.on_sync_fail.connect.assert_called_once_with(
+        mock_fs.on_sync_fail
+    )
+    mock_file_manager.on_transfer_progress.connect.assert_called_once_with(
+        mock_fs.on_transfer_progress
+    )
     w.connect_zoom.assert_called_once_with(mock_fs)
 
 
@@ -1844,6 +1854,23 @@ def test_Window_show_hide_device_selector():
     assert not (window.status_bar.device_selector.isHidden())
 
 
+def test_Window_show_hide_script_size():
+    """
+    Ensure that the size of the script is shown as expected.
+    """
+    window = mu.interface.main.Window()
+    theme = "night"
+    breakpoint_toggle = mock.MagicMock()
+    window.setup(breakpoint_toggle, theme)
+
+    assert window.status_bar.size_label.isHidden()
+    window.show_script_size("100 bytes free")
+    assert not (window.status_bar.size_label.isHidden())
+    assert window.status_bar.size_label.text() == "100 bytes free"
+    window.hide_script_size()
+    assert window.status_bar.size_label.isHidden()
+
+
 def test_StatusBar_init():
     """
     Ensure the status bar is set up as expected.
@@ -1856,9 +1883,10 @@ def test_StatusBar_init():
     # Pass in the default mode.
     assert sb.mode == "foo"
 
-    # Expect two widgets for logs and mode.
+    # Expect widgets for logs, mode and the size of the script.
     assert sb.mode_label
     assert sb.logs_label
+    assert sb.size_label
 
 
 def test_StatusBar_connect_logs():
@@ -3,17 +3,18 @@
 Tests for the user interface elements of Mu.
 """
 from PyQt5.QtWidgets import QMessageBox, QLabel
-from PyQt5.QtCore import Qt, QEvent, QPointF
+from PyQt5.QtCore import Qt, QEvent, QPoint, QPointF
 from PyQt5.QtGui import QTextCursor, QMouseEvent
-from collections import deque
 from unittest import mock
 
 import sys
 import os
+import math
 import signal
 import pytest
 
 import mu
+import mu.settings
 import mu.interface.panes
 from mu import i18n
 from mu.interface.panes import CHARTS
@@ -29,6 +30,83 @@ def test_PANE_ZOOM_SIZES():
     assert len(expected_sizes) == len(mu.interface.panes.PANE_ZOOM_SIZES)
 
 
+def scrollback_pane(**values):
+    """
+    Return a plain text pane with a Scrollback using the given settings.
+    """
+    mocked_settings = mu.settings.UserSettings()
+    mocked_settings.update(values)
+    pane = mu.interface.panes.QTextEdit()
+    with mock.patch.object(mu.settings, "settings", mocked_settings):
+        scrollback = mu.interface.panes.Scrollback(pane.document(), "test")
+    return pane, scrollback
+
+
+def test_Scrollback_trim_lines():
+    """
+    Once there are more lines than the limit, lines (plus a tenth of the
+    limit) are trimmed from the top and the number of characters removed
+    returned.
+    """
+    pane, scrollback = scrollback_pane(scrollback_lines=10)
+    pane.setPlainText("\n".join(str(i) for i in range(10)))
+    assert scrollback.trim() == 0
+    pane.setPlainText("\n".join(str(i) for i in range(12)))
+    # Three lines ("0\n", "1\n" and "2\n") go.
+    assert scrollback.trim() == 6
+    assert pane.toPlainText().split("\n") == [str(i) for i in range(3, 12)]
+
+
+def test_Scrollback_trim_chars():
+    """
+    The size of the document can also be limited by characters, in which
+    case whole lines are still trimmed.
+    """
+    pane, scrollback = scrollback_pane(scrollback_lines=0, scrollback_chars=20)
+    pane.setPlainText("0123456789\nabcdefghij\nABCDEFGHIJ")
+    assert scrollback.trim() == 22
+    assert pane.toPlainText() == "ABCDEFGHIJ"
+
+
+def test_Scrollback_trim_keeps_last_line():
+    """
+    The current (last) line is never trimmed.
+    """
+    pane, scrollback = scrollback_pane(scrollback_lines=0, scrollback_chars=5)
+    pane.setPlainText("0123456789")
+    assert scrollback.trim() == 0
+    assert pane.toPlainText() == "0123456789"
+
+
+def test_Scrollback_log(tmp_path):
+    """
+    If enabled, trimmed text is written to a log file named after the pane.
+    """
+    with mock.patch("mu.interface.panes.config.DATA_DIR", str(tmp_path)):
+        pane, scrollback = scrollback_pane(
+            scrollback_lines=2, scrollback_log=True
+        )
+    pane.setPlainText("a\nb\nc\nd")
+    scrollback.trim()
+    for handler in scrollback.log.handlers:
+        handler.close()
+        scrollback.log.removeHandler(handler)
+    with open(tmp_path / "scrollback" / "test.log", encoding="utf-8") as f:
+        assert f.read() == "a\nb\n"
+
+
+def test_MicroPythonREPLPane_scrollback():
+    """
+    When output is trimmed from the top of the REPL, the device cursor
+    position is kept in step.
+    """
+    mock_repl_connection = mock.MagicMock()
+    rp = mu.interface.panes.MicroPythonREPLPane(mock_repl_connection)
+    rp.scrollback.trim = mock.MagicMock(return_value=4)
+    rp.process_tty_data(b"Hello\r\n>>> ")
+    assert rp.device_cursor_position == len("Hello\n>>> ") - 4
+
+
 def test_MicroPythonREPLPane_paste():
     """
     Pasting into the REPL should send bytes via the serial connection.
@@ -592,26 +670,60 @@ def test_MicroPythonREPLPane_process_tty_data():
     """
     mock_repl_connection = mock.MagicMock()
     mock_tc = mock.MagicMock()
-    mock_tc.movePosition = mock.MagicMock(
-        side_effect=[True, False, True, True]
-    )
-    mock_tc.deleteChar = mock.MagicMock(return_value=None)
+    mock_tc.movePosition = mock.MagicMock(side_effect=[True, True])
     rp = mu.interface.panes.MicroPythonREPLPane(mock_repl_connection)
     rp.textCursor = mock.MagicMock(return_value=mock_tc)
     rp.setTextCursor = mock.MagicMock(return_value=None)
-    rp.insertPlainText = mock.MagicMock(return_value=None)
     rp.ensureCursorVisible = mock.MagicMock(return_value=None)
     bs = bytes([8, 13, 10, 65])  # \b, \r, \n, 'A'
     rp.process_tty_data(bs)
     assert mock_tc.movePosition.call_count == 2
     assert mock_tc.movePosition.call_args_list[0][0][0] == QTextCursor.Left
     assert mock_tc.movePosition.call_args_list[1][0][0] == QTextCursor.End
-    assert rp.insertPlainText.call_count == 2
-    assert rp.insertPlainText.call_args_list[0][0][0] == chr(10)
-    assert rp.insertPlainText.call_args_list[1][0][0] == chr(65)
+    # The newline and following text are inserted as a single edit.
+    mock_tc.insertText.assert_called_once_with("\nA")
     rp.ensureCursorVisible.assert_called_once_with()
 
 
+def test_MicroPythonREPLPane_process_tty_data_runs():
+    """
+    Ensure runs of text are applied to the document as a single edit, and
+    overwrite what comes after the cursor up to the end of the line.
+    """
+    mock_repl_connection = mock.MagicMock()
+    rp = mu.interface.panes.MicroPythonREPLPane(mock_repl_connection)
+    rp.setPlainText("Hello world!\nBye")
+    rp.device_cursor_position = 6
+    rp.set_qtcursor_to_devicecursor()
+    rp.process_tty_data(b"everybody\x1b[K\r\nline 1\r\nline 2\r\n")
+    assert rp.toPlainText() == "Hello everybody\nBye\nline 1\nline 2\n"
+    assert rp.device_cursor_position == len(rp.toPlainText())
+
+
+def test_MicroPythonREPLPane_process_tty_data_coalesced():
+    """
+    Ensure data received within a frame of the last render is only rendered
+    when the render timer fires.
+    """
+    mock_repl_connection = mock.MagicMock()
+    rp = mu.interface.panes.MicroPythonREPLPane(mock_repl_connection)
+    rp.render_timer = mock.MagicMock()
+    rp.render_timer.isActive.return_value = False
+    rp.process_tty_data(b"foo")
+    assert rp.toPlainText() == "foo"
+    rp.render_timer.start.assert_called_once_with()
+    rp.render_timer.isActive.return_value = True
+    rp.process_tty_data(b"bar")
+    rp.process_tty_data(b"baz")
+    assert rp.toPlainText() == "foo"
+    rp.on_render_timer()
+    assert rp.toPlainText() == "foobarbaz"
+    assert rp.render_timer.start.call_count == 2
+    # Nothing pending, so the timer isn't restarted.
+    rp.on_render_timer()
+    assert rp.render_timer.start.call_count == 2
+
+
 def test_MicroPythonREPLPane_process_tty_data_multibyte_sequence():
     """
     Ensure multibyte unicode characters are correctly parsed, even
@@ -619,13 +731,13 @@ def test_MicroPythonREPLPane_process_tty_data_multibyte_sequence():
     """
     mock_repl_connection = mock.MagicMock()
     rp = mu.interface.panes.MicroPythonREPLPane(mock_repl_connection)
-    rp.insertPlainText = mock.MagicMock(return_value=None)
 
     # Copyright symbol: © (0xC2A9)
     rp.process_tty_data(b"\xc2")
     rp.process_tty_data(b"\xa9")
+    rp.on_render_timer()
 
-    assert rp.insertPlainText.call_args_list[0][0][0] == "©"
+    assert rp.toPlainText() == "©"
 
 
 def test_MicroPythonREPLPane_process_tty_data_handle_malformed_unicode():
@@ -635,13 +747,12 @@ def test_MicroPythonREPLPane_process_tty_data_handle_malformed_unicode():
     """
     mock_repl_connection = mock.MagicMock()
     rp = mu.interface.panes.MicroPythonREPLPane(mock_repl_connection)
-    rp.insertPlainText = mock.MagicMock(return_value=None)
 
     rp.process_tty_data(b"foo \xd8 bar")
 
     # Test that malformed input are correctly replaced with the standard
     # unicode replacement character (�, U+FFFD)
-    assert rp.insertPlainText.call_args_list[4][0][0] == u"\uFFFD"
+    assert rp.toPlainText() == u"foo \uFFFD bar"
 
 
 def test_MicroPythonREPLPane_process_tty_data_VT100():
@@ -835,6 +946,7 @@ def test_MicroPythonREPLPane_process_tty_data_partial_reception():
     # Receive [4C - 4 times right
     bs = b"[4C"
     rp.process_tty_data(bs)
+    rp.on_render_timer()
     assert rp.unprocessed_input == ""
     assert rp.toPlainText() == "Hello world!"
     assert rp.textCursor().position() == 9
@@ -862,6 +974,7 @@ def test_MicroPythonREPLPane_process_tty_data_partial_reception2():
     # Receive 4C - 4 times right
     bs = b"4C"
     rp.process_tty_data(bs)
+    rp.on_render_timer()
     assert rp.unprocessed_input == ""
     assert rp.toPlainText() == "Hello world!"
     assert rp.textCursor().position() == 9
@@ -925,11 +1038,19 @@ def test_MicroPythonREPLPane_set_zoom():
     rp.set_font_size.assert_called_once_with(expected)
 
 
-def test_MuFileList_show_confirm_overwrite_dialog():
+@pytest.mark.parametrize(
+    "file_list",
+    [
+        lambda: mu.interface.panes.MuFileList(),
+        lambda: mu.interface.panes.MicroPythonDeviceFileList("home/path"),
+    ],
+)
+def test_FileListMixin_show_confirm_overwrite_dialog(file_list):
     """
-    Ensure the user is notified of an existing file.
+    Ensure the user is notified of an existing file, by either type of file
+    listing.
     """
-    mfl = mu.interface.panes.MuFileList()
+    mfl = file_list()
     mock_qmb = mock.MagicMock()
     mock_qmb.setIcon = mock.MagicMock(return_value=None)
     mock_qmb.setText = mock.MagicMock(return_value=None)
@@ -960,6 +1081,7 @@ def test_MicroPythonDeviceFileList_dropEvent():
     Ensure a valid drop event is handled as expected.
     """
     mock_event = mock.MagicMock()
+    mock_event.pos.return_value = QPoint(0, 0)
     source = mu.interface.panes.LocalFileList("homepath")
     mock_item = mock.MagicMock()
     mock_item.text.return_value = "foo.py"
@@ -973,7 +1095,60 @@ def test_MicroPythonDeviceFileList_dropEvent():
     mfs.dropEvent(mock_event)
     fn = os.path.join("homepath", "foo.py")
     assert mfs.set_message.emit.call_count == 1
-    mfs.put.emit.assert_called_once_with(fn)
+    mfs.put.emit.assert_called_once_with(fn, "foo.py")
+
+
+def test_MicroPythonDeviceFileList_dropEvent_directory():
+    """
+    A file dropped onto a directory (or a file within it) is copied into
+    that directory on the device.
+    """
+    mfs = mu.interface.panes.MicroPythonDeviceFileList("homepath")
+    mfs.set_files([("lib", 0, True), ("lib/bar.py", 10, False)])
+    directory = mfs.topLevelItem(0)
+    mfs.expandItem(directory)
+    assert mfs.target_directory(directory) == "lib"
+    assert mfs.target_directory(directory.child(0)) == "lib"
+    assert mfs.target_directory(None) == ""
+    mock_event = mock.MagicMock()
+    source = mu.interface.panes.LocalFileList("homepath")
+    mock_item = mock.MagicMock()
+    mock_item.text.return_value = "foo.py"
+    source.currentItem = mock.MagicMock(return_value=mock_item)
+    mock_event.source.return_value = source
+    mfs.itemAt = mock.MagicMock(return_value=directory)
+    mfs.put = mock.MagicMock()
+    mfs.dropEvent(mock_event)
+    fn = os.path.join("homepath", "foo.py")
+    mfs.put.emit.assert_called_once_with(fn, "lib/foo.py")
+
+
+def test_MicroPythonDeviceFileList_set_files():
+    """
+    The entries listed from the device are shown as a tree whose directories
+    are only populated when expanded.
+    """
+    mfs = mu.interface.panes.MicroPythonDeviceFileList("homepath")
+    mfs.set_files(
+        [
+            ("main.py", 42, False),
+            ("lib", 0, True),
+            ("lib/foo.py", 10, False),
+            ("lib/sub", 0, True),
+        ]
+    )
+    assert mfs.topLevelItemCount() == 2
+    directory = mfs.topLevelItem(0)
+    assert directory.text(0) == "lib"
+    assert directory.childCount() == 0
+    main = mfs.topLevelItem(1)
+    assert main.text(0) == "main.py"
+    assert main.text(1) == "42"
+    assert main.data(0, Qt.UserRole) == "main.py"
+    mfs.expandItem(directory)
+    assert directory.childCount() == 2
+    assert directory.child(0).data(0, Qt.UserRole) == "lib/sub"
+    assert directory.child(1).data(0, Qt.UserRole) == "lib/foo.py"
 
 
 def test_MicroPythonDeviceFileList_dropEvent_wrong_source():
@@ -1014,7 +1189,7 @@ def test_MicroPythonDeviceFileList_contextMenuEvent():
     mock_menu.exec_.return_value = mock_action
     mfs = mu.interface.panes.MicroPythonDeviceFileList("homepath")
     mock_current = mock.MagicMock()
-    mock_current.text.return_value = "foo.py"
+    mock_current.data.return_value = "foo.py"
     mfs.currentItem = mock.MagicMock(return_value=mock_current)
     mfs.disable = mock.MagicMock()
     mfs.set_message = mock.MagicMock()
@@ -1057,7 +1232,7 @@ def test_LocalFileList_dropEvent():
     mock_event = mock.MagicMock()
     source = mu.interface.panes.MicroPythonDeviceFileList("homepath")
     mock_item = mock.MagicMock()
-    mock_item.text.return_value = "foo.py"
+    mock_item.data.return_value = "lib/foo.py"
     source.currentItem = mock.MagicMock(return_value=mock_item)
     mock_event.source.return_value = source
     lfs = mu.interface.panes.LocalFileList("homepath")
@@ -1069,7 +1244,22 @@ def test_LocalFileList_dropEvent():
     fn = os.path.join("homepath", "foo.py")
     lfs.disable.emit.assert_called_once_with()
     assert lfs.set_message.emit.call_count == 1
-    lfs.get.emit.assert_called_once_with("foo.py", fn)
+    lfs.get.emit.assert_called_once_with("lib/foo.py", fn)
+
+
+def test_LocalFileList_dropEvent_directory():
+    """
+    Directories on the device cannot be copied to the local file system.
+    """
+    mock_event = mock.MagicMock()
+    source = mu.interface.panes.MicroPythonDeviceFileList("homepath")
+    source.set_files([("lib", 0, True)])
+    source.setCurrentItem(source.topLevelItem(0))
+    mock_event.source.return_value = source
+    lfs = mu.interface.panes.LocalFileList("homepath")
+    lfs.get = mock.MagicMock()
+    lfs.dropEvent(mock_event)
+    assert lfs.get.emit.call_count == 0
 
 
 def test_LocalFileList_dropEvent_wrong_source():
@@ -1115,6 +1305,8 @@ def test_LocalFileList_contextMenuEvent():
         mock_action_first,
         mock_action_second,
         mock_action_third,
+        mock.MagicMock(),
+        mock.MagicMock(),
     ]
     mock_menu.exec_.return_value = mock_action_first
     mfs = mu.interface.panes.LocalFileList("homepath")
@@ -1140,7 +1332,11 @@ def test_LocalFileList_contextMenuEvent_external():
     """
     mock_menu = mock.MagicMock()
     mock_action = mock.MagicMock()
-    mock_menu.addAction.side_effect = [mock_action, mock.MagicMock()]
+    mock_menu.addAction.side_effect = [
+        mock_action,
+        mock.MagicMock(),
+        mock.MagicMock(),
+    ]
     mock_menu.exec_.return_value = mock_action
     mfs = mu.interface.panes.LocalFileList("homepath")
     mock_open = mock.MagicMock()
@@ -1172,6 +1368,8 @@ def test_LocalFileList_contextMenuEvent_write_to_mainpy():
         mock_action_first,
         mock_action_second,
         mock_action_third,
+        mock.MagicMock(),
+        mock.MagicMock(),
     ]
     mock_menu.exec_.return_value = mock_action_second
     mfs = mu.interface.panes.LocalFileList("homepath")
@@ -1190,6 +1388,32 @@ def test_LocalFileList_contextMenuEvent_write_to_mainpy():
     )
 
 
+@pytest.mark.parametrize("action_index, dry_run", [(1, False), (2, True)])
+def test_LocalFileList_contextMenuEvent_sync(action_index, dry_run):
+    """
+    Ensure that the sync signal is emitted for the home directory when the
+    sync (or preview sync) menu item is activated by a user.
+    """
+    mock_menu = mock.MagicMock()
+    actions = [mock.MagicMock() for i in range(3)]
+    mock_menu.addAction.side_effect = actions
+    mock_menu.exec_.return_value = actions[action_index]
+    mfs = mu.interface.panes.LocalFileList("homepath")
+    mfs.sync = mock.MagicMock()
+    mfs.disable = mock.MagicMock()
+    mfs.set_message = mock.MagicMock()
+    mock_current = mock.MagicMock()
+    mock_current.text.return_value = "foo.txt"
+    mfs.currentItem = mock.MagicMock(return_value=mock_current)
+    mfs.mapToGlobal = mock.MagicMock()
+    mock_event = mock.MagicMock()
+    with mock.patch("mu.interface.panes.QMenu", return_value=mock_menu):
+        mfs.contextMenuEvent(mock_event)
+    mfs.disable.emit.assert_called_once_with()
+    assert mfs.set_message.emit.call_count == 1
+    mfs.sync.emit.assert_called_once_with("homepath", dry_run)
+
+
 def test_FileSystemPane_init():
     """
     Check things are set up as expected.
@@ -1284,7 +1508,7 @@ def test_FileSystemPane_on_ls():
     handler.
     """
     fsp = mu.interface.panes.FileSystemPane("homepath")
-    microbit_files = ["foo.py", "bar.py"]
+    microbit_files = [("foo.py", 10, False), ("bar.py", 20, False)]
     fsp.microbit_fs = mock.MagicMock()
     fsp.local_fs = mock.MagicMock()
     fsp.enable = mock.MagicMock()
@@ -1295,9 +1519,8 @@ def test_FileSystemPane_on_ls():
         "mu.interface.panes.os.path.isfile", mock_isfile
     ):
         fsp.on_ls(microbit_files)
-    fsp.microbit_fs.clear.assert_called_once_with()
+    fsp.microbit_fs.set_files.assert_called_once_with(microbit_files)
     fsp.local_fs.clear.assert_called_once_with()
-    assert fsp.microbit_fs.addItem.call_count == 2
     assert fsp.local_fs.addItem.call_count == 2
     fsp.enable.assert_called_once_with()
 
@@ -1314,6 +1537,57 @@ def test_FileSystemPane_on_ls_fail():
     fsp.disable.assert_called_once_with()
 
 
+def test_FileSystemPane_on_sync():
+    """
+    Once a folder is synced the number of copied files is shown and the
+    files on the device listed again.
+    """
+    fsp = mu.interface.panes.FileSystemPane("homepath")
+    fsp.show_message = mock.MagicMock()
+    fsp.list_files = mock.MagicMock()
+    report = (("a.py", "new"), ("b.py", "changed"), ("c.py", "unchanged"))
+    fsp.on_sync(report, False)
+    fsp.show_message.assert_called_once_with(
+        "Synced 2 of 3 files to the device."
+    )
+    fsp.list_files.emit.assert_called_once_with()
+
+
+def test_FileSystemPane_on_sync_dry_run():
+    """
+    A preview of a sync names the files that would be copied and enables the
+    widget again without touching the device.
+    """
+    fsp = mu.interface.panes.FileSystemPane("homepath")
+    fsp.show_message = mock.MagicMock()
+    fsp.list_files = mock.MagicMock()
+    fsp.enable = mock.MagicMock()
+    report = (("a.py", "new"), ("b.py", "changed"), ("c.py", "unchanged"))
+    fsp.on_sync(report, True)
+    fsp.show_message.assert_called_once_with(
+        "Syncing would copy 2 of 3 files: a.py, b.py."
+    )
+    fsp.enable.assert_called_once_with()
+    assert fsp.list_files.emit.call_count == 0
+    fsp.show_message.reset_mock()
+    fsp.on_sync((("c.py", "unchanged"),), True)
+    fsp.show_message.assert_called_once_with(
+        "The device is already up to date."
+    )
+
+
+def test_FileSystemPane_on_sync_fail():
+    """
+    A warning is emitted and the widget enabled if syncing a folder fails.
+    """
+    fsp = mu.interface.panes.FileSystemPane("homepath")
+    fsp.show_warning = mock.MagicMock()
+    fsp.enable = mock.MagicMock()
+    fsp.on_sync_fail("homepath")
+    assert fsp.show_warning.call_count == 1
+    fsp.enable.assert_called_once_with()
+
+
 def test_FileSystem_Pane_on_put_fail():
     """
     A warning is emitted if putting files on the micro:bit fails.
@@ -1344,6 +1618,18 @@ def test_FileSystem_Pane_on_get_fail():
     assert fsp.show_warning.call_count == 1
 
 
+def test_FileSystemPane_on_transfer_progress():
+    """
+    The progress and rate of a file transfer are shown as a message.
+    """
+    fsp = mu.interface.panes.FileSystemPane("homepath")
+    fsp.show_message = mock.MagicMock()
+    fsp.on_transfer_progress(os.path.join("path", "foo.py"), 512, 2048, 2048.0)
+    fsp.show_message.assert_called_once_with(
+        "Copying 'foo.py': 25% (2.0 KB/s)."
+    )
+
+
 def test_FileSystemPane_set_font_size():
     """
     Ensure the right size is set as the point size and the text based UI child
@@ -1466,8 +1752,10 @@ def test_PythonProcessPane_init():
     assert ppp.start_of_current_line == 0
     assert ppp.history_position == 0
     assert ppp.running is False
-    assert ppp.stdout_buffer == b""
+    assert ppp.decoder.decode(b"") == ""
     assert ppp.reading_stdout is False
+    assert ppp.read_timer.isSingleShot()
+    assert ppp.read_timer.interval() == ppp.frame_interval
 
 
 def test_PythonProcessPane_start_process():
@@ -1866,33 +2154,33 @@ def test_PythonProcessPane_on_process_halt():
     ppp = mu.interface.panes.PythonProcessPane()
     ppp.process = mock.MagicMock()
     ppp.process.readAll().data.return_value = b"halted"
-    ppp.append = mock.MagicMock()
+    ppp.append_text = mock.MagicMock()
     ppp.on_append_text = mock.MagicMock()
     ppp.set_start_of_current_line = mock.MagicMock()
     ppp.on_process_halt()
     ppp.process.readAll().data.assert_called_once_with()
-    ppp.append.assert_called_once_with(b"halted")
+    ppp.append_text.assert_called_once_with("halted")
     ppp.on_append_text.emit.assert_called_once_with(b"halted")
     ppp.set_start_of_current_line.assert_called_once_with()
 
 
-def test_PythonProcessPane_on_process_halt_badly_formed_bytes():
+def test_PythonProcessPane_on_process_halt_split_character():
     """
-    If the bytes read from the child process's stdout starts with a badly
-    formed unicode character (e.g. a fragment of a multi-byte character such as
-    "𠜎"), then ensure the problem bytes at the start of the data are discarded
-    until a valid result can be turned into a string.
+    If the bytes read from the child process's stdout when it's halted end a
+    multi-byte character (such as "𠜎") begun by those read before, ensure
+    the character is shown whole.
     """
     data = "𠜎Hello, World!".encode("utf-8")  # Contains a multi-byte char.
-    data = data[1:]  # Split the muti-byte character (cause UnicodeDecodeError)
     ppp = mu.interface.panes.PythonProcessPane()
+    ppp.decoder.decode(data[:2])  # The start of the multi-byte character.
     ppp.process = mock.MagicMock()
-    ppp.process.readAll().data.return_value = data
+    ppp.process.readAll().data.return_value = data[2:]
     ppp.on_append_text = mock.MagicMock()
     ppp.set_start_of_current_line = mock.MagicMock()
     ppp.on_process_halt()
     ppp.process.readAll().data.assert_called_once_with()
-    ppp.on_append_text.emit.assert_called_once_with(b"Hello, World!")
+    assert ppp.toPlainText() == "𠜎Hello, World!"
+    ppp.on_append_text.emit.assert_called_once_with(data[2:])
     ppp.set_start_of_current_line.assert_called_once_with()
 
 
@@ -2325,86 +2613,153 @@ def test_PythonProcessPane_try_read_from_stdout_has_started():
 
 def test_PythonProcessPane_read_from_stdout():
     """
-    Ensure incoming bytes from sub-process's stout are processed correctly.
+    Ensure all the bytes available from the sub-process's stdout are
+    processed in one go, and more are checked for once the read timer fires.
     """
     ppp = mu.interface.panes.PythonProcessPane()
-    ppp.append = mock.MagicMock()
+    ppp.append_text = mock.MagicMock()
     ppp.process = mock.MagicMock()
-    ppp.process.read.return_value = b"hello world"
+    ppp.process.readAll().data.return_value = b"hello world"
     ppp.on_append_text = mock.MagicMock()
     ppp.set_start_of_current_line = mock.MagicMock()
-    mock_timer = mock.MagicMock()
-    with mock.patch("mu.interface.panes.QTimer", mock_timer):
-        ppp.read_from_stdout()
-    assert ppp.append.call_count == 1
-    ppp.process.read.assert_called_once_with(256)
+    ppp.read_timer = mock.MagicMock()
+    ppp.read_from_stdout()
+    ppp.append_text.assert_called_once_with("hello world")
     ppp.on_append_text.emit.assert_called_once_with(b"hello world")
     ppp.set_start_of_current_line.assert_called_once_with()
-    mock_timer.singleShot.assert_called_once_with(2, ppp.read_from_stdout)
+    ppp.read_timer.start.assert_called_once_with()
 
 
-def test_PythonProcessPane_read_from_stdout_with_stdout_buffer():
+def test_PythonProcessPane_read_from_stdout_split_character():
     """
     Ensure incoming bytes from sub-process's stdout are processed correctly if
     there was a split between reads in a multi-byte character (such as "𠜎").
 
-    The buffer is pre-pended to the current read, thus resulting in bytes that
-    can be successfully represented in a UTF based string.
+    The start of the character is kept by the decoder until the rest of it
+    arrives, while the rest of the bytes are shown straight away.
     """
     msg = "Hello 𠜎 world".encode("utf-8")
     ppp = mu.interface.panes.PythonProcessPane()
-    ppp.stdout_buffer = msg[:7]  # Start of msg but split in multi-byte char.
     ppp.process = mock.MagicMock()
-    ppp.process.read.return_value = msg[7:]  # Remainder of msg.
+    ppp.process.readAll().data.side_effect = [msg[:7], msg[7:]]
     ppp.on_append_text = mock.MagicMock()
-    ppp.set_start_of_current_line = mock.MagicMock()
-    mock_timer = mock.MagicMock()
-    with mock.patch("mu.interface.panes.QTimer", mock_timer):
-        ppp.read_from_stdout()
-    ppp.process.read.assert_called_once_with(256)
-    ppp.on_append_text.emit.assert_called_once_with(msg)
-    ppp.set_start_of_current_line.assert_called_once_with()
-    mock_timer.singleShot.assert_called_once_with(2, ppp.read_from_stdout)
-    assert ppp.stdout_buffer == b""
+    ppp.read_timer = mock.MagicMock()
+    ppp.read_from_stdout()
+    assert ppp.toPlainText() == "Hello "
+    ppp.read_from_stdout()
+    assert ppp.toPlainText() == "Hello 𠜎 world"
+    assert ppp.on_append_text.emit.call_args_list == [
+        mock.call(msg[:7]),
+        mock.call(msg[7:]),
+    ]
+    assert ppp.read_timer.start.call_count == 2
 
 
-def test_PythonProcessPane_read_from_stdout_with_unicode_error():
+def test_PythonProcessPane_read_from_stdout_no_data():
     """
-    Ensure incoming bytes from sub-process's stdout are processed correctly if
-    there was a split between reads in a multi-byte character (such as "𠜎").
+    If no data is returned, ensure the reading_stdout flag is reset to False.
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    ppp.reading_stdout = True
+    ppp.process = mock.MagicMock()
+    ppp.process.readAll().data.return_value = b""
+    ppp.read_timer = mock.MagicMock()
+    ppp.read_from_stdout()
+    assert ppp.reading_stdout is False
+    assert ppp.read_timer.start.call_count == 0
 
-    If the read bytes end with a split of a multi-byte character, ensure they
-    are put into the self.stdout_buffer so they can be pre-pended to the next
-    bytes read from the child process.
+
+def test_PythonProcessPane_read_from_stdout_flood(tmp_path):
+    """
+    Once a process writes more than flood_rate bytes in a second, ensure its
+    output is logged to disk and only sampled (with a count of the lines
+    skipped) once a second, until it calms down again.
     """
-    msg = "Hello 𠜎 world".encode("utf-8")
     ppp = mu.interface.panes.PythonProcessPane()
+    ppp.flood_rate = 10
+    ppp.flood_lines = 2
     ppp.process = mock.MagicMock()
-    ppp.process.read.return_value = msg[:7]  # Split the multi-byte character.
+    ppp.process.readAll().data.side_effect = [
+        b"a\nb\n",
+        b"c\nd\ne\nf\n",
+        b"g\nh\n",
+        b"i\n",
+        b"j\n",
+    ]
     ppp.on_append_text = mock.MagicMock()
-    ppp.set_start_of_current_line = mock.MagicMock()
-    mock_timer = mock.MagicMock()
-    with mock.patch("mu.interface.panes.QTimer", mock_timer):
-        ppp.read_from_stdout()
-    ppp.process.read.assert_called_once_with(256)
-    assert ppp.on_append_text.emit.call_count == 0
-    assert ppp.set_start_of_current_line.call_count == 0
-    mock_timer.singleShot.assert_called_once_with(2, ppp.read_from_stdout)
-    assert ppp.stdout_buffer == msg[:7]
+    ppp.read_timer = mock.MagicMock()
+    monotonic = [10, 10.1, 10.5, 11.5, 13]
+    with mock.patch("mu.interface.panes.config.DATA_DIR", str(tmp_path)):
+        with mock.patch("time.monotonic", side_effect=monotonic):
+            ppp.read_from_stdout()
+            assert ppp.flood_log is None
+            ppp.read_from_stdout()
+            assert ppp.flood_log
+            ppp.read_from_stdout()
+            assert ppp.toPlainText() == "a\nb\n"
+            ppp.read_from_stdout()
+            ppp.read_from_stdout()
+    assert ppp.flood_log is None
+    marker = "[{} lines skipped, all output is in {}]\n"
+    assert ppp.toPlainText() == (
+        "a\nb\n" + marker.format(5, ppp.flood_path) + "h\ni\n" + "j\n"
+    )
+    with open(ppp.flood_path, "rb") as log:
+        assert log.read() == b"c\nd\ne\nf\ng\nh\ni\n"
+    assert ppp.on_append_text.emit.call_count == 5
 
 
-def test_PythonProcessPane_read_from_stdout_no_data():
+def test_PythonProcessPane_read_from_stdout_flood_no_data(tmp_path):
     """
-    If no data is returned, ensure the reading_stdout flag is reset to False.
+    If the flooding process goes quiet, ensure the latest sample is shown
+    straight away.
     """
     ppp = mu.interface.panes.PythonProcessPane()
-    ppp.reading_stdout = True
+    ppp.flood_lines = 1
     ppp.process = mock.MagicMock()
-    ppp.process.read.return_value = b""
+    ppp.read_timer = mock.MagicMock()
+    with mock.patch("mu.interface.panes.config.DATA_DIR", str(tmp_path)):
+        ppp.start_flood(1)
+    ppp.sample_output(b"one\ntwo", 1.5)
+    ppp.process.readAll().data.return_value = b""
     ppp.read_from_stdout()
+    assert ppp.toPlainText() == (
+        "[1 lines skipped, all output is in {}]\ntwo".format(ppp.flood_path)
+    )
     assert ppp.reading_stdout is False
 
 
+def test_PythonProcessPane_sample_output_rotates_log(tmp_path):
+    """
+    Ensure the flood log is moved aside once it holds as many bytes as the
+    process_flood_log_size setting allows.
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    mock_settings = {"process_flood_log_size": 4}
+    with mock.patch("mu.interface.panes.config.DATA_DIR", str(tmp_path)):
+        ppp.start_flood(1)
+    with mock.patch("mu.interface.panes.settings.settings", mock_settings):
+        ppp.sample_output(b"abc", 1)
+        ppp.sample_output(b"def", 1)
+        ppp.sample_output(b"g", 1)
+    ppp.end_flood()
+    with open(ppp.flood_path + ".1", "rb") as log:
+        assert log.read() == b"abcdef"
+    with open(ppp.flood_path, "rb") as log:
+        assert log.read() == b"g"
+
+
+def test_PythonProcessPane_finished_ends_flood():
+    """
+    Ensure a flood of output is ended when the process finishes.
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    ppp.flood_log = mock.MagicMock()
+    ppp.end_flood = mock.MagicMock()
+    ppp.finished(0, 1)
+    ppp.end_flood.assert_called_once_with()
+
+
 def test_PythonProcessPane_write_to_stdin():
     """
     Ensure input from the user is written to the child process.
@@ -2429,6 +2784,18 @@ def test_PythonProcessPane_append():
     assert mock_cursor.movePosition.call_count == 2
 
 
+def test_PythonProcessPane_append_scrollback():
+    """
+    When output is trimmed from the top of the pane, the start of the input
+    line is kept in step.
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    ppp.start_of_current_line = 10
+    ppp.scrollback.trim = mock.MagicMock(return_value=4)
+    ppp.append(b"hello")
+    assert ppp.start_of_current_line == 6
+
+
 def test_PythonProcessPane_insert_within_input_line():
     """
     Ensure text is inserted at the end of the document if the current cursor
@@ -2622,18 +2989,291 @@ def test_DebugInspector_set_theme():
     di.set_theme("test")
 
 
+@pytest.mark.parametrize("numpy", [mu.interface.panes.numpy, None])
+def test_RingBuffer(numpy):
+    """
+    Ensure the ring buffer keeps the most recent values, whether or not numpy
+    is available.
+    """
+    if numpy is None and mu.interface.panes.numpy is None:
+        pytest.skip("Same as the numpy case")
+    with mock.patch("mu.interface.panes.numpy", numpy):
+        rb = mu.interface.panes.RingBuffer(5)
+        assert len(rb) == 5
+        values = [3, -2, 7, 7, 1, -5, 4, 0, 2, 9, -1, -1, 3]
+        window = [0] * 5
+        for value in values:
+            rb.append(value)
+            window = window[1:] + [value]
+            assert list(rb.latest(5)) == window
+            assert list(rb.latest(3)) == window[-3:]
+            assert list(rb.latest(3, 2)) == window[-5:-2]
+
+
+@pytest.mark.parametrize("numpy", [mu.interface.panes.numpy, None])
+def test_RingBuffer_grows(numpy):
+    """
+    Ensure the ring buffer's storage starts small and grows as values arrive,
+    up to its size, while still acting as if it were all there from the
+    start.
+    """
+    if numpy is None and mu.interface.panes.numpy is None:
+        pytest.skip("Same as the numpy case")
+    with mock.patch("mu.interface.panes.numpy", numpy), mock.patch(
+        "mu.interface.panes.RingBuffer.initial_capacity", 2
+    ):
+        rb = mu.interface.panes.RingBuffer(7)
+        assert len(rb) == 7
+        assert len(rb.values) == 2
+        window = [0] * 7
+        for value in range(1, 20):
+            rb.append(value)
+            window = window[1:] + [value]
+            assert list(rb.latest(7)) == window
+            assert list(rb.latest(3, 2)) == window[-5:-2]
+            assert len(rb.values) == {1: 2, 2: 2, 3: 4, 4: 4}.get(value, 7)
+
+
+@pytest.mark.parametrize("numpy", [mu.interface.panes.numpy, None])
+def test_decimate(numpy):
+    """
+    Values are reduced to the smallest and largest of each run of them, in
+    order, so a peak in a long series of values is never lost.
+    """
+    if numpy is None and mu.interface.panes.numpy is None:
+        pytest.skip("Same as the numpy case")
+    values = [0.0] * 1000
+    values[123] = 50.0
+    values[124] = -50.0
+    values[998] = 7.0
+    with mock.patch("mu.interface.panes.numpy", numpy):
+        xs, ys = mu.interface.panes.decimate(values, 10)
+        xs, ys = list(xs), list(ys)
+        assert len(xs) == 20
+        assert xs == sorted(xs)
+        assert ys == [values[x] for x in xs]
+        assert 123 in xs
+        assert 124 in xs
+        assert 998 in xs
+        # A shorter last run, with its largest value first.
+        xs, ys = mu.interface.panes.decimate(values[:997] + [9.0, -1.0], 10)
+        assert list(xs)[-2:] == [997, 998]
+        assert list(ys)[-2:] == [9.0, -1.0]
+        # Few enough values are left alone.
+        xs, ys = mu.interface.panes.decimate(values[:20], 10)
+        assert list(xs) == list(range(20))
+        assert list(ys) == values[:20]
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+@pytest.mark.parametrize("numpy", [mu.interface.panes.numpy, None])
+def test_make_points(numpy):
+    """
+    The x and y values are turned into points.
+    """
+    with mock.patch("mu.interface.panes.numpy", numpy):
+        points = mu.interface.panes.make_points(range(3), [5, 6.5, -1])
+        assert list(points) == [
+            QPointF(0, 5),
+            QPointF(1, 6.5),
+            QPointF(2, -1),
+        ]
+        assert list(mu.interface.panes.make_points([], [])) == []
+
+
+@pytest.mark.parametrize("numpy", [mu.interface.panes.numpy, None])
+def test_times_at(numpy):
+    """
+    The times at the given positions are given relative to the origin.
+    """
+    with mock.patch("mu.interface.panes.numpy", numpy):
+        times = mu.interface.panes.times_at([10, 10.5, 12], [0, 2], 10)
+        assert list(times) == [0, 2]
+
+
+def test_describe_timing():
+    """
+    The rate and jitter of the times datapoints arrived are described, as
+    is the latency above the smallest (when known).
+    """
+    describe = mu.interface.panes.describe_timing
+    assert describe([]) == ""
+    assert describe([1, 1, 1]) == ""
+    assert describe([0, 0.01, 0.02, 0.03]) == "100.0 samples/s, jitter 0.0ms"
+    assert describe([0, 0.01, 0.01, 0.02]) == ("150.0 samples/s, jitter 4.7ms")
+    latencies = [0.01, math.nan, 0.012, 0.014]
+    assert describe([0, 0.01, 0.02, 0.03], latencies) == (
+        "100.0 samples/s, jitter 0.0ms, latency +2.0ms"
+    )
+    assert describe([0, 1], [math.nan, math.nan]) == (
+        "1.0 samples/s, jitter 0.0ms"
+    )
+
+
+def test_PlotterCapture(tmp_path):
+    """
+    Rows of data are written as CSV by the writer thread, starting a new
+    part file once the current one is big enough.
+    """
+    directory = str(tmp_path / "capture")
+    capture = mu.interface.panes.PlotterCapture(directory)
+    capture.max_bytes = 25
+    capture.record = False
+    assert capture.finish() == []
+    for i in range(6):
+        capture.write((i, i * 1.5, -i), i)
+    parts = capture.finish()
+    assert capture.thread is None
+    assert len(parts) == 2
+    assert all(os.path.dirname(part) == directory for part in parts)
+    with open(parts[0]) as part:
+        assert part.read().splitlines() == [
+            "0,0.0,0",
+            "1,1.5,-1",
+            "2,3.0,-2",
+        ]
+    with open(parts[1]) as part:
+        assert part.read().splitlines() == [
+            "3,4.5,-3",
+            "4,6.0,-4",
+            "5,7.5,-5",
+        ]
+
+
+def test_PlotterCapture_interval(tmp_path):
+    """
+    A new part file is started once the current one has been open for the
+    capture interval.
+    """
+    capture = mu.interface.panes.PlotterCapture(str(tmp_path))
+    capture.interval = 10
+    capture.record = False
+    with mock.patch(
+        "mu.interface.panes.time.monotonic", side_effect=[0, 1, 5, 9, 12]
+    ):
+        for i in range(4):
+            capture.write((i,), i)
+        parts = capture.finish()
+    assert len(parts) == 2
+    with open(parts[1]) as part:
+        assert part.read() == "3\n"
+
+
+@pytest.mark.parametrize("numpy", [mu.interface.panes.numpy, None])
+def test_Recording(tmp_path, numpy):
+    """
+    A recording written a row at a time is read back, as columns mapped
+    from disk, whether or not numpy is available.
+    """
+    if numpy is None and mu.interface.panes.numpy is None:
+        pytest.skip("Same as the numpy case")
+    path = str(tmp_path / "test.plot")
+    writer = mu.interface.panes.RecordingWriter(path)
+    writer.write(10.0, (1,))
+    writer.write(10.5, (2, 20))
+    writer.write(11.0, (3.5, 30, -1))
+    writer.write(12.0, (4,))
+    writer.close()
+    # A partly written row is ignored.
+    with open(os.path.join(path, "1.bin"), "ab") as column:
+        column.write(b"\0\0\0")
+    with mock.patch("mu.interface.panes.numpy", numpy):
+        recording = mu.interface.panes.Recording(path)
+        assert len(recording) == 4
+        assert len(recording.channels) == 3
+        assert list(recording.channels[0].latest(4)) == [1, 2, 3.5, 4]
+        assert list(recording.channels[1].latest(4)) == [0, 20, 30, 0]
+        assert list(recording.channels[2].latest(2, 1)) == [0, -1]
+        assert recording.index_at(9) == 0
+        assert recording.index_at(10.5) == 2
+        assert recording.index_at(11.9) == 3
+        assert recording.index_at(20) == 4
+
+
+def test_Recording_byteorder(tmp_path):
+    """
+    A recording made with a different byte order can't be opened.
+    """
+    path = str(tmp_path / "test.plot")
+    mu.interface.panes.RecordingWriter(path).close()
+    with mock.patch("mu.interface.panes.sys.byteorder", "middle"):
+        with pytest.raises(ValueError):
+            mu.interface.panes.Recording(path)
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_start_stop_capture(tmp_path):
+    """
+    Data added to the plotter while capturing is streamed to disk, and the
+    files it was written to are returned when capturing stops.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    assert pp.stop_capture() == []
+    pp.start_capture(str(tmp_path))
+    assert isinstance(pp.capture, mu.interface.panes.PlotterCapture)
+    pp.add_data((1, 2))
+    pp.add_data((3, 4))
+    parts = pp.stop_capture()
+    assert pp.capture is None
+    assert len(parts) == 1
+    with open(parts[0]) as part:
+        assert part.read().splitlines() == ["1,2", "3,4"]
+
+
+def test_PlotterPane_start_stop_capture_record(tmp_path):
+    """
+    If plotter_record is turned on, the data captured is also recorded so
+    it can be reopened in the plotter.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    with mock.patch(
+        "mu.interface.panes.settings.settings", {"plotter_record": True}
+    ):
+        pp.start_capture(str(tmp_path))
+    pp.add_data((1, 2))
+    pp.add_data((3, 4))
+    parts = pp.stop_capture()
+    assert len(parts) == 2
+    assert parts[1] == parts[0][:-4] + ".plot"
+    recording = mu.interface.panes.Recording(parts[1])
+    assert len(recording) == 2
+    assert list(recording.channels[1].latest(2)) == [2, 4]
+
+
+def test_PlotterPane_stop_capture_after_flood(tmp_path):
+    """
+    The files data was captured to before a data flood are still returned
+    when capturing stops.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    pp.data_flood = mock.MagicMock()
+    pp.flood_rate = 10
+    pp.start_capture(str(tmp_path))
+    pp.process_tty_data(b"(1, 2)\r\n")
+    pp.process_tty_data(b"(3, 4)\r\n")
+    assert pp.flooded is True
+    parts = pp.stop_capture()
+    assert len(parts) == 1
+    with open(parts[0]) as part:
+        assert part.read().splitlines() == ["1,2"]
+
+
 @pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
 def test_PlotterPane_init():
     """
     Ensure the plotter pane is created in the expected manner.
     """
     pp = mu.interface.panes.PlotterPane()
-    assert pp.input_buffer == []
-    assert pp.raw_data == []
+    assert pp.input_buffer == b""
+    assert pp.capture is None
     assert pp.max_x == 100
     assert pp.max_y == 1000
+    assert pp.visible == pp.max_x
+    assert pp.offset == 0
+    assert pp.history == 360000
+    assert len(pp.data[0]) == pp.history
     assert len(pp.data) == 1
-    assert isinstance(pp.data[0], deque)
+    assert isinstance(pp.data[0], mu.interface.panes.RingBuffer)
     assert len(pp.series) == 1
     assert isinstance(pp.series[0], mu.interface.panes.QLineSeries)
     assert isinstance(pp.chart, mu.interface.panes.QChart)
@@ -2651,15 +3291,16 @@ def test_PlotterPane_process_tty_data():
     """
     pp = mu.interface.panes.PlotterPane()
     pp.add_data = mock.MagicMock()
-    pp.process_tty_data(b"(1, 2.3, 4)\r\n")
-    pp.add_data.assert_called_once_with((1, 2.3, 4))
+    with mock.patch("mu.interface.panes.time.monotonic", return_value=12):
+        pp.process_tty_data(b"(1, 2.3, 4)\r\n")
+    pp.add_data.assert_called_once_with((1, 2.3, 4), 12)
 
 
 @pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
 def test_PlotterPane_process_tty_data_guards_against_data_flood():
     """
-    If the process_tty_data method gets data of more than 1024 bytes
-    then trigger a data_flood signal and ensure the plotter no longer
+    If the process_tty_data method gets more than flood_rate bytes within a
+    second then trigger a data_flood signal and ensure the plotter no longer
     processes incoming bytes.
 
     (The assumption is that Mu will clean up once the data_flood signal is
@@ -2669,13 +3310,98 @@ def test_PlotterPane_process_tty_data_guards_against_data_flood():
     pp = mu.interface.panes.PlotterPane()
     pp.data_flood = mock.MagicMock()
     pp.add_data = mock.MagicMock()
-    data_flood = b"X" * 1025
-    pp.process_tty_data(data_flood)
-    assert pp.flooded is True
+    pp.flood_rate = 1500
+    capture = mock.MagicMock()
+    pp.capture = capture
+    data = b"(1, 2)\r\n" * 128
+    with mock.patch("mu.interface.panes.time.monotonic", return_value=100):
+        pp.process_tty_data(data)
+        assert pp.add_data.call_count == 128
+        assert pp.flooded is False
+        pp.process_tty_data(data)
+        assert pp.flooded is True
     pp.data_flood.emit.assert_called_once_with()
-    assert pp.add_data.call_count == 0
-    pp.process_tty_data(data_flood)
-    assert pp.add_data.call_count == 0
+    # The capture is finished, but kept so its files can still be moved.
+    capture.finish.assert_called_once_with()
+    assert pp.capture is capture
+    assert pp.add_data.call_count == 128
+    pp.process_tty_data(data)
+    assert pp.add_data.call_count == 128
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_process_tty_data_sustained_rate():
+    """
+    Data arriving at less than flood_rate bytes per second is plotted, no
+    matter how large the chunks of data are.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    pp.data_flood = mock.MagicMock()
+    pp.add_data = mock.MagicMock()
+    pp.flood_rate = 2048
+    data = b"(1, 2)\r\n" * 200
+    with mock.patch("mu.interface.panes.time.monotonic", side_effect=[1, 2]):
+        pp.process_tty_data(data)
+        pp.process_tty_data(data)
+    assert pp.flooded is False
+    assert pp.add_data.call_count == 400
+    pp.add_data.assert_called_with((1, 2), 2)
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_process_tty_data_spreads_timestamps():
+    """
+    The datapoints in a chunk of data are spread evenly over the time since
+    the previous chunk arrived, rather than all being stamped with the time
+    the chunk arrived.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    pp.add_data = mock.MagicMock()
+    with mock.patch(
+        "mu.interface.panes.time.monotonic", side_effect=[10, 10.5, 11]
+    ):
+        pp.process_tty_data(b"(1,)\r\n(2,)\r\n")
+        # A chunk without any datapoints still marks the time.
+        pp.process_tty_data(b"hello\r\n")
+        pp.process_tty_data(b"(3,)\r\n(4,)\r\n(5,)\r\n(6,)\r\n")
+    assert pp.add_data.call_args_list == [
+        mock.call((1,), 10),
+        mock.call((2,), 10),
+        mock.call((3,), 10.625),
+        mock.call((4,), 10.75),
+        mock.call((5,), 10.875),
+        mock.call((6,), 11),
+    ]
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_process_tty_data_mixed_lines():
+    """
+    Tuples are found among other output, whether they hold ints, floats or
+    a mixture of numeric and non-numeric values.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    pp.add_data = mock.MagicMock()
+    pp.process_tty_data(
+        b"Hello\r\n(1, -2, +3)\r\nx = (1, 2)\r\n(1.5, 2e3)\n('a', 4)\r\n"
+    )
+    assert pp.add_data.call_args_list == [
+        mock.call((1, -2, 3), mock.ANY),
+        mock.call((1.5, 2000.0), mock.ANY),
+        mock.call((4,), mock.ANY),
+    ]
+    assert isinstance(pp.add_data.call_args_list[0][0][0][0], int)
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_process_tty_data_long_line():
+    """
+    A partial line too long to be a tuple isn't kept waiting for its end.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    pp.add_data = mock.MagicMock()
+    pp.process_tty_data(b"X" * (pp.max_line_length + 1))
+    assert pp.input_buffer == b""
 
 
 @pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
@@ -2699,30 +3425,315 @@ def test_PlotterPane_process_tty_data_overrun_input_buffer():
     pp = mu.interface.panes.PlotterPane()
     pp.add_data = mock.MagicMock()
     pp.process_tty_data(b"(1, 2.3, 4)\r\n")
-    pp.add_data.assert_called_once_with((1, 2.3, 4))
+    pp.add_data.assert_called_once_with((1, 2.3, 4), mock.ANY)
     pp.add_data.reset_mock()
     pp.process_tty_data(b"(1, 2.")
     assert pp.add_data.call_count == 0
     pp.process_tty_data(b"3, 4)\r\n")
-    pp.add_data.assert_called_once_with((1, 2.3, 4))
+    pp.add_data.assert_called_once_with((1, 2.3, 4), mock.ANY)
     pp.add_data.reset_mock()
     pp.process_tty_data(b"(1, 2.3, 4)\r\n")
-    pp.add_data.assert_called_once_with((1, 2.3, 4))
+    pp.add_data.assert_called_once_with((1, 2.3, 4), mock.ANY)
 
 
 @pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
 def test_PlotterPane_add_data():
     """
-    Given a tuple with a single value, ensure it is logged and correctly added
-    to the chart.
+    Given a tuple with a single value, ensure it is logged and buffered, and
+    that the chart is only refreshed once the refresh timer fires.
     """
     pp = mu.interface.panes.PlotterPane()
+    pp.refresh_timer = mock.MagicMock()
+    pp.refresh_timer.isActive.return_value = False
+    pp.capture = mock.MagicMock()
     mock_line_series = mock.MagicMock()
     pp.series = [mock_line_series]
-    pp.add_data((1,))
-    assert (1,) in pp.raw_data
-    mock_line_series.clear.assert_called_once_with()
-    mock_line_series.append.call_args_list[0][0] == (0, 1)
+    pp.add_data((1,), 5)
+    pp.capture.write.assert_called_once_with((1,), 5)
+    assert list(pp.data[0].latest(1)) == [1]
+    pp.refresh_timer.start.assert_called_once_with()
+    assert mock_line_series.replace.call_count == 0
+    pp.refresh()
+    assert mock_line_series.replace.call_count == 1
+    points = mock_line_series.replace.call_args[0][0]
+    assert list(points) == [QPointF(0, 1)]
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_add_data_coalesced():
+    """
+    Data arriving while a refresh is pending is shown in a single refresh of
+    the latest window of data.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    mock_line_series = mock.MagicMock()
+    pp.series = [mock_line_series]
+    for i in range(10):
+        pp.add_data((i,), i)
+    assert pp.refresh_timer.isActive()
+    assert mock_line_series.replace.call_count == 0
+    pp.refresh_timer.stop()
+    pp.refresh()
+    assert mock_line_series.replace.call_count == 1
+    points = mock_line_series.replace.call_args[0][0]
+    assert list(points) == [QPointF(i, i) for i in range(10)]
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_refresh_time_axis():
+    """
+    Datapoints are plotted at the time they arrived, relative to the first,
+    with the timing of their arrival described in the chart's title.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    pp.axis_x = mock.MagicMock()
+    for i, timestamp in enumerate([50, 50.5, 51, 52]):
+        pp.add_data((i,), timestamp)
+    pp.refresh()
+    points = list(pp.series[0].pointsVector())
+    assert points == [
+        QPointF(0, 0),
+        QPointF(0.5, 1),
+        QPointF(1, 2),
+        QPointF(2, 3),
+    ]
+    pp.axis_x.setRange.assert_called_once_with(0, 2)
+    assert pp.chart.title() == "1.5 samples/s, jitter 235.7ms"
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_add_data_device_time():
+    """
+    If tuples start with the device's time, it isn't plotted but is used to
+    work out the latency of each datapoint.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    pp.device_time = True
+    pp.add_data((1000, 7), 10.25)
+    pp.add_data((8,), 10.5)
+    pp.add_data((1500, 9), 11)
+    assert len(pp.series) == 1
+    assert list(pp.data[0].latest(3)) == [7, 8, 9]
+    latencies = list(pp.latencies.latest(3))
+    assert latencies[0] == 9.25
+    assert math.isnan(latencies[1])
+    assert latencies[2] == 9.5
+    pp.refresh()
+    assert pp.chart.title().endswith(", latency +125.0ms")
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_refresh_decimated():
+    """
+    When zoomed out over more datapoints than there are pixels across the
+    chart, the datapoints are decimated without losing peaks.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    pp.chart = mock.MagicMock()
+    pp.chart.plotArea().width.return_value = 100
+    mock_line_series = mock.MagicMock()
+    pp.series = [mock_line_series]
+    for i in range(5000):
+        pp.add_data((1001 if i == 1234 else 1,), i)
+    pp.zoom(50)
+    assert pp.visible == 5000
+    pp.refresh()
+    points = list(mock_line_series.replace.call_args[0][0])
+    assert len(points) == 200
+    assert QPointF(1234, 1001) in points
+    assert pp.max_y == 2000
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """
+    Return the path of a recording of 1000 datapoints, in two channels,
+    made a tenth of a second apart.
+    """
+    path = str(tmp_path / "test.plot")
+    writer = mu.interface.panes.RecordingWriter(path)
+    for i in range(1000):
+        writer.write(100 + i / 10, (i, -i))
+    writer.close()
+    return path
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_open_recording(recording):
+    """
+    An opened recording is shown instead of incoming data, which is kept
+    for when it's shown again.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    pp.add_data((5,), 0)
+    pp.open_recording(recording)
+    assert len(pp.recording) == 1000
+    assert len(pp.series) == 2
+    pp.refresh()
+    points = list(pp.series[1].pointsVector())
+    assert [p.x() for p in points] == pytest.approx(
+        [90 + i / 10 for i in range(100)]
+    )
+    assert [p.y() for p in points] == [-900 - i for i in range(100)]
+    pp.add_data((6,), 1)
+    assert len(pp.series) == 2
+    pp.pan(50)
+    assert pp.offset == 50
+    pp.show_live_data()
+    assert pp.recording is None
+    assert pp.offset == 0
+    assert len(pp.series) == 1
+    pp.refresh()
+    assert list(pp.series[0].pointsVector()) == [
+        QPointF(0, 5),
+        QPointF(1, 6),
+    ]
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_open_recording_fails(tmp_path):
+    """
+    If the recording can't be opened, the user is told why.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    mock_message_box = mock.MagicMock()
+    with mock.patch(
+        "mu.interface.panes.QMessageBox", return_value=mock_message_box
+    ):
+        pp.open_recording(str(tmp_path / "missing.plot"))
+    assert pp.recording is None
+    mock_message_box.exec_.assert_called_once_with()
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_replay(recording):
+    """
+    Replaying a recording moves through it as fast as it was recorded, and
+    stops at the end.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    pp.replay()
+    assert pp.replay_start is None
+    pp.open_recording(recording)
+    with mock.patch("mu.interface.panes.time.monotonic", return_value=50):
+        pp.replay()
+    assert pp.replay_start == (50, 100)
+    assert pp.offset == 999
+    pp.schedule_refresh = mock.MagicMock()
+    with mock.patch("mu.interface.panes.time.monotonic", return_value=60):
+        pp.refresh()
+    assert pp.offset == 899
+    pp.schedule_refresh.assert_called_once_with()
+    points = list(pp.series[0].pointsVector())
+    assert [p.x() for p in points] == pytest.approx(
+        [(i + 1) / 10 for i in range(100)]
+    )
+    assert [p.y() for p in points] == [i + 1 for i in range(100)]
+    with mock.patch("mu.interface.panes.time.monotonic", return_value=500):
+        pp.refresh()
+    assert pp.offset == 0
+    assert pp.replay_start is None
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_contextMenuEvent(recording):
+    """
+    The context menu opens a recording, then replays it or goes back to
+    showing live data.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    pp.mapToGlobal = mock.MagicMock()
+    mock_menu = mock.MagicMock()
+    open_action = mock.MagicMock()
+    mock_menu.addAction.return_value = open_action
+    mock_menu.exec_.return_value = open_action
+    mock_dialog = mock.MagicMock()
+    mock_dialog.getOpenFileName.return_value = (
+        os.path.join(recording, "recording.json"),
+        "Plotter recording (recording.json)",
+    )
+    with mock.patch(
+        "mu.interface.panes.QMenu", return_value=mock_menu
+    ), mock.patch("mu.interface.panes.QFileDialog", mock_dialog):
+        pp.contextMenuEvent(mock.MagicMock())
+    assert mock_menu.addAction.call_count == 1
+    assert pp.recording.path == recording
+    replay_action = mock.MagicMock()
+    live_action = mock.MagicMock()
+    pp.replay = mock.MagicMock()
+    pp.show_live_data = mock.MagicMock()
+    for action in (replay_action, live_action):
+        mock_menu.addAction.side_effect = [
+            open_action,
+            replay_action,
+            live_action,
+        ]
+        mock_menu.exec_.return_value = action
+        with mock.patch("mu.interface.panes.QMenu", return_value=mock_menu):
+            pp.contextMenuEvent(mock.MagicMock())
+    pp.replay.assert_called_once_with()
+    pp.show_live_data.assert_called_once_with()
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_zoom():
+    """
+    Zooming changes the number of datapoints across the x axis, within
+    limits, and refreshes the chart.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    pp.history = 1000
+    pp.schedule_refresh = mock.MagicMock()
+    pp.zoom(0.5)
+    assert pp.visible == 50
+    pp.zoom(0.01)
+    assert pp.visible == 10
+    pp.zoom(1000)
+    assert pp.visible == 1000
+    assert pp.schedule_refresh.call_count == 3
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_pan():
+    """
+    Panning moves the chart back through the history of datapoints, which
+    then stays in view as more data arrives.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    mock_line_series = mock.MagicMock()
+    pp.series = [mock_line_series]
+    for i in range(300):
+        pp.add_data((i,), i)
+    pp.pan(150)
+    assert pp.offset == 150
+    pp.add_data((300,), 300)
+    assert pp.offset == 151
+    pp.refresh()
+    points = list(mock_line_series.replace.call_args[0][0])
+    assert points == [QPointF(50 + i, 50 + i) for i in range(100)]
+    pp.pan(1000)
+    assert pp.offset == 300
+    pp.pan(-1000)
+    assert pp.offset == 0
+
+
+@pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
+def test_PlotterPane_wheelEvent():
+    """
+    Scrolling zooms the chart, SHIFT-scrolling pans it.
+    """
+    pp = mu.interface.panes.PlotterPane()
+    pp.zoom = mock.MagicMock()
+    pp.pan = mock.MagicMock()
+    mock_event = mock.MagicMock()
+    mock_event.angleDelta().y.return_value = 240
+    mock_event.modifiers.return_value = Qt.NoModifier
+    pp.wheelEvent(mock_event)
+    pp.zoom.assert_called_once_with(0.8**2)
+    mock_event.modifiers.return_value = Qt.ShiftModifier
+    pp.wheelEvent(mock_event)
+    pp.pan.assert_called_once_with(20)
+    assert mock_event.accept.call_count == 2
 
 
 @pytest.mark.skipif(not CHARTS, reason="QtChart unavailable")
@@ -2772,6 +3783,7 @@ def test_PlotterPane_add_data_re_scale_up():
     mock_line_series = mock.MagicMock()
     pp.series = [mock_line_series]
     pp.add_data((1001,))
+    pp.refresh()
     assert pp.max_y == 2000
     pp.axis_y.setRange.assert_called_once_with(0, 2000)
 
@@ -2788,6 +3800,7 @@ def test_PlotterPane_add_data_re_scale_down():
     mock_line_series = mock.MagicMock()
     pp.series = [mock_line_series]
     pp.add_data((1999,))
+    pp.refresh()
     assert pp.max_y == 2000
     pp.axis_y.setRange.assert_called_once_with(0, 2000)
 
@@ -2803,6 +3816,7 @@ def test_PlotterPane_add_data_re_scale_min_up():
     mock_line_series = mock.MagicMock()
     pp.series = [mock_line_series]
     pp.add_data((-1001,))
+    pp.refresh()
     assert pp.min_y == -2000
     pp.axis_y.setRange.assert_called_once_with(-2000, 0)
 
@@ -2820,6 +3834,7 @@ def test_PlotterPane_add_data_re_scale_min_down():
     mock_line_series = mock.MagicMock()
     pp.series = [mock_line_series]
     pp.add_data((-1999,))
+    pp.refresh()
     assert pp.min_y == -2000
     pp.axis_y.setRange.assert_called_once_with(-2000, 0)
 
@@ -2836,6 +3851,7 @@ def test_PlotterPane_set_label_format_to_float_when_range_small():
     mock_line_series = mock.MagicMock()
     pp.series = [mock_line_series]
     pp.add_data((1,))
+    pp.refresh()
     assert pp.max_y == 1
     pp.axis_y.setRange.assert_called_once_with(0, 1)
     pp.axis_y.setLabelFormat.assert_called_once_with("%2.2f")
@@ -2853,6 +3869,7 @@ def test_PlotterPane_set_label_format_to_int_when_range_large():
     mock_line_series = mock.MagicMock()
     pp.series = [mock_line_series]
     pp.add_data((20,))
+    pp.refresh()
     assert pp.max_y == 25
     pp.axis_y.setRange.assert_called_once_with(0, 25)
     pp.axis_y.setLabelFormat.assert_called_once_with("%d")
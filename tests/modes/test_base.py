@@ -163,6 +163,24 @@ def test_base_mode_add_plotter():
     assert bm.add_plotter() == NotImplemented
 
 
+def test_base_mode_start_plotter_capture():
+    """
+    Ensure the plotter starts capturing data into the expected directory,
+    which is created if needed.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    bm = BaseMode(editor, view)
+    mock_mkdir = mock.MagicMock()
+    with mock.patch(
+        "mu.modes.base.os.path.exists", return_value=False
+    ), mock.patch("mu.modes.base.os.makedirs", mock_mkdir):
+        bm.start_plotter_capture()
+    dd = os.path.join(bm.workspace_dir(), "data_capture")
+    mock_mkdir.assert_called_once_with(dd)
+    view.plotter_pane.start_capture.assert_called_once_with(dd)
+
+
 def test_base_mode_remove_plotter():
     """
     Ensure the plotter is removed and data is saved as a CSV file in the
@@ -170,46 +188,65 @@ def test_base_mode_remove_plotter():
     """
     editor = mock.MagicMock()
     view = mock.MagicMock()
-    view.plotter_pane.raw_data = [1, 2, 3]
+    view.plotter_pane.stop_capture.return_value = ["capture.csv"]
     bm = BaseMode(editor, view)
     bm.plotter = mock.MagicMock()
     mock_mkdir = mock.MagicMock()
-    mock_open = mock.mock_open()
-    mock_csv_writer = mock.MagicMock()
-    mock_csv = mock.MagicMock()
-    mock_csv.writer.return_value = mock_csv_writer
+    mock_move = mock.MagicMock()
     with mock.patch(
         "mu.modes.base.os.path.exists", return_value=False
     ), mock.patch("mu.modes.base.os.makedirs", mock_mkdir), mock.patch(
-        "builtins.open", mock_open
-    ), mock.patch(
-        "mu.modes.base.csv", mock_csv
+        "mu.modes.base.shutil.move", mock_move
     ):
         bm.remove_plotter()
     assert bm.plotter is False
     view.remove_plotter.assert_called_once_with()
     dd = os.path.join(bm.workspace_dir(), "data_capture")
     mock_mkdir.assert_called_once_with(dd)
-    mock_csv_writer.writerows.assert_called_once_with(
-        view.plotter_pane.raw_data
-    )
+    assert mock_move.call_args[0][0] == "capture.csv"
+    assert os.path.dirname(mock_move.call_args[0][1]) == dd
 
 
 def test_base_mode_write_csv(tmp_path):
-    """When the plotter is removed the resulting csv should represent
-    the data -- an should not not include interspersed blank lines
-    """
+    """When the plotter is removed the files the data was captured to are
+    moved into place, numbered in order if there is more than one, along
+    with the recording of it.
+    """
+    parts = []
+    for i in range(3):
+        part = tmp_path / "part{}.csv".format(i)
+        part.write_text("{0},{0}\n".format(i))
+        parts.append(str(part))
+    recording = tmp_path / "part0.plot"
+    recording.mkdir()
+    parts.append(str(recording))
     csv_filepath = str(tmp_path / "plotter.csv")
     editor = mock.MagicMock()
     view = mock.MagicMock()
-    view.plotter_pane.raw_data = [[1, 2, 3], [4, 5, 6]]
+    view.plotter_pane.stop_capture.return_value = parts
     bm = BaseMode(editor, view)
     bm.write_plotter_data_to_csv(csv_filepath)
+    assert sorted(os.listdir(tmp_path)) == [
+        "plotter-2.csv",
+        "plotter-3.csv",
+        "plotter.csv",
+        "plotter.plot",
+    ]
+    assert (tmp_path / "plotter.csv").read_text() == "0,0\n"
+    assert (tmp_path / "plotter-3.csv").read_text() == "2,2\n"
 
-    expected_output = ["1,2,3", "4,5,6"]
-    with open(csv_filepath, "r") as f:
-        output = f.read().splitlines()
-    assert output == expected_output
+
+def test_base_mode_write_csv_no_data(tmp_path):
+    """
+    If no data was captured, an empty CSV file is still written.
+    """
+    csv_filepath = tmp_path / "plotter.csv"
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    view.plotter_pane.stop_capture.return_value = []
+    bm = BaseMode(editor, view)
+    bm.write_plotter_data_to_csv(str(csv_filepath))
+    assert csv_filepath.read_text() == ""
 
 
 def test_base_on_data_flood():
@@ -220,9 +257,13 @@ def test_base_on_data_flood():
     editor = mock.MagicMock()
     view = mock.MagicMock()
     bm = BaseMode(editor, view)
+    bm.save_plotter_data = mock.MagicMock()
     bm.on_data_flood()
+    bm.save_plotter_data.assert_called_once_with()
     view.remove_plotter.assert_called_once_with()
     assert view.show_message.call_count == 1
+    info = view.show_message.call_args[0][1]
+    assert "more than 256 KB of data a second" in info
 
 
 def test_base_mode_open_file():
@@ -684,6 +725,7 @@ def test_micropython_mode_add_plotter(microbit):
     view.show_message = mock.MagicMock()
     view.add_micropython_plotter = mock.MagicMock()
     mm = MicroPythonMode(editor, view)
+    mm.start_plotter_capture = mock.MagicMock()
     mock_repl_connection = mock.MagicMock()
     mock_connection_class = mock.MagicMock(return_value=mock_repl_connection)
     with mock.patch("mu.modes.base.REPLConnection", mock_connection_class):
@@ -691,6 +733,62 @@ def test_micropython_mode_add_plotter(microbit):
     view.show_message.assert_not_called()
     assert view.add_micropython_plotter.call_args[0][1] == mock_repl_connection
     mock_repl_connection.open.assert_called_once_with()
+    mm.start_plotter_capture.assert_called_once_with()
+
+
+def test_micropython_mode_run_script():
+    """
+    Running a script opens the REPL, if needed, and sends the script to the
+    device as a single block.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    mm = MicroPythonMode(editor, view)
+    mm.repl = False
+    mm.connection = mock.MagicMock()
+
+    def toggle_repl(event):
+        mm.repl = True
+
+    mm.toggle_repl = mock.MagicMock(side_effect=toggle_repl)
+    mm.run_script("print('hello')")
+    mm.toggle_repl.assert_called_once_with(None)
+    mm.connection.send_script.assert_called_once_with(
+        "print('hello')", callback=mm.on_run_progress
+    )
+
+
+def test_micropython_mode_run_script_no_repl():
+    """
+    If the REPL can't be opened, the script isn't sent.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    mm = MicroPythonMode(editor, view)
+    mm.repl = False
+    mm.connection = mock.MagicMock()
+    mm.toggle_repl = mock.MagicMock()
+    mm.run_script("print('hello')")
+    assert mm.connection.send_script.call_count == 0
+
+
+def test_micropython_mode_on_run_progress():
+    """
+    The progress of sending the script to the device is shown in the status
+    bar.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    mm = MicroPythonMode(editor, view)
+    mm.on_run_progress(25, 100)
+    editor.show_status_message.assert_called_once_with(
+        "Sending script to device: 25%"
+    )
+    editor.show_status_message.reset_mock()
+    mm.on_run_progress(100, 100)
+    editor.show_status_message.assert_called_once_with(
+        "Script sent to device."
+    )
 
 
 def test_micropython_on_data_flood():
@@ -801,18 +899,106 @@ def test_FileManager_on_start_fails():
     fm.on_list_fail.emit.assert_called_once_with()
 
 
+def test_FileManager_on_stop():
+    """
+    When the thread is about to be quit, the device is taken out of its raw
+    REPL session and the serial connection is closed.
+    """
+    fm = FileManager("/dev/ttyUSB0")
+    mock_serial = mock.MagicMock()
+    fm.serial = mock_serial
+    with mock.patch("mu.modes.base.microfs.end_session") as mock_end:
+        fm.on_stop()
+    mock_end.assert_called_once_with(mock_serial)
+    mock_serial.close.assert_called_once_with()
+    assert fm.serial is None
+
+
+def test_FileManager_on_stop_fails():
+    """
+    If the raw REPL session can't be ended cleanly, the serial connection is
+    still closed.
+    """
+    fm = FileManager("/dev/ttyUSB0")
+    mock_serial = mock.MagicMock()
+    fm.serial = mock_serial
+    mock_end = mock.MagicMock(side_effect=IOError("boom"))
+    with mock.patch("mu.modes.base.microfs.end_session", mock_end):
+        fm.on_stop()
+    mock_serial.close.assert_called_once_with()
+    assert fm.serial is None
+
+
+def test_FileManager_on_stop_no_serial():
+    """
+    If no serial connection was ever made, there's nothing to clean up.
+    """
+    fm = FileManager("/dev/ttyUSB0")
+    with mock.patch("mu.modes.base.microfs.end_session") as mock_end:
+        fm.on_stop()
+    assert mock_end.call_count == 0
+
+
+def test_FileManager_ensure_session_alive():
+    """
+    If the raw REPL session with the device is still alive, it is reused
+    without entering raw mode again.
+    """
+    fm = FileManager("/dev/ttyUSB0")
+    fm.serial = mock.MagicMock()
+    with mock.patch(
+        "mu.modes.base.microfs.session_alive", return_value=True
+    ), mock.patch("mu.modes.base.microfs.start_session") as mock_start:
+        fm.ensure_session()
+    assert mock_start.call_count == 0
+
+
+def test_FileManager_ensure_session_start():
+    """
+    If there is no live raw REPL session with the device, a new one is
+    started.
+    """
+    fm = FileManager("/dev/ttyUSB0")
+    fm.serial = mock.MagicMock()
+    with mock.patch(
+        "mu.modes.base.microfs.session_alive", return_value=False
+    ), mock.patch("mu.modes.base.microfs.start_session") as mock_start:
+        fm.ensure_session()
+    mock_start.assert_called_once_with(fm.serial)
+    assert fm.serial.open.call_count == 0
+
+
+def test_FileManager_ensure_session_reopen():
+    """
+    If a new raw REPL session cannot be started, the serial connection is
+    reopened before trying once more.
+    """
+    fm = FileManager("/dev/ttyUSB0")
+    fm.serial = mock.MagicMock()
+    mock_start = mock.MagicMock(side_effect=[IOError("boom"), None])
+    with mock.patch(
+        "mu.modes.base.microfs.session_alive", return_value=False
+    ), mock.patch("mu.modes.base.microfs.start_session", mock_start):
+        fm.ensure_session()
+    assert mock_start.call_count == 2
+    fm.serial.close.assert_called_once_with()
+    fm.serial.open.assert_called_once_with()
+
+
 def test_FileManager_ls():
     """
     The on_list_files signal is emitted with a tuple of files when microfs.ls
     completes successfully.
     """
     fm = FileManager("/dev/ttyUSB0")
+    fm.ensure_session = mock.MagicMock()
     fm.serial = mock.MagicMock()
     fm.on_list_files = mock.MagicMock()
-    mock_ls = mock.MagicMock(return_value=["foo.py", "bar.py"])
-    with mock.patch("mu.modes.base.microfs.ls", mock_ls):
+    entries = [("foo.py", 10, False), ("lib", 0, True)]
+    mock_ls = mock.MagicMock(return_value=entries)
+    with mock.patch("mu.modes.base.microfs.ls_tree", mock_ls):
         fm.ls()
-    fm.on_list_files.emit.assert_called_once_with(("foo.py", "bar.py"))
+    fm.on_list_files.emit.assert_called_once_with(tuple(entries))
 
 
 def test_FileManager_ls_fail():
@@ -820,8 +1006,11 @@ def test_FileManager_ls_fail():
     The on_list_fail signal is emitted when a problem is encountered.
     """
     fm = FileManager("/dev/ttyUSB0")
+    fm.ensure_session = mock.MagicMock()
     fm.on_list_fail = mock.MagicMock()
-    with mock.patch("mu.modes.base.microfs.ls", side_effect=Exception("boom")):
+    with mock.patch(
+        "mu.modes.base.microfs.ls_tree", side_effect=Exception("boom")
+    ):
         fm.ls()
     fm.on_list_fail.emit.assert_called_once_with()
 
@@ -832,12 +1021,20 @@ def test_fileManager_get():
     microfs.get completes successfully.
     """
     fm = FileManager("/dev/ttyUSB0")
+    fm.ensure_session = mock.MagicMock()
     fm.serial = mock.MagicMock()
     fm.on_get_file = mock.MagicMock()
     mock_get = mock.MagicMock()
+    fm.transfer_progress = mock.MagicMock()
     with mock.patch("mu.modes.base.microfs.get", mock_get):
         fm.get("foo.py", "bar.py")
-    mock_get.assert_called_once_with("foo.py", "bar.py", serial=fm.serial)
+    mock_get.assert_called_once_with(
+        "foo.py",
+        "bar.py",
+        serial=fm.serial,
+        callback=fm.transfer_progress.return_value,
+    )
+    fm.transfer_progress.assert_called_once_with("foo.py")
     fm.on_get_file.emit.assert_called_once_with("foo.py")
 
 
@@ -846,6 +1043,7 @@ def test_FileManager_get_fail():
     The on_get_fail signal is emitted when a problem is encountered.
     """
     fm = FileManager("/dev/ttyUSB0")
+    fm.ensure_session = mock.MagicMock()
     fm.on_get_fail = mock.MagicMock()
     with mock.patch(
         "mu.modes.base.microfs.get", side_effect=Exception("boom")
@@ -860,13 +1058,21 @@ def test_FileManager_put():
     microfs.put completes successfully.
     """
     fm = FileManager("/dev/ttyUSB0")
+    fm.ensure_session = mock.MagicMock()
     fm.serial = mock.MagicMock()
     fm.on_put_file = mock.MagicMock()
     mock_put = mock.MagicMock()
     path = os.path.join("directory", "foo.py")
+    fm.transfer_progress = mock.MagicMock()
     with mock.patch("mu.modes.base.microfs.put", mock_put):
         fm.put(path)
-    mock_put.assert_called_once_with(path, target=None, serial=fm.serial)
+    mock_put.assert_called_once_with(
+        path,
+        target=None,
+        serial=fm.serial,
+        callback=fm.transfer_progress.return_value,
+    )
+    fm.transfer_progress.assert_called_once_with(path)
     fm.on_put_file.emit.assert_called_once_with("foo.py")
 
 
@@ -875,6 +1081,7 @@ def test_FileManager_put_fail():
     The on_put_fail signal is emitted when a problem is encountered.
     """
     fm = FileManager("/dev/ttyUSB0")
+    fm.ensure_session = mock.MagicMock()
     fm.on_put_fail = mock.MagicMock()
     with mock.patch(
         "mu.modes.base.microfs.put", side_effect=Exception("boom")
@@ -883,12 +1090,27 @@ def test_FileManager_put_fail():
     fm.on_put_fail.emit.assert_called_once_with("foo.py")
 
 
+def test_FileManager_transfer_progress():
+    """
+    The callback returned for a file re-emits the progress reported by
+    microfs via the on_transfer_progress signal.
+    """
+    fm = FileManager("/dev/ttyUSB0")
+    fm.on_transfer_progress = mock.MagicMock()
+    callback = fm.transfer_progress("foo.py")
+    callback(256, 1024, 3000.0)
+    fm.on_transfer_progress.emit.assert_called_once_with(
+        "foo.py", 256, 1024, 3000.0
+    )
+
+
 def test_FileManager_delete():
     """
     The on_delete_file signal is emitted with the name of the effected file
     when microfs.rm completes successfully.
     """
     fm = FileManager("/dev/ttyUSB0")
+    fm.ensure_session = mock.MagicMock()
     fm.serial = mock.MagicMock()
     fm.on_delete_file = mock.MagicMock()
     mock_rm = mock.MagicMock()
@@ -903,12 +1125,51 @@ def test_FileManager_delete_fail():
     The on_delete_fail signal is emitted when a problem is encountered.
     """
     fm = FileManager("/dev/ttyUSB0")
+    fm.ensure_session = mock.MagicMock()
     fm.on_delete_fail = mock.MagicMock()
     with mock.patch("mu.modes.base.microfs.rm", side_effect=Exception("boom")):
         fm.delete("foo.py")
     fm.on_delete_fail.emit.assert_called_once_with("foo.py")
 
 
+def test_FileManager_sync():
+    """
+    The on_sync signal is emitted with the report from microfs.sync, which
+    caches local hashes in Mu's data directory.
+    """
+    fm = FileManager("/dev/ttyUSB0")
+    fm.ensure_session = mock.MagicMock()
+    fm.serial = mock.MagicMock()
+    fm.on_sync = mock.MagicMock()
+    report = [("foo.py", "new"), ("bar.py", "unchanged")]
+    mock_sync = mock.MagicMock(return_value=report)
+    with mock.patch("mu.modes.base.microfs.sync", mock_sync), mock.patch(
+        "mu.modes.base.config.DATA_DIR", "/data"
+    ):
+        fm.sync("/home/foo", dry_run=True)
+    mock_sync.assert_called_once_with(
+        "/home/foo",
+        serial=fm.serial,
+        dry_run=True,
+        manifest=os.path.join("/data", "sync_manifest.json"),
+    )
+    fm.on_sync.emit.assert_called_once_with(tuple(report), True)
+
+
+def test_FileManager_sync_fail():
+    """
+    The on_sync_fail signal is emitted when a problem is encountered.
+    """
+    fm = FileManager("/dev/ttyUSB0")
+    fm.ensure_session = mock.MagicMock()
+    fm.on_sync_fail = mock.MagicMock()
+    with mock.patch(
+        "mu.modes.base.microfs.sync", side_effect=Exception("boom")
+    ):
+        fm.sync("/home/foo")
+    fm.on_sync_fail.emit.assert_called_once_with("/home/foo")
+
+
 def test_REPLConnection_init_default_args():
     """
     Ensure the MicroPython REPLConnection object is instantiated as expected.
@@ -939,6 +1200,9 @@ def test_REPLConnection_open():
     mock_serial.setBaudRate.assert_called_once_with(9600)
     mock_serial.open.assert_called_once_with(QIODevice.ReadWrite)
     mock_serial.readyRead.connect.assert_called_once_with(conn._on_serial_read)
+    mock_serial.bytesWritten.connect.assert_called_once_with(
+        conn._on_bytes_written
+    )
 
 
 def test_REPLConnection_open_unable_to_connect():
@@ -1044,20 +1308,285 @@ def test_REPLConnection_send_interrupt():
 
 def test_REPLConnection_execute():
     """
-    Ensure the first command is sent via serial to the connected device, and
-    further commands are scheduled for the future.
+    Ensure a burst of commands is sent via serial to the connected device,
+    and the remaining commands are scheduled for the future.
     """
     mock_serial_class = mock.MagicMock()
+    mock_serial_class().bytesToWrite.return_value = 0
     with mock.patch("mu.modes.base.QSerialPort", mock_serial_class):
         conn = REPLConnection("COM0")
         conn.write = mock.MagicMock()
+    conn.write_burst = 2
+    callback = mock.MagicMock()
 
-    # Mocks QTimer, so only first command will be sent
-    commands = [b"A", b"B"]
+    # Mocks QTimer, so only the first burst of commands will be sent
+    commands = [b"A", b"B", b"C"]
+    with mock.patch("mu.modes.base.QTimer") as mock_timer:
+        conn.execute(commands, callback)
+        assert conn.write.call_args_list == [mock.call(b"A"), mock.call(b"B")]
+        mock_timer.singleShot.assert_called_once_with(
+            conn.write_delay, conn._drain
+        )
+        callback.assert_called_once_with(2, 3)
+        # While a burst is pending, further commands are only queued.
+        conn.execute([b"D"])
+        assert conn.write.call_count == 2
+        conn._drain()
+    assert conn.write.call_args_list[2:] == [mock.call(b"C"), mock.call(b"D")]
+    callback.assert_called_with(3, 3)
+    assert len(conn.write_queue) == 0
+
+
+def test_REPLConnection_execute_control_commands():
+    """
+    Each control character ends a burst, so the device has a pause to act
+    on it (e.g. to soft reboot) before anything more is sent, while the
+    commands that follow are still sent together.
+    """
+    mock_serial_class = mock.MagicMock()
+    mock_serial_class().bytesToWrite.return_value = 0
+    with mock.patch("mu.modes.base.QSerialPort", mock_serial_class):
+        conn = REPLConnection("COM0")
+        conn.write = mock.MagicMock()
+    commands = [b"\x03", b"\x01", b"\x04", b"a = 1\r", b"b = 2\r", b"\x04"]
     with mock.patch("mu.modes.base.QTimer") as mock_timer:
         conn.execute(commands)
-        conn.write.assert_called_once_with(b"A")
-        assert mock_timer.singleShot.call_count == 1
+        conn.write.assert_called_once_with(b"\x03")
+        conn._drain()
+        conn.write.assert_called_with(b"\x01")
+        conn._drain()
+        conn.write.assert_called_with(b"\x04")
+        assert conn.write.call_count == 3
+        conn._drain()
+    assert conn.write.call_args_list[3:] == [
+        mock.call(b"a = 1\r"),
+        mock.call(b"b = 2\r"),
+        mock.call(b"\x04"),
+    ]
+    assert mock_timer.singleShot.call_count == 3
+    assert len(conn.write_queue) == 0
+
+
+def test_REPLConnection_execute_backpressure():
+    """
+    If the port has a burst's worth of data still to write, nothing more is
+    written until the bytesWritten signal shows it has caught up.
+    """
+    mock_serial_class = mock.MagicMock()
+    mock_serial_class().bytesToWrite.return_value = 256
+    with mock.patch("mu.modes.base.QSerialPort", mock_serial_class):
+        conn = REPLConnection("COM0")
+        conn.write = mock.MagicMock()
+    conn.write_burst = 256
+    with mock.patch("mu.modes.base.QTimer") as mock_timer:
+        conn.execute([b"A"])
+        assert conn.write.call_count == 0
+        assert mock_timer.singleShot.call_count == 0
+        conn._on_bytes_written(256)
+        mock_timer.singleShot.assert_called_once_with(0, conn._drain)
+    mock_serial_class().bytesToWrite.return_value = 0
+    conn._drain()
+    conn.write.assert_called_once_with(b"A")
+
+
+def script_connection():
+    """
+    Return a REPLConnection whose writes are recorded, for exercising
+    send_script.
+    """
+    mock_serial_class = mock.MagicMock()
+    mock_serial_class().bytesToWrite.return_value = 0
+    with mock.patch("mu.modes.base.QSerialPort", mock_serial_class):
+        conn = REPLConnection("COM0")
+    conn.write = mock.MagicMock()
+    conn.data_received = mock.MagicMock()
+    return conn
+
+
+def test_REPLConnection_send_script_raw_paste():
+    """
+    The script is sent via raw-paste mode, a window at a time, and only the
+    script's output is emitted.
+    """
+    conn = script_connection()
+    callback = mock.MagicMock()
+    with mock.patch("mu.modes.base.QTimer"):
+        conn.send_script("print(1)\nprint(2)\n", callback)
+        # Control characters are paced, each in a burst of its own.
+        conn._drain()
+        conn._drain()
+        assert conn.write.call_args_list == [
+            mock.call(b"\x03"),
+            mock.call(b"\x03"),
+            mock.call(b"\x01"),
+        ]
+        conn.write.reset_mock()
+        conn._on_script_data(b"\r\nraw REPL; CTRL-B")
+        assert conn.write.call_count == 0
+        conn._on_script_data(b" to exit\r\n>")
+        conn.write.assert_called_once_with(b"\x04")
+        conn.write.reset_mock()
+        conn._on_script_data(b"MPY: soft reboot\r\nraw REPL; CTRL-B to exit")
+        conn._on_script_data(b"\r\n>")
+        conn.write.assert_called_once_with(b"\x05A\x01")
+        conn.write.reset_mock()
+        # A window of 10 bytes.
+        conn._on_script_data(b"R\x01\x0a\x00")
+        conn.write.assert_called_once_with(b"print(1)\np")
+        callback.assert_called_once_with(10, 18)
+        conn.write.reset_mock()
+        # The device asks for another window.
+        conn._on_script_data(b"\x01")
+        assert conn.write.call_args_list == [
+            mock.call(b"rint(2)\n"),
+            mock.call(b"\x04"),
+        ]
+        callback.assert_called_with(18, 18)
+        conn.write.reset_mock()
+        conn._on_script_data(b"\x041\r\n")
+        conn._on_script_data(b"2\r\n\x04\x04>")
+    assert conn.data_received.emit.call_args_list == [
+        mock.call(b"1\r\n"),
+        mock.call(b"2\r\n"),
+    ]
+    conn.write.assert_called_once_with(b"\x02")
+    assert conn._script_state is None
+
+
+def test_REPLConnection_send_script_raw():
+    """
+    If the device doesn't support raw-paste mode, the script is sent in
+    normal raw mode instead.
+    """
+    conn = script_connection()
+    conn.execute = mock.MagicMock()
+    callback = mock.MagicMock()
+    with mock.patch("mu.modes.base.QTimer"):
+        conn.send_script("print(1)\n", callback)
+        conn._script_state = "paste"
+        conn._on_script_data(b"R\x00")
+        conn.execute.assert_called_with(
+            [b"print(1)\n", b"\x04"], conn._on_script_written
+        )
+        conn._on_script_data(b"OK1\r\n\x04Traceback\x04>")
+    assert conn.data_received.emit.call_args_list == [
+        mock.call(b"1\r\nTraceback"),
+    ]
+    conn.write.assert_called_once_with(b"\x02")
+
+
+def test_REPLConnection_send_script_raw_refreshes_timeout():
+    """
+    While a script is written in normal raw mode, each chunk written
+    restarts the timeout, and the progress is passed on to the callback.
+    """
+    conn = script_connection()
+    callback = mock.MagicMock()
+    with mock.patch("mu.modes.base.QTimer") as mock_timer:
+        conn.send_script("print(1)\n" * 100, callback)
+        conn._script_state = "paste"
+        conn._on_script_data(b"R\x00")
+        # Write the rest of the control characters that enter raw mode.
+        conn._drain()
+        conn._drain()
+        generation = conn._script_generation
+        mock_timer.singleShot.reset_mock()
+        conn._drain()
+    conn.write.assert_called_with(("print(1)\n" * 100).encode()[:256])
+    assert conn._script_state == "ok"
+    assert conn._script_generation == generation + 1
+    timeouts = [
+        call[0]
+        for call in mock_timer.singleShot.call_args_list
+        if call[0][1] != conn._drain
+    ]
+    assert len(timeouts) == 1
+    callback.assert_called_once_with(1, 5)
+    # A stale timeout from before the chunk was written is ignored.
+    conn._script_timeout(generation)
+    assert conn._script_state == "ok"
+
+
+def test_REPLConnection_send_script_timeout():
+    """
+    If the device doesn't respond, data received is emitted as usual again.
+    """
+    conn = script_connection()
+    with mock.patch("mu.modes.base.QTimer") as mock_timer:
+        conn.send_script("print(1)\n")
+        conn._on_script_data(b"Hello")
+    timeout = [
+        call[0]
+        for call in mock_timer.singleShot.call_args_list
+        if call[0][1] != conn._drain
+    ][-1]
+    assert timeout[0] == 2000
+    timeout[1]()
+    conn.data_received.emit.assert_called_once_with(b"Hello")
+    assert conn._script_state is None
+    # Stale timeouts are ignored.
+    conn._script_state = "raw"
+    conn._script_timeout(0)
+    assert conn._script_state == "raw"
+
+
+def test_REPLConnection_send_script_timeout_leaves_raw_mode():
+    """
+    If the device stops responding before the script has been run, it's
+    taken out of raw mode so the REPL isn't left hanging.
+    """
+    conn = script_connection()
+    conn._script_state = "raw"
+    conn._script_generation = 1
+    conn._script_timeout(1)
+    conn.write.assert_called_once_with(b"\x02")
+
+
+def test_REPLConnection_send_script_timeout_ends_paste():
+    """
+    If the device stops responding during a raw-paste, the paste is ended
+    with CTRL-D before raw mode is left with CTRL-B.
+    """
+    for state in ("pasting", "pasted"):
+        conn = script_connection()
+        conn._script_state = state
+        conn._script_generation = 1
+        conn._script_timeout(1)
+        assert conn.write.call_args_list == [
+            mock.call(b"\x04"),
+            mock.call(b"\x02"),
+        ]
+        assert conn._script_state is None
+
+
+def test_REPLConnection_send_script_late_prompt():
+    """
+    The raw REPL's prompt is consumed even if it arrives after the end of
+    the script's output, so it isn't shown in the REPL pane.
+    """
+    conn = script_connection()
+    conn._script_state = "output"
+    conn._script_eof = 0
+    conn._on_script_data(b"1\r\n\x04\x04")
+    assert conn.write.call_count == 0
+    assert conn._script_state == "output"
+    conn._on_script_data(b">")
+    conn.data_received.emit.assert_called_once_with(b"1\r\n")
+    conn.write.assert_called_once_with(b"\x02")
+    assert conn._script_state is None
+
+
+def test_REPLConnection_on_serial_read_script():
+    """
+    While a script is being run, data from the device is filtered.
+    """
+    conn = script_connection()
+    conn.serial.readAll.return_value = b"Hello"
+    conn._script_state = "raw"
+    conn._on_script_data = mock.MagicMock()
+    conn._on_serial_read()
+    conn._on_script_data.assert_called_once_with(b"Hello")
+    assert conn.data_received.emit.call_count == 0
 
 
 def test_REPLConnection_send_commands():
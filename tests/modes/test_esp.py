@@ -5,6 +5,7 @@ from unittest import mock
 from mu.modes.esp import ESPMode
 from mu.modes.api import ESP_APIS, SHARED_APIS
 from mu.logic import Device
+from PyQt5.QtCore import Qt
 
 
 @pytest.fixture
@@ -122,6 +123,26 @@ def test_remove_fs(esp_mode):
     assert esp_mode.fs is None
 
 
+def test_remove_fs_stops_file_manager(esp_mode):
+    """
+    Removing the file system ends the file manager's raw REPL session before
+    its thread is quit.
+    """
+    esp_mode.fs = True
+    file_manager = mock.MagicMock()
+    thread = mock.MagicMock()
+    esp_mode.file_manager = file_manager
+    esp_mode.file_manager_thread = thread
+    with mock.patch("mu.modes.esp.QMetaObject") as mock_meta:
+        esp_mode.remove_fs()
+    mock_meta.invokeMethod.assert_called_once_with(
+        file_manager, "on_stop", Qt.BlockingQueuedConnection
+    )
+    thread.quit.assert_called_once_with()
+    thread.wait.assert_called_once_with()
+    assert esp_mode.file_manager is None
+
+
 def test_toggle_repl_on(esp_mode):
     """
     Ensure the REPL is able to toggle on if there's no file system pane.
@@ -267,6 +288,9 @@ def test_run(esp_mode):
     with mock.patch("mu.modes.base.REPLConnection", mock_connection_class):
         esp_mode.run()
     esp_mode.set_buttons.assert_called_once_with(files=False)
+    mock_connection_class().send_script.assert_called_once_with(
+        mock.ANY, callback=esp_mode.on_run_progress
+    )
 
 
 def test_on_data_flood(esp_mode):
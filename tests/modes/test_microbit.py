@@ -2,17 +2,25 @@
 """
 Tests for the micro:bit mode.
 """
+
 import os
 import os.path
 import pytest
 from mu.config import HOME_DIRECTORY
 from mu.logic import Device
-from mu.modes.microbit import MicrobitMode, DeviceFlasher, can_minify
+from mu.modes.microbit import (
+    MicrobitMode,
+    DeviceFlasher,
+    MultiDeviceFlasher,
+    Minifier,
+    FleetProbe,
+    can_minify,
+)
 from mu.modes.api import MICROBIT_APIS, SHARED_APIS
-from mu.contrib import uflash
+from mu.contrib import uflash, microfs
 from unittest import mock
 from tokenize import TokenError
-
+from PyQt5.QtCore import Qt
 
 TEST_ROOT = os.path.split(os.path.dirname(__file__))[0]
 
@@ -69,6 +77,43 @@ def test_DeviceFlasher_run_fail():
     df.on_flash_fail.emit.assert_called_once_with(str(Exception("Boom")))
 
 
+def test_MultiDeviceFlasher_run(tmp_path):
+    """
+    Ensure the hex is generated once and written to every micro:bit, and
+    that a micro:bit failing doesn't stop the others being flashed.
+    """
+    paths = [str(tmp_path / "MICROBIT"), str(tmp_path / "MICROBIT1")]
+    os.mkdir(paths[0])
+    mdf = MultiDeviceFlasher(paths, b"print('hello')", None)
+    mdf.on_device_written = mock.MagicMock()
+    mdf.on_device_fail = mock.MagicMock()
+    mdf.run()
+    mdf.on_device_written.emit.assert_called_once_with(paths[0])
+    assert mdf.on_device_fail.emit.call_count == 1
+    assert mdf.on_device_fail.emit.call_args[0][0] == paths[1]
+    with open(os.path.join(paths[0], "micropython.hex")) as hex_file:
+        micropython_hex = hex_file.read()
+    assert uflash.extract_script(micropython_hex) == "print('hello')"
+
+
+def test_MultiDeviceFlasher_run_bad_script():
+    """
+    If the hex can't be generated, ensure every micro:bit is failed.
+    """
+    mdf = MultiDeviceFlasher(["a", "b"], b"x" * 8192, None)
+    mdf.on_device_written = mock.MagicMock()
+    mdf.on_device_fail = mock.MagicMock()
+    mock_save = mock.MagicMock()
+    with mock.patch("mu.modes.microbit.uflash.save_hex", mock_save):
+        mdf.run()
+    assert mock_save.call_count == 0
+    assert mdf.on_device_written.emit.call_count == 0
+    assert [c[0][0] for c in mdf.on_device_fail.emit.call_args_list] == [
+        "a",
+        "b",
+    ]
+
+
 def test_microbit_mode():
     """
     Sanity check for setting up the mode.
@@ -84,15 +129,17 @@ def test_microbit_mode():
 
     with mock.patch("mu.modes.microbit.CHARTS", True):
         actions = mm.actions()
-    assert len(actions) == 4
+    assert len(actions) == 5
     assert actions[0]["name"] == "flash"
     assert actions[0]["handler"] == mm.flash
-    assert actions[1]["name"] == "files"
-    assert actions[1]["handler"] == mm.toggle_files
-    assert actions[2]["name"] == "repl"
-    assert actions[2]["handler"] == mm.toggle_repl
-    assert actions[3]["name"] == "plotter"
-    assert actions[3]["handler"] == mm.toggle_plotter
+    assert actions[1]["name"] == "flash_all"
+    assert actions[1]["handler"] == mm.flash_all
+    assert actions[2]["name"] == "files"
+    assert actions[2]["handler"] == mm.toggle_files
+    assert actions[3]["name"] == "repl"
+    assert actions[3]["handler"] == mm.toggle_repl
+    assert actions[4]["name"] == "plotter"
+    assert actions[4]["handler"] == mm.toggle_plotter
 
 
 def test_microbit_mode_no_charts():
@@ -104,13 +151,15 @@ def test_microbit_mode_no_charts():
     mm = MicrobitMode(editor, view)
     with mock.patch("mu.modes.microbit.CHARTS", False):
         actions = mm.actions()
-        assert len(actions) == 3
+        assert len(actions) == 4
         assert actions[0]["name"] == "flash"
         assert actions[0]["handler"] == mm.flash
-        assert actions[1]["name"] == "files"
-        assert actions[1]["handler"] == mm.toggle_files
-        assert actions[2]["name"] == "repl"
-        assert actions[2]["handler"] == mm.toggle_repl
+        assert actions[1]["name"] == "flash_all"
+        assert actions[1]["handler"] == mm.flash_all
+        assert actions[2]["name"] == "files"
+        assert actions[2]["handler"] == mm.toggle_files
+        assert actions[3]["name"] == "repl"
+        assert actions[3]["handler"] == mm.toggle_repl
 
 
 def test_flash_no_tab():
@@ -275,9 +324,10 @@ def test_flash_device_has_latest_firmware_encounters_serial_problem_unix(
         )
         mock_flasher.start.assert_called_once_with()
         assert mm.flash_timer == mock_timer
-        mock_timer.timeout.connect.assert_called_once_with(mm.flash_finished)
-        mock_timer.setSingleShot.assert_called_once_with(True)
-        mock_timer.start.assert_called_once_with(10000)
+        mock_timer.timeout.connect.assert_called_once_with(mm.check_flash)
+        mock_timer.start.assert_called_once_with(mm.flash_poll_interval)
+        assert mm.flash_watch["path"] == "bar"
+        assert mm.flash_watch["port"] == "COM0"
 
 
 def test_flash_with_attached_device_has_latest_firmware_encounters_problem(
@@ -364,7 +414,7 @@ def test_flash_with_attached_device_has_old_firmware(microbit_old_firmware):
         mm.flash()
         assert mm.flash_thread == mock_flasher
         assert editor.show_status_message.call_count == 1
-        mm.set_buttons.assert_called_once_with(flash=False)
+        mm.set_buttons.assert_called_once_with(flash=False, flash_all=False)
         mock_flasher_class.assert_called_once_with(["bar"], b"", None)
         mock_flasher.finished.connect.assert_called_once_with(
             mm.flash_finished
@@ -405,7 +455,7 @@ def test_flash_force_with_no_micropython(microbit):
         mm.flash()
         assert mm.flash_thread == mock_flasher
         assert editor.show_status_message.call_count == 1
-        mm.set_buttons.assert_called_once_with(flash=False)
+        mm.set_buttons.assert_called_once_with(flash=False, flash_all=False)
         mock_flasher_class.assert_called_once_with(["bar"], b"", "/foo/bar")
         mock_flasher.finished.connect.assert_called_once_with(
             mm.flash_finished
@@ -489,7 +539,7 @@ def test_flash_force_with_attached_device_as_windows(microbit):
         mm.flash()
         assert mm.flash_thread == mock_flasher
         assert editor.show_status_message.call_count == 1
-        mm.set_buttons.assert_called_once_with(flash=False)
+        mm.set_buttons.assert_called_once_with(flash=False, flash_all=False)
         mock_flasher_class.assert_called_once_with(["bar"], b"", "/foo/bar")
         mock_flasher.finished.connect.assert_called_once_with(
             mm.flash_finished
@@ -547,12 +597,13 @@ def test_flash_forced_with_attached_device_as_not_windows(
         mm.flash()
         assert mm.flash_timer == mock_timer
         assert editor.show_status_message.call_count == 1
-        mm.set_buttons.assert_called_once_with(flash=False)
+        mm.set_buttons.assert_called_once_with(flash=False, flash_all=False)
         mock_flasher_class.assert_called_once_with(["bar"], b"", None)
         assert mock_flasher.finished.connect.call_count == 0
-        mock_timer.timeout.connect.assert_called_once_with(mm.flash_finished)
-        mock_timer.setSingleShot.assert_called_once_with(True)
-        mock_timer.start.assert_called_once_with(10000)
+        mock_timer.timeout.connect.assert_called_once_with(mm.check_flash)
+        mock_timer.start.assert_called_once_with(mm.flash_poll_interval)
+        assert mm.flash_watch["path"] == "bar"
+        assert mm.flash_watch["port"] == "COM0"
         mock_flasher.on_flash_fail.connect.assert_called_once_with(
             mm.flash_failed
         )
@@ -883,7 +934,7 @@ def test_flash_finished_copy_main():
     mm.flash_thread = mock.MagicMock()
     mm.flash_timer = mock.MagicMock()
     mm.flash_finished()
-    mm.set_buttons.assert_called_once_with(flash=True)
+    mm.set_buttons.assert_called_once_with(flash=True, flash_all=True)
     editor.show_status_message.assert_called_once_with("Finished flashing.")
     assert mm.flash_thread is None
     assert mm.flash_timer is None
@@ -905,7 +956,7 @@ def test_flash_finished_copy_main_encounters_error():
     mm.flash_thread = mock.MagicMock()
     mm.flash_timer = mock.MagicMock()
     mm.flash_finished()
-    mm.set_buttons.assert_called_once_with(flash=True)
+    mm.set_buttons.assert_called_once_with(flash=True, flash_all=True)
     editor.show_status_message.assert_called_once_with("Finished flashing.")
     assert mm.flash_thread is None
     assert mm.flash_timer is None
@@ -927,7 +978,7 @@ def test_flash_finished_no_copy():
     mm.flash_thread = mock.MagicMock()
     mm.flash_timer = mock.MagicMock()
     mm.flash_finished()
-    mm.set_buttons.assert_called_once_with(flash=True)
+    mm.set_buttons.assert_called_once_with(flash=True, flash_all=True)
     editor.show_status_message.assert_called_once_with("Finished flashing.")
     assert mm.flash_thread is None
     assert mm.flash_timer is None
@@ -959,16 +1010,15 @@ def test_copy_main_with_python_script():
     mm = MicrobitMode(editor, view)
     mm.python_script = "import love"
     with mock.patch("mu.modes.microbit.microfs") as mock_microfs:
-        mock_microfs.execute.return_value = ("", "")
+        mock_microfs.hashes.return_value = {"main.py": None}
         mm.copy_main()
         serial = mock_microfs.get_serial()
-        expected = [
-            "fd = open('main.py', 'wb')",
-            "f = fd.write",
-            "f('import love')",
-            "fd.close()",
-        ]
-        mock_microfs.execute.assert_called_once_with(expected, serial)
+        mock_microfs.start_session.assert_called_once_with(serial)
+        mock_microfs.hashes.assert_called_once_with(["main.py"], serial)
+        mock_microfs.put_content.assert_called_once_with(
+            b"import love", "main.py", serial
+        )
+        mock_microfs.end_session.assert_called_once_with(serial)
         serial.write.call_count == 2
         assert serial.write.call_args_list[0][0][0] == b"import microbit\r\n"
         assert serial.write.call_args_list[1][0][0] == b"microbit.reset()\r\n"
@@ -976,18 +1026,179 @@ def test_copy_main_with_python_script():
         assert mm.python_script == ""
 
 
+def test_copy_main_unchanged():
+    """
+    If the main.py on the device is the same as self.python_script, ensure
+    it isn't copied again, but the device is still restarted.
+    """
+    mm = MicrobitMode(mock.MagicMock(), mock.MagicMock())
+    mm.python_script = b"import love"
+    remote = ("sha256", 11, microfs.content_hash(b"import love", "sha256"))
+    with mock.patch("mu.modes.microbit.microfs.get_serial") as get_serial:
+        with mock.patch(
+            "mu.modes.microbit.microfs.hashes",
+            return_value={"main.py": remote},
+        ), mock.patch("mu.modes.microbit.microfs.start_session"), mock.patch(
+            "mu.modes.microbit.microfs.end_session"
+        ), mock.patch(
+            "mu.modes.microbit.microfs.put_content"
+        ) as mock_put:
+            mm.copy_main()
+    assert mock_put.call_count == 0
+    assert get_serial().write.call_count == 2
+
+
 def test_copy_main_with_python_script_encounters_device_error():
     """
-    If the device returns an error, then copy_main should raise an IOError.
+    If the device returns an error, then copy_main should raise an IOError
+    (and leave the session).
     """
     view = mock.MagicMock()
     editor = mock.MagicMock()
     mm = MicrobitMode(editor, view)
     mm.python_script = "import love"
     with mock.patch("mu.modes.microbit.microfs") as mock_microfs:
-        mock_microfs.execute.return_value = ("", "BANG!")
+        mock_microfs.hashes.side_effect = IOError("BANG!")
         with pytest.raises(IOError):
             mm.copy_main()
+        mock_microfs.end_session.assert_called_once_with(
+            mock_microfs.get_serial()
+        )
+
+
+def test_flash_caches_board_version(microbit):
+    """
+    Ensure the version of MicroPython on a board is only asked for once,
+    until the board is flashed with a new runtime.
+    """
+    version_info = {
+        "sysname": "microbit",
+        "nodename": "microbit",
+        "release": uflash.MICROPYTHON_VERSION,
+        "version": (
+            "micro:bit v0.1.0-b'e10a5ff' on 2018-6-8; MicroPython "
+            "v1.9.2-34-gd64154c73 on 2017-09-01"
+        ),
+        "machine": "micro:bit with nRF51822",
+    }
+    view = mock.MagicMock()
+    view.current_tab.text = mock.MagicMock(return_value="foo")
+    editor = mock.MagicMock()
+    editor.minify = False
+    editor.microbit_runtime = ""
+    editor.current_device = microbit
+    mm = MicrobitMode(editor, view)
+    mm.copy_main = mock.MagicMock()
+    with mock.patch(
+        "mu.modes.microbit.uflash.find_microbit", return_value="bar"
+    ), mock.patch(
+        "mu.modes.microbit.microfs.version", return_value=version_info
+    ) as mock_version, mock.patch(
+        "mu.modes.microbit.os.path.exists", return_value=True
+    ):
+        mm.flash()
+        mm.flash()
+        assert mock_version.call_count == 1
+        assert mm.board_versions == {
+            microbit.serial_number: uflash.MICROPYTHON_VERSION
+        }
+        assert mm.copy_main.call_count == 2
+        mm.board_versions[microbit.serial_number] = "0.0.1"
+        with mock.patch("mu.modes.microbit.DeviceFlasher"), mock.patch(
+            "mu.modes.microbit.QTimer"
+        ):
+            mm.flash()
+        assert mm.board_versions == {}
+
+
+def test_check_flash_restarted():
+    """
+    Ensure flashing is finished once the micro:bit's drive and serial port
+    have disappeared and come back, without waiting for the fallback.
+    """
+    mm = MicrobitMode(mock.MagicMock(), mock.MagicMock())
+    mm.flash_finished = mock.MagicMock()
+    mm.flash_thread = mock.MagicMock()
+    mm.flash_thread.isRunning.return_value = True
+    mm.flash_watch = {
+        "path": "bar",
+        "port": "/dev/ttyACM0",
+        "restarting": False,
+        "start": 0,
+    }
+    port = mock.MagicMock()
+    port.portName.return_value = "ttyACM0"
+    ports = [port]
+    mounted = [True]
+    with mock.patch(
+        "mu.modes.microbit.os.path.exists", side_effect=lambda p: mounted[0]
+    ), mock.patch(
+        "mu.modes.microbit.QSerialPortInfo.availablePorts",
+        side_effect=lambda: ports,
+    ), mock.patch(
+        "mu.modes.microbit.os.name", "posix"
+    ), mock.patch(
+        "time.monotonic", return_value=1
+    ):
+        mm.check_flash()
+        assert mm.flash_watch["start"] == 1
+        mm.flash_thread.isRunning.return_value = False
+        mm.check_flash()
+        mounted[0] = False
+        mm.check_flash()
+        assert mm.flash_watch["restarting"]
+        mounted[0] = True
+        ports = []
+        mm.check_flash()
+        assert mm.flash_finished.call_count == 0
+        ports = [port]
+        mm.check_flash()
+    mm.flash_finished.assert_called_once_with()
+
+
+def test_check_flash_fallback():
+    """
+    If the micro:bit can't be seen to restart, ensure flashing is finished
+    after flash_fallback seconds.
+    """
+    mm = MicrobitMode(mock.MagicMock(), mock.MagicMock())
+    mm.flash_finished = mock.MagicMock()
+    mm.flash_watch = {
+        "path": "bar",
+        "port": None,
+        "restarting": False,
+        "start": 0,
+    }
+    with mock.patch(
+        "mu.modes.microbit.os.path.exists", return_value=True
+    ), mock.patch("time.monotonic", return_value=mm.flash_fallback):
+        mm.check_flash()
+        assert mm.flash_finished.call_count == 0
+    with mock.patch(
+        "mu.modes.microbit.os.path.exists", return_value=True
+    ), mock.patch("time.monotonic", return_value=mm.flash_fallback + 1):
+        mm.check_flash()
+    mm.flash_finished.assert_called_once_with()
+
+
+def test_check_flash_timeout():
+    """
+    If the micro:bit doesn't come back after flashing, ensure flashing is
+    finished after flash_timeout seconds.
+    """
+    mm = MicrobitMode(mock.MagicMock(), mock.MagicMock())
+    mm.flash_finished = mock.MagicMock()
+    mm.flash_watch = {
+        "path": "bar",
+        "port": None,
+        "restarting": True,
+        "start": 0,
+    }
+    with mock.patch(
+        "mu.modes.microbit.os.path.exists", return_value=False
+    ), mock.patch("time.monotonic", return_value=mm.flash_timeout + 1):
+        mm.check_flash()
+    mm.flash_finished.assert_called_once_with()
 
 
 def test_flash_failed():
@@ -1003,12 +1214,246 @@ def test_flash_failed():
     mm.flash_thread = mock.MagicMock()
     mm.flash_failed("Boom")
     assert view.show_message.call_count == 1
-    mm.set_buttons.assert_called_once_with(flash=True)
+    mm.set_buttons.assert_called_once_with(flash=True, flash_all=True)
     assert mm.flash_thread is None
     assert mm.flash_timer is None
     mock_timer.stop.assert_called_once_with()
 
 
+def test_flash_all_no_tab():
+    """
+    If there's no active tab, there's nothing to flash.
+    """
+    view = mock.MagicMock()
+    view.current_tab = None
+    mm = MicrobitMode(mock.MagicMock(), view)
+    with mock.patch("mu.modes.microbit.MultiDeviceFlasher") as mock_flasher:
+        mm.flash_all()
+    assert mock_flasher.call_count == 0
+
+
+def test_flash_all_too_long():
+    """
+    Ensure the user is told if their script is too long to flash.
+    """
+    view = mock.MagicMock()
+    view.current_tab.text = mock.MagicMock(return_value="#" + ("x" * 8193))
+    editor = mock.MagicMock()
+    editor.minify = False
+    mm = MicrobitMode(editor, view)
+    with mock.patch("mu.modes.microbit.MultiDeviceFlasher") as mock_flasher:
+        mm.flash_all()
+    assert mock_flasher.call_count == 0
+    assert view.show_message.call_count == 1
+
+
+def test_flash_all_no_microbits():
+    """
+    Ensure the user is told if no micro:bits can be found.
+    """
+    view = mock.MagicMock()
+    view.current_tab.text = mock.MagicMock(return_value="print('hello')")
+    editor = mock.MagicMock()
+    editor.connected_devices = []
+    mm = MicrobitMode(editor, view)
+    with mock.patch(
+        "mu.modes.microbit.uflash.find_microbits", return_value=[]
+    ), mock.patch("mu.modes.microbit.MultiDeviceFlasher") as mock_flasher:
+        mm.flash_all()
+    assert mock_flasher.call_count == 0
+    assert view.show_message.call_count == 1
+
+
+def test_flash_all(microbit):
+    """
+    Ensure every micro:bit found is flashed by a MultiDeviceFlasher, and its
+    progress is followed.
+    """
+    view = mock.MagicMock()
+    view.current_tab.text = mock.MagicMock(return_value="print('hello')")
+    editor = mock.MagicMock()
+    editor.minify = False
+    editor.microbit_runtime = ""
+    editor.connected_devices = [microbit]
+    mm = MicrobitMode(editor, view)
+    mm.set_buttons = mock.MagicMock()
+    paths = ["/media/MICROBIT", "/media/MICROBIT1"]
+    with mock.patch(
+        "mu.modes.microbit.uflash.find_microbits", return_value=paths
+    ), mock.patch(
+        "mu.modes.microbit.uflash.board_id", side_effect=["9900A", None]
+    ), mock.patch(
+        "mu.modes.microbit.MultiDeviceFlasher"
+    ) as mock_flasher, mock.patch(
+        "mu.modes.microbit.QTimer"
+    ) as mock_timer:
+        mm.flash_all()
+    mock_flasher.assert_called_once_with(paths, b"print('hello')", None)
+    mock_flasher().start.assert_called_once_with()
+    mock_timer().start.assert_called_once_with(mm.fleet_poll_interval)
+    assert mm.fleet_boards == {
+        "/media/MICROBIT": "9900A",
+        "/media/MICROBIT1": "/media/MICROBIT1",
+    }
+    assert mm.fleet == {"9900A": "writing", "/media/MICROBIT1": "writing"}
+    mm.set_buttons.assert_called_once_with(flash=False, flash_all=False)
+    editor.show_status_message.assert_called_once_with(
+        "Flashed 0 of 2 micro:bits (0 failed)."
+    )
+
+
+def test_check_fleet():
+    """
+    Ensure micro:bits are only flashed once their drive has disappeared and
+    reappeared, and that the user is told which failed once they're all
+    finished.
+    """
+    view = mock.MagicMock()
+    editor = mock.MagicMock()
+    mm = MicrobitMode(editor, view)
+    mm.set_buttons = mock.MagicMock()
+    mm.flash_timer = mock.MagicMock()
+    mm.fleet_boards = {"a": "a", "b": "b", "c": "c"}
+    mm.fleet = {"a": "writing", "b": "writing", "c": "writing"}
+    mm.fleet_deadlines = {}
+    mm.fleet_errors = {}
+    with mock.patch("time.monotonic", return_value=0):
+        mm.device_written("a")
+        mm.device_written("b")
+    mm.device_flash_failed("c", "Boom")
+    assert mm.fleet_deadlines == {"a": 60, "b": 60}
+    mm.fleet_probed({"b"})
+    assert mm.fleet == {"a": "restarting", "b": "written", "c": "failed"}
+    mm.fleet_probed({"a", "b"})
+    assert mm.fleet["a"] == "done"
+    assert editor.show_status_message.call_args[0][0] == (
+        "Flashed 1 of 3 micro:bits (1 failed)."
+    )
+    assert view.show_message.call_count == 0
+    with mock.patch("mu.modes.microbit.FleetProbe") as mock_probe, mock.patch(
+        "time.monotonic", return_value=61
+    ):
+        mm.check_fleet()
+    # Once they're all finished, there's nothing more to look for.
+    assert mock_probe.call_count == 0
+    assert mm.fleet is None
+    mm.set_buttons.assert_called_once_with(flash=True, flash_all=True)
+    assert view.show_message.call_args[0][0] == (
+        "2 of 3 micro:bits could not be flashed."
+    )
+    assert view.show_message.call_args[0][1] == (
+        "b: The micro:bit didn't restart.\nc: Boom"
+    )
+    # A probe that finishes afterwards is ignored.
+    mm.fleet_probed(set())
+
+
+def test_check_fleet_probes_in_background():
+    """
+    Ensure the drives are looked for by a FleetProbe, and only one at a time
+    while a slow one is still running.
+    """
+    mm = MicrobitMode(mock.MagicMock(), mock.MagicMock())
+    mm.fleet = {"a": "written"}
+    mm.fleet_deadlines = {"a": 60}
+    with mock.patch("mu.modes.microbit.FleetProbe") as mock_probe, mock.patch(
+        "time.monotonic", return_value=1
+    ):
+        mm.check_fleet()
+        probe = mm.fleet_probe
+        assert probe is mock_probe.return_value
+        probe.on_probed.connect.assert_called_once_with(mm.fleet_probed)
+        probe.finished.connect.assert_called_once_with(mm.fleet_probe_finished)
+        probe.start.assert_called_once_with()
+        mm.check_fleet()
+        assert mock_probe.call_count == 1
+        mm.fleet_probe_finished()
+        assert mm.fleet_probe is None
+        mm.check_fleet()
+        assert mock_probe.call_count == 2
+    # Nothing is looked for while every micro:bit is still being written.
+    mm.fleet_probe = None
+    mm.fleet = {"a": "writing"}
+    with mock.patch("mu.modes.microbit.FleetProbe") as mock_probe:
+        mm.check_fleet()
+    assert mock_probe.call_count == 0
+
+
+def test_FleetProbe_run():
+    """
+    Ensure the IDs of the mounted micro:bits are emitted, or their paths if
+    the ID can't be read, and that errors don't escape the thread.
+    """
+    probe = FleetProbe()
+    probe.on_probed = mock.MagicMock()
+    with mock.patch(
+        "mu.modes.microbit.uflash.find_microbits", return_value=["/a", "/b"]
+    ), mock.patch(
+        "mu.modes.microbit.uflash.board_id", side_effect=["9900A", None]
+    ):
+        probe.run()
+    probe.on_probed.emit.assert_called_once_with({"9900A", "/b"})
+    probe.on_probed.reset_mock()
+    with mock.patch(
+        "mu.modes.microbit.uflash.find_microbits", side_effect=OSError("x")
+    ):
+        probe.run()
+    assert probe.on_probed.emit.call_count == 0
+
+
+def test_check_fleet_deadline_per_board():
+    """
+    Each micro:bit has fleet_timeout seconds to restart from when its own hex
+    was written, so one still waiting to be written isn't failed early.
+    """
+    view = mock.MagicMock()
+    editor = mock.MagicMock()
+    mm = MicrobitMode(editor, view)
+    mm.flash_timer = mock.MagicMock()
+    mm.fleet_boards = {"a": "a", "b": "b"}
+    mm.fleet = {"a": "writing", "b": "writing"}
+    mm.fleet_deadlines = {}
+    mm.fleet_errors = {}
+    with mock.patch("time.monotonic", return_value=0):
+        mm.device_written("a")
+    with mock.patch("time.monotonic", return_value=50):
+        mm.device_written("b")
+    with mock.patch("mu.modes.microbit.FleetProbe"), mock.patch(
+        "time.monotonic", return_value=70
+    ):
+        mm.check_fleet()
+    assert mm.fleet == {"a": "failed", "b": "written"}
+
+
+def test_check_fleet_remounted():
+    """
+    If the mount points of restarting micro:bits are swapped, each is still
+    recognised by its ID, so the right one is counted as flashed.
+    """
+    view = mock.MagicMock()
+    editor = mock.MagicMock()
+    mm = MicrobitMode(editor, view)
+    mm.flash_timer = mock.MagicMock()
+    mm.fleet_boards = {"/media/MICROBIT": "9900A", "/media/MICROBIT1": "9901B"}
+    mm.fleet = {"9900A": "writing", "9901B": "writing"}
+    mm.fleet_deadlines = {}
+    mm.fleet_errors = {}
+    mm.device_written("/media/MICROBIT")
+    mm.device_written("/media/MICROBIT1")
+    mm.fleet_probed(set())
+    assert mm.fleet == {"9900A": "restarting", "9901B": "restarting"}
+    # The second micro:bit comes back first, mounted at the first's path.
+    probe = FleetProbe()
+    probe.on_probed = mock.MagicMock()
+    with mock.patch(
+        "mu.modes.microbit.uflash.find_microbits",
+        return_value=["/media/MICROBIT"],
+    ), mock.patch("mu.modes.microbit.uflash.board_id", return_value="9901B"):
+        probe.run()
+    mm.fleet_probed(probe.on_probed.emit.call_args[0][0])
+    assert mm.fleet == {"9900A": "restarting", "9901B": "done"}
+
+
 def test_flash_minify():
     view = mock.MagicMock()
     script = "#" + ("x" * 8193) + "\n"
@@ -1023,6 +1468,8 @@ def test_flash_minify():
             mm.flash()
             m.assert_called_once_with(script)
 
+    # Forget the script was minified, so it's minified again.
+    mm.minified.clear()
     ex = TokenError("Bad", (1, 0))
     with mock.patch("nudatus.mangle", side_effect=ex) as m:
         mm.flash()
@@ -1031,6 +1478,167 @@ def test_flash_minify():
         )
 
 
+def test_minify_cached():
+    """
+    Ensure a script is only minified once, and the cache of minified
+    scripts doesn't grow without limit.
+    """
+    mm = MicrobitMode(mock.MagicMock(), mock.MagicMock())
+    mm.minify_cache_size = 2
+    with mock.patch("nudatus.mangle", return_value="x") as m:
+        assert mm.minify(b"a = 1") == b"x"
+        assert mm.minify(b"a = 1") == b"x"
+        assert m.call_count == 1
+        mm.minify(b"b = 1")
+        mm.minify(b"c = 1")
+    assert list(mm.minified) == [
+        uflash.digest(b"b = 1"),
+        uflash.digest(b"c = 1"),
+    ]
+    ex = TokenError("Bad", (1, 0))
+    with mock.patch("nudatus.mangle", side_effect=ex) as m:
+        with pytest.raises(TokenError):
+            mm.minify(b"d = (")
+        with pytest.raises(TokenError):
+            mm.minify(b"d = (")
+        assert m.call_count == 1
+
+
+def test_Minifier_run():
+    """
+    Ensure the Minifier thread emits the digest of the script along with the
+    result of minifying it.
+    """
+    minifier = Minifier(b"a = 1")
+    minifier.on_minified = mock.MagicMock()
+    with mock.patch("nudatus.mangle", return_value="x"):
+        minifier.run()
+    minifier.on_minified.emit.assert_called_once_with(
+        uflash.digest(b"a = 1"), b"x"
+    )
+    assert minifier.result == b"x"
+
+
+def test_check_script_size():
+    """
+    Ensure the bytes left for a small script are shown straight away.
+    """
+    view = mock.MagicMock()
+    view.current_tab.text = mock.MagicMock(return_value="a = 1")
+    mm = MicrobitMode(mock.MagicMock(), view)
+    with mock.patch("mu.modes.microbit.Minifier") as mock_minifier:
+        mm.check_script_size()
+    assert mock_minifier.call_count == 0
+    view.show_script_size.assert_called_once_with(
+        "{} bytes free".format(uflash._MAX_SIZE - 5)
+    )
+
+
+def test_check_script_size_no_tab():
+    """
+    If there's no tab, ensure no size is shown.
+    """
+    view = mock.MagicMock()
+    view.current_tab = None
+    mm = MicrobitMode(mock.MagicMock(), view)
+    mm.check_script_size()
+    view.hide_script_size.assert_called_once_with()
+
+
+def test_check_script_size_minifies_in_background():
+    """
+    If the script is too big, ensure it's minified in the background, and
+    the bytes left once it's minified are shown when that's done.
+    """
+    view = mock.MagicMock()
+    script = "#" + ("x" * 8193) + "\n"
+    view.current_tab.text = mock.MagicMock(return_value=script)
+    editor = mock.MagicMock()
+    editor.minify = True
+    mm = MicrobitMode(editor, view)
+    mm.minify_timer = mock.MagicMock()
+    with mock.patch("mu.modes.microbit.Minifier") as mock_minifier:
+        mm.check_script_size()
+        mock_minifier.assert_called_once_with(script.encode("utf-8"))
+        mock_minifier().start.assert_called_once_with()
+        mm.minify_thread.finished.connect.assert_called_once_with(
+            mm.on_minify_finished
+        )
+        view.show_script_size.assert_called_once_with("7 bytes too big")
+        # While it's busy, try again later.
+        mm.check_script_size()
+        mm.minify_timer.start.assert_called_once_with()
+        assert mock_minifier.call_count == 2
+        mm.on_minified(uflash.digest(script.encode("utf-8")), b"")
+    # The thread is only let go of once it's stopped.
+    assert mm.minify_thread is mock_minifier.return_value
+    view.show_script_size.assert_called_with(
+        "{} bytes free once minified".format(uflash._MAX_SIZE)
+    )
+    mm.on_minify_finished()
+    assert mm.minify_thread is None
+
+
+def test_minify_waits_for_background():
+    """
+    If the script is already being minified in the background, ensure its
+    result is waited for rather than minifying it again.
+    """
+    mm = MicrobitMode(mock.MagicMock(), mock.MagicMock())
+    mm.minify_thread = mock.MagicMock()
+    mm.minify_thread.key = uflash.digest(b"a = 1")
+    mm.minify_thread.result = b"x"
+    with mock.patch("nudatus.mangle") as m:
+        assert mm.minify(b"a = 1") == b"x"
+    mm.minify_thread.wait.assert_called_once_with()
+    assert m.call_count == 0
+    # A different script isn't waited for.
+    with mock.patch("nudatus.mangle", return_value="y") as m:
+        assert mm.minify(b"b = 1") == b"y"
+    assert mm.minify_thread.wait.call_count == 1
+
+
+def test_activate_deactivate():
+    """
+    Ensure the size of the script is followed only while the mode is active.
+    """
+    view = mock.MagicMock()
+    view.current_tab = None
+    mm = MicrobitMode(mock.MagicMock(), view)
+    mm.activate()
+    timer = mm.minify_timer
+    view.text_changed.connect.assert_called_once_with(timer.start)
+    assert timer.interval() == mm.minify_delay
+    mm.deactivate()
+    view.text_changed.disconnect.assert_called_once_with(timer.start)
+    assert mm.minify_timer is None
+    assert view.hide_script_size.call_count == 2
+
+
+def test_deactivate_without_activate():
+    """
+    Ensure a mode that was never activated (e.g. restored from the session
+    and then changed) can be deactivated.
+    """
+    view = mock.MagicMock()
+    mm = MicrobitMode(mock.MagicMock(), view)
+    mm.deactivate()
+    assert view.text_changed.disconnect.call_count == 0
+    view.hide_script_size.assert_called_once_with()
+
+
+def test_on_minified_inactive():
+    """
+    If the mode is no longer active when a script is minified, ensure the
+    result is cached but the size isn't shown.
+    """
+    view = mock.MagicMock()
+    mm = MicrobitMode(mock.MagicMock(), view)
+    mm.on_minified("key", b"x")
+    assert mm.minified == {"key": b"x"}
+    assert view.show_script_size.call_count == 0
+
+
 def test_flash_minify_no_minify():
     view = mock.MagicMock()
     view.current_tab.label = "foo"
@@ -1100,6 +1708,30 @@ def test_remove_fs():
     assert mm.fs is None
 
 
+def test_remove_fs_stops_file_manager():
+    """
+    Removing the file system ends the file manager's raw REPL session before
+    its thread is quit.
+    """
+    view = mock.MagicMock()
+    editor = mock.MagicMock()
+    mm = MicrobitMode(editor, view)
+    mm.fs = True
+    file_manager = mock.MagicMock()
+    thread = mock.MagicMock()
+    mm.file_manager = file_manager
+    mm.file_manager_thread = thread
+    with mock.patch("mu.modes.microbit.QMetaObject") as mock_meta:
+        mm.remove_fs()
+    mock_meta.invokeMethod.assert_called_once_with(
+        file_manager, "on_stop", Qt.BlockingQueuedConnection
+    )
+    thread.quit.assert_called_once_with()
+    thread.wait.assert_called_once_with()
+    assert mm.file_manager is None
+    assert mm.file_manager_thread is None
+
+
 def test_toggle_files_on():
     """
     If the fs is off, toggle it on.
@@ -1187,7 +1819,9 @@ def test_toggle_repl():
         mm.repl = None
         mm.toggle_repl(None)
         tr.assert_called_once_with(None)
-        mm.set_buttons.assert_called_once_with(flash=False, files=False)
+        mm.set_buttons.assert_called_once_with(
+            flash=False, flash_all=False, files=False
+        )
 
 
 def test_toggle_repl_no_repl_or_plotter():
@@ -1212,7 +1846,9 @@ def test_toggle_repl_no_repl_or_plotter():
         mm.repl = None
         mm.toggle_repl(None)
         tr.assert_called_once_with(None)
-        mm.set_buttons.assert_called_once_with(flash=True, files=True)
+        mm.set_buttons.assert_called_once_with(
+            flash=True, flash_all=True, files=True
+        )
 
 
 def test_toggle_repl_with_fs():
@@ -1250,7 +1886,9 @@ def test_toggle_plotter():
         mm.plotter = None
         mm.toggle_plotter(None)
         tp.assert_called_once_with(None)
-        mm.set_buttons.assert_called_once_with(flash=False, files=False)
+        mm.set_buttons.assert_called_once_with(
+            flash=False, flash_all=False, files=False
+        )
 
 
 def test_toggle_plotter_no_repl_or_plotter():
@@ -1275,7 +1913,9 @@ def test_toggle_plotter_no_repl_or_plotter():
         mm.plotter = None
         mm.toggle_plotter(None)
         tp.assert_called_once_with(None)
-        mm.set_buttons.assert_called_once_with(flash=True, files=True)
+        mm.set_buttons.assert_called_once_with(
+            flash=True, flash_all=True, files=True
+        )
 
 
 def test_toggle_plotter_with_fs():
@@ -456,8 +456,10 @@ def test_python_add_plotter():
     view = mock.MagicMock()
     pm = PythonMode(editor, view)
     pm.set_buttons = mock.MagicMock()
+    pm.start_plotter_capture = mock.MagicMock()
     pm.add_plotter()
     view.add_python3_plotter.assert_called_once_with(pm)
+    pm.start_plotter_capture.assert_called_once_with()
     assert pm.plotter
     pm.set_buttons.assert_called_once_with(debug=False)
     # Check button states are updated depending on other aspects of the mode